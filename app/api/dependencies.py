@@ -3,18 +3,179 @@ API dependencies for dependency injection.
 
 This module defines dependencies that can be injected into API routes.
 """
-from typing import Annotated
+import threading
+from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Header, Query
 
-from app.core.security import verify_token
-from app.services.gate_detector.interfaces import GateDetectorService
-from app.services.gate_detector.detector import OpenCVGateDetectorService
+from app.core.config import settings
+from app.core.security import get_client_id, verify_token
+from app.services.diagnostics.profiler import StackSampler
+from app.services.gate_detector.breaker import CircuitBreakerCameraService
+from app.services.gate_detector.camera import OpenCVCameraService
+from app.services.gate_detector.interfaces import CameraService, GateDetectorService
+from app.services.gate_detector.detector import OpenCVDetectionService, OpenCVGateDetectorService
+from app.services.gate_detector.supervisor import SupervisedCameraService
+from app.services.monitoring.clips import ClipRecorder
+from app.services.monitoring.monitor import GateMonitor, parse_monitored_cameras
+from app.services.recording.camera import RecordingCameraService, ReplayCameraService
+from app.services.recording.ring import FrameRecorder
+from app.services.scheduling.admission import AdmissionController
+from app.services.simulation.camera import SimulatedCameraService
 
 
 # Global variable to hold the service instance for testing
 _gate_detector_service_instance = None
 
+# Shared camera service, created on first use so capture workers outlive requests
+_camera_service_instance = None
+_camera_service_lock = threading.Lock()
+
+# Shared admission controller, so limits apply across all requests
+_admission_controller_instance = None
+
+# Shared profiler, so only one profile runs at a time
+_stack_sampler_instance = None
+
+# Shared gate monitor and its clip recorder, started with the application
+_gate_monitor_instance = None
+_clip_recorder_instance = None
+
+
+def create_capture_service() -> CameraService:
+    """
+    Create the camera service that talks to the cameras.
+
+    Returns:
+        An OpenCVCameraService, a SimulatedCameraService when CAMERA_BACKEND is
+        "simulated", or a ReplayCameraService when it is "replay". Live
+        captures are recorded when RECORDING_DIR is set.
+
+    Raises:
+        ValueError: If CAMERA_BACKEND is not a known backend.
+    """
+    if settings.camera_backend == "replay":
+        return ReplayCameraService()
+    if settings.camera_backend == "opencv":
+        service: CameraService = OpenCVCameraService()
+    elif settings.camera_backend == "simulated":
+        service = SimulatedCameraService.from_settings()
+    else:
+        raise ValueError(f"Unknown camera backend: {settings.camera_backend}")
+    if settings.recording_dir:
+        service = RecordingCameraService(service, FrameRecorder())
+    return service
+
+
+def get_circuit_breaker_service() -> CircuitBreakerCameraService:
+    """
+    Get the shared camera service guarded by per-camera circuit breakers.
+
+    Captures run on supervised worker threads that are shared by all requests.
+
+    Returns:
+        The shared CircuitBreakerCameraService.
+    """
+    # pylint: disable=global-statement
+    global _camera_service_instance
+    with _camera_service_lock:
+        if _camera_service_instance is None:
+            _camera_service_instance = CircuitBreakerCameraService(
+                SupervisedCameraService(create_capture_service())
+            )
+        return _camera_service_instance
+
+
+def get_capture_supervisor() -> SupervisedCameraService:
+    """
+    Get the supervisor of the shared capture workers.
+
+    Returns:
+        The SupervisedCameraService behind the circuit breakers.
+    """
+    return get_circuit_breaker_service().camera_service
+
+
+def get_camera_service() -> CameraService:
+    """
+    Get the shared camera service.
+
+    Returns:
+        An instance of a class implementing the CameraService interface.
+    """
+    return get_circuit_breaker_service()
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Get the shared admission controller for gate checks.
+
+    Returns:
+        The shared AdmissionController.
+    """
+    # pylint: disable=global-statement
+    global _admission_controller_instance
+    with _camera_service_lock:
+        if _admission_controller_instance is None:
+            _admission_controller_instance = AdmissionController()
+        return _admission_controller_instance
+
+
+def get_stack_sampler() -> StackSampler:
+    """
+    Get the shared sampling profiler.
+
+    Returns:
+        The shared StackSampler.
+    """
+    # pylint: disable=global-statement
+    global _stack_sampler_instance
+    with _camera_service_lock:
+        if _stack_sampler_instance is None:
+            _stack_sampler_instance = StackSampler()
+        return _stack_sampler_instance
+
+
+def get_gate_monitor() -> GateMonitor:
+    """
+    Get the shared gate monitor of the cameras in MONITORED_CAMERAS.
+
+    The monitor captures through the shared camera service and queues its
+    checks in the shared admission controller. When CLIP_DIR is set, a clip
+    recorder listens to it.
+
+    Returns:
+        The shared GateMonitor.
+    """
+    # pylint: disable=global-statement
+    global _gate_monitor_instance, _clip_recorder_instance
+    camera_service = get_camera_service()
+    controller = get_admission_controller()
+    with _camera_service_lock:
+        if _gate_monitor_instance is None:
+            monitor = GateMonitor(
+                parse_monitored_cameras(settings.monitored_cameras),
+                camera_service,
+                OpenCVDetectionService(),
+                controller
+            )
+            if settings.clip_dir:
+                _clip_recorder_instance = ClipRecorder()
+                monitor.add_listener(_clip_recorder_instance)
+            _gate_monitor_instance = monitor
+        return _gate_monitor_instance
+
+
+def get_clip_recorder() -> Optional[ClipRecorder]:
+    """
+    Get the clip recorder listening to the shared gate monitor.
+
+    Returns:
+        The ClipRecorder, or None if clips are disabled.
+    """
+    get_gate_monitor()
+    return _clip_recorder_instance
+
 
 def get_gate_detector_service() -> GateDetectorService:
     """
@@ -28,7 +189,24 @@ def get_gate_detector_service() -> GateDetectorService:
     # Check if we have a mock service for testing
     if _gate_detector_service_instance is not None:
         return _gate_detector_service_instance
-    return OpenCVGateDetectorService()
+    return OpenCVGateDetectorService(camera_service=get_camera_service())
+
+
+def get_debug_timing(
+    x_debug_timing: Optional[str] = Header(None),
+    debug_timing: bool = Query(False, description="Attach a stage timing breakdown")
+) -> bool:
+    """
+    Tell whether the caller asked for a stage timing breakdown.
+
+    Args:
+        x_debug_timing: The X-Debug-Timing header, enabled by "1", "true", "yes" or "on".
+        debug_timing: The debug_timing query flag.
+
+    Returns:
+        True if timings should be collected for the request.
+    """
+    return debug_timing or (x_debug_timing or "").strip().lower() in ("1", "true", "yes", "on")
 
 
 def set_gate_detector_service_for_testing(service: GateDetectorService | None) -> None:
@@ -48,4 +226,11 @@ def set_gate_detector_service_for_testing(service: GateDetectorService | None) -
 # Define common dependencies
 # pylint: disable=invalid-name
 authenticated = Annotated[bool, Depends(verify_token)]
+client_id = Annotated[str, Depends(get_client_id)]
 gate_detector = Annotated[GateDetectorService, Depends(get_gate_detector_service)]
+admission = Annotated[AdmissionController, Depends(get_admission_controller)]
+debug_timing = Annotated[bool, Depends(get_debug_timing)]
+circuit_breakers = Annotated[CircuitBreakerCameraService, Depends(get_circuit_breaker_service)]
+capture_supervisor = Annotated[SupervisedCameraService, Depends(get_capture_supervisor)]
+stack_sampler = Annotated[StackSampler, Depends(get_stack_sampler)]
+gate_monitor = Annotated[GateMonitor, Depends(get_gate_monitor)]
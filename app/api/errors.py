@@ -4,12 +4,16 @@ Error handlers for the API.
 This module defines error handlers for various exceptions that can be raised
 during API request processing.
 """
+import math
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 from app.core.exceptions import (
+    AdmissionRejectedError,
     GateDetectorException,
     CameraConnectionError,
+    CircuitOpenError,
     FrameCaptureError,
     GateDetectionError
 )
@@ -54,6 +58,26 @@ async def camera_connection_error_handler(
     )
 
 
+async def circuit_open_error_handler(
+    request: Request, exc: CircuitOpenError
+) -> JSONResponse:
+    """
+    Handle CircuitOpenError.
+
+    Args:
+        request: The request that caused the exception.
+        exc: The exception that was raised.
+
+    Returns:
+        A JSON response with the error details and a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": None, "message": exc.message},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
 async def frame_capture_error_handler(
     request: Request, exc: FrameCaptureError
 ) -> JSONResponse:
@@ -92,6 +116,26 @@ async def gate_detection_error_handler(
     )
 
 
+async def admission_rejected_error_handler(
+    request: Request, exc: AdmissionRejectedError
+) -> JSONResponse:
+    """
+    Handle AdmissionRejectedError.
+
+    Args:
+        request: The request that caused the exception.
+        exc: The exception that was raised.
+
+    Returns:
+        A JSON response with the error details and a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"status": None, "message": exc.message},
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
 def register_exception_handlers(app):
     """
     Register exception handlers with the FastAPI application.
@@ -101,5 +145,7 @@ def register_exception_handlers(app):
     """
     app.add_exception_handler(GateDetectorException, gate_detector_exception_handler)
     app.add_exception_handler(CameraConnectionError, camera_connection_error_handler)
+    app.add_exception_handler(CircuitOpenError, circuit_open_error_handler)
     app.add_exception_handler(FrameCaptureError, frame_capture_error_handler)
     app.add_exception_handler(GateDetectionError, gate_detection_error_handler)
+    app.add_exception_handler(AdmissionRejectedError, admission_rejected_error_handler)
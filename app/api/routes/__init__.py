@@ -3,6 +3,6 @@ API routes package.
 
 This package contains all the API routes for the application.
 """
-from app.api.routes import gate, health
+from app.api.routes import debug, gate, health, metrics
 
-__all__ = ["gate", "health"]
+__all__ = ["debug", "gate", "health", "metrics"]
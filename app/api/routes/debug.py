@@ -0,0 +1,66 @@
+"""
+API routes for debugging endpoints.
+
+This module defines the API routes used to diagnose a running service
+without attaching external tools.
+"""
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies import authenticated, capture_supervisor, stack_sampler
+from app.domain.schemas import CaptureWorkerResponse, ThreadResponse, ThreadsResponse
+from app.services.diagnostics.profiler import thread_dump
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+def profile(
+    _authenticated: authenticated,  # pylint: disable=unused-argument
+    sampler: stack_sampler,
+    seconds: float = Query(5.0, gt=0, description="How long to sample")
+):
+    """
+    Sample the stack of every thread and return collapsed stacks.
+
+    The output is one "thread;outer;...;inner count" line per stack, ready
+    for flamegraph.pl or speedscope. The profile length is capped by
+    PROFILE_MAX_SECONDS and only one profile runs at a time.
+
+    Args:
+        authenticated: Authentication dependency.
+        sampler: Sampling profiler dependency.
+        seconds: How long to sample.
+
+    Returns:
+        A plain text response with the collapsed stacks.
+
+    Raises:
+        HTTPException: 409 if another profile is running.
+    """
+    try:
+        counts = sampler.sample(seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    return PlainTextResponse(sampler.collapse(counts))
+
+
+@router.get("/threads", response_model=ThreadsResponse)
+def threads(
+    _authenticated: authenticated,  # pylint: disable=unused-argument
+    supervisor: capture_supervisor
+):
+    """
+    Show what every thread is executing and the state of the capture workers.
+
+    Args:
+        authenticated: Authentication dependency.
+        supervisor: Capture worker supervisor dependency.
+
+    Returns:
+        A ThreadsResponse with the stack of every thread and every capture worker.
+    """
+    return ThreadsResponse(
+        threads=[ThreadResponse(**thread) for thread in thread_dump()],
+        capture_workers=[CaptureWorkerResponse(**worker) for worker in supervisor.snapshot()]
+    )
@@ -3,20 +3,42 @@ API routes for gate-related endpoints.
 
 This module defines the API routes for gate-related operations.
 """
-from fastapi import APIRouter
+from typing import List
 
-from app.api.dependencies import authenticated, gate_detector
+from fastapi import APIRouter, Response
+
+from app.api.dependencies import (
+    admission,
+    authenticated,
+    circuit_breakers,
+    client_id,
+    debug_timing,
+    gate_detector
+)
+from app.core.config import settings
+from app.core.deadline import deadline_scope
 from app.domain.models import CameraCredentials
-from app.domain.schemas import GateCheckRequest, GateStatusResponse
+from app.domain.schemas import (
+    CheckTimings,
+    CircuitBreakerResponse,
+    GateCheckRequest,
+    GateStatusResponse
+)
+from app.services.gate_detector.instrumentation import StageTimings, collect_timings
+from app.services.scheduling.admission import Priority
 
 router = APIRouter(prefix="/gate", tags=["gate"])
 
 
-@router.post("/check", response_model=GateStatusResponse)
-def check_gate(
+@router.post("/check", response_model=GateStatusResponse, response_model_exclude_unset=True)
+def check_gate(  # pylint: disable=too-many-arguments
     request: GateCheckRequest,
+    response: Response,
     _authenticated: authenticated,  # pylint: disable=unused-argument
-    detector: gate_detector
+    detector: gate_detector,
+    controller: admission,
+    client: client_id,
+    timing: debug_timing
 ):
     """
     Check if the gate is open or closed.
@@ -25,10 +47,23 @@ def check_gate(
     - API authentication (Bearer Token from API_TOKEN environment variable)
     - Camera credentials and IP in the request body
 
+    Checks beyond the concurrency limits wait in a bounded queue shared fairly
+    between clients (X-Client-ID header, or the bearer token). A client over
+    its rate, or a full queue, gets 429 with a Retry-After header. These are
+    interactive checks, served ahead of monitoring and batch work.
+
+    With the X-Debug-Timing header or the debug_timing query flag set, the
+    response carries a Server-Timing header and a timings block with the time
+    spent in each stage of the check.
+
     Args:
         request: The gate check request.
+        response: The response, used to set the Server-Timing header.
         authenticated: Authentication dependency.
         gate_detector: Gate detector service dependency.
+        controller: Admission controller dependency.
+        client: Client identifier dependency.
+        timing: Whether a stage timing breakdown was requested.
 
     Returns:
         A GateStatusResponse with the gate status and a message.
@@ -41,11 +76,40 @@ def check_gate(
         port=request.port if request.port is not None else 554
     )
 
-    # Check gate status
-    result = detector.check_gate_status(credentials)
+    # Check gate status within the check's time budget, once admitted
+    timings = StageTimings() if timing else None
+    with deadline_scope(settings.check_timeout), \
+            controller.admit(credentials.endpoint, client, Priority.INTERACTIVE), \
+            collect_timings(timings):
+        result = detector.check_gate_status(credentials)
 
     # Convert domain model to response model
-    return GateStatusResponse(
-        status=result.status.value if result.status else None,
-        message=result.message
-    )
+    fields = {
+        "status": result.status.value if result.status else None,
+        "message": result.message
+    }
+    if timings is not None:
+        response.headers["Server-Timing"] = timings.server_timing()
+        fields["timings"] = CheckTimings(
+            stages_ms={name: seconds * 1000 for name, seconds in timings.stages.items()},
+            **timings.values
+        )
+    return GateStatusResponse(**fields)
+
+
+@router.get("/breakers", response_model=List[CircuitBreakerResponse])
+def list_breakers(
+    _authenticated: authenticated,  # pylint: disable=unused-argument
+    breakers: circuit_breakers
+):
+    """
+    List the circuit breaker state of every camera seen so far.
+
+    Args:
+        authenticated: Authentication dependency.
+        breakers: Circuit breaker camera service dependency.
+
+    Returns:
+        A list of CircuitBreakerResponse, one per camera endpoint.
+    """
+    return [CircuitBreakerResponse(**state) for state in breakers.states()]
@@ -0,0 +1,25 @@
+"""
+API routes for metrics endpoints.
+
+This module defines the API route that exposes metrics to Prometheus.
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Expose metrics in the Prometheus text format.
+
+    Returns:
+        A plain text response with every registered metric.
+    """
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
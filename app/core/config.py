@@ -49,6 +49,204 @@ class Settings:
         """Get the line threshold from environment."""
         return int(os.environ.get("LINE_THRESHOLD", "10"))
 
+    @property
+    def check_timeout(self):
+        """Get the total time budget of a gate check in seconds from environment."""
+        return float(os.environ.get("CHECK_TIMEOUT", "20"))
+
+    @property
+    def rtsp_open_timeout_ms(self):
+        """Get the RTSP open timeout in milliseconds from environment."""
+        return int(os.environ.get("RTSP_OPEN_TIMEOUT_MS", "5000"))
+
+    @property
+    def rtsp_read_timeout_ms(self):
+        """Get the RTSP read timeout in milliseconds from environment."""
+        return int(os.environ.get("RTSP_READ_TIMEOUT_MS", "5000"))
+
+    @property
+    def rtsp_transport(self):
+        """Get the RTSP transport (tcp or udp) from environment."""
+        return os.environ.get("RTSP_TRANSPORT", "tcp").lower()
+
+    @property
+    def rtsp_buffer_size(self):
+        """Get the capture buffer size in frames from environment."""
+        return int(os.environ.get("RTSP_BUFFER_SIZE", "1"))
+
+    @property
+    def capture_workers(self):
+        """Get the number of supervised capture workers from environment."""
+        return int(os.environ.get("CAPTURE_WORKERS", "4"))
+
+    @property
+    def capture_timeout(self):
+        """Get the capture watchdog budget in seconds from environment."""
+        return float(os.environ.get("CAPTURE_TIMEOUT", "15"))
+
+    @property
+    def max_concurrent_checks(self):
+        """Get the maximum number of gate checks running at once from environment."""
+        return int(os.environ.get("MAX_CONCURRENT_CHECKS", "4"))
+
+    @property
+    def max_queued_checks(self):
+        """Get the maximum number of gate checks waiting to run from environment."""
+        return int(os.environ.get("MAX_QUEUED_CHECKS", "32"))
+
+    @property
+    def camera_max_sessions(self):
+        """Get the maximum concurrent sessions per camera from environment."""
+        return int(os.environ.get("CAMERA_MAX_SESSIONS", "2"))
+
+    @property
+    def queue_timeout(self):
+        """Get the longest time in seconds a check may wait to be admitted."""
+        return float(os.environ.get("QUEUE_TIMEOUT", "10"))
+
+    @property
+    def interactive_reserved_checks(self):
+        """Get the number of check slots reserved for interactive checks."""
+        return int(os.environ.get("INTERACTIVE_RESERVED_CHECKS", "1"))
+
+    @property
+    def client_rate(self):
+        """Get the gate checks per second allowed per client of weight 1."""
+        return float(os.environ.get("CLIENT_RATE", "10"))
+
+    @property
+    def client_burst(self):
+        """Get the burst of gate checks allowed per client of weight 1."""
+        return float(os.environ.get("CLIENT_BURST", "20"))
+
+    @property
+    def client_weights(self):
+        """Get the client weights as "client=weight,..." from environment."""
+        return os.environ.get("CLIENT_WEIGHTS", "")
+
+    @property
+    def breaker_failure_threshold(self):
+        """Get the consecutive failures that open a camera circuit breaker."""
+        return int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "5"))
+
+    @property
+    def breaker_backoff(self):
+        """Get the initial circuit breaker backoff in seconds from environment."""
+        return float(os.environ.get("BREAKER_BACKOFF", "1"))
+
+    @property
+    def breaker_max_backoff(self):
+        """Get the maximum circuit breaker backoff in seconds from environment."""
+        return float(os.environ.get("BREAKER_MAX_BACKOFF", "60"))
+
+    @property
+    def profile_sample_rate(self):
+        """Get the samples per second taken by the debug profiler."""
+        return float(os.environ.get("PROFILE_SAMPLE_RATE", "100"))
+
+    @property
+    def profile_max_seconds(self):
+        """Get the longest profile in seconds the debug profiler takes."""
+        return float(os.environ.get("PROFILE_MAX_SECONDS", "60"))
+
+    @property
+    def camera_backend(self):
+        """Get the camera backend, "opencv", "simulated" or "replay", from environment."""
+        return os.environ.get("CAMERA_BACKEND", "opencv").lower()
+
+    @property
+    def simulated_scenario(self):
+        """Get the scenario played by the simulated camera from environment."""
+        return os.environ.get("SIMULATED_SCENARIO", "steady")
+
+    @property
+    def simulated_resolution(self):
+        """Get the frame resolution of the simulated camera from environment."""
+        return os.environ.get("SIMULATED_RESOLUTION", "480p")
+
+    @property
+    def simulated_seed(self):
+        """Get the seed of the simulated camera from environment, if set."""
+        value = os.environ.get("SIMULATED_SEED")
+        return int(value) if value is not None else None
+
+    @property
+    def recording_dir(self):
+        """Get the directory of the frame rings from environment, empty to disable recording."""
+        return os.environ.get("RECORDING_DIR", "")
+
+    @property
+    def recording_slots(self):
+        """Get the number of frames kept per camera from environment."""
+        return int(os.environ.get("RECORDING_SLOTS", "256"))
+
+    @property
+    def recording_width(self):
+        """Get the width of recorded frames from environment."""
+        return int(os.environ.get("RECORDING_WIDTH", "640"))
+
+    @property
+    def recording_height(self):
+        """Get the height of recorded frames from environment."""
+        return int(os.environ.get("RECORDING_HEIGHT", "360"))
+
+    @property
+    def replay_start(self):
+        """Get the earliest Unix timestamp to replay from environment, if set."""
+        value = os.environ.get("REPLAY_START")
+        return float(value) if value else None
+
+    @property
+    def replay_end(self):
+        """Get the latest Unix timestamp to replay from environment, if set."""
+        value = os.environ.get("REPLAY_END")
+        return float(value) if value else None
+
+    @property
+    def monitored_cameras(self):
+        """Get the cameras to monitor as a JSON list from environment."""
+        return os.environ.get("MONITORED_CAMERAS", "")
+
+    @property
+    def monitor_interval(self):
+        """Get the default seconds between checks of a monitored camera."""
+        return float(os.environ.get("MONITOR_INTERVAL", "1"))
+
+    @property
+    def clip_dir(self):
+        """Get the directory of transition clips from environment, empty to disable clips."""
+        return os.environ.get("CLIP_DIR", "")
+
+    @property
+    def clip_format(self):
+        """Get the clip format, "jpeg" for a JPEG sequence or "mjpeg", from environment."""
+        return os.environ.get("CLIP_FORMAT", "jpeg").lower()
+
+    @property
+    def clip_pre_roll(self):
+        """Get the number of frames kept from before a transition."""
+        return int(os.environ.get("CLIP_PRE_ROLL", "5"))
+
+    @property
+    def clip_post_roll(self):
+        """Get the number of frames kept from after a transition."""
+        return int(os.environ.get("CLIP_POST_ROLL", "5"))
+
+    @property
+    def clip_width(self):
+        """Get the width frames are downscaled to for clips."""
+        return int(os.environ.get("CLIP_WIDTH", "640"))
+
+    @property
+    def clip_encoder_workers(self):
+        """Get the number of background clip encoder threads."""
+        return int(os.environ.get("CLIP_ENCODER_WORKERS", "1"))
+
+    @property
+    def clip_max_pending(self):
+        """Get the number of clips allowed to wait for an encoder before new ones are dropped."""
+        return int(os.environ.get("CLIP_MAX_PENDING", "4"))
+
     def dict(self) -> Dict[str, Any]:
         """Return settings as a dictionary."""
         return {
@@ -58,6 +256,45 @@ class Settings:
             "rtsp_format": self.rtsp_format,
             "debug": self.debug,
             "line_threshold": self.line_threshold,
+            "check_timeout": self.check_timeout,
+            "rtsp_open_timeout_ms": self.rtsp_open_timeout_ms,
+            "rtsp_read_timeout_ms": self.rtsp_read_timeout_ms,
+            "rtsp_transport": self.rtsp_transport,
+            "rtsp_buffer_size": self.rtsp_buffer_size,
+            "capture_workers": self.capture_workers,
+            "capture_timeout": self.capture_timeout,
+            "max_concurrent_checks": self.max_concurrent_checks,
+            "max_queued_checks": self.max_queued_checks,
+            "camera_max_sessions": self.camera_max_sessions,
+            "queue_timeout": self.queue_timeout,
+            "interactive_reserved_checks": self.interactive_reserved_checks,
+            "client_rate": self.client_rate,
+            "client_burst": self.client_burst,
+            "client_weights": self.client_weights,
+            "breaker_failure_threshold": self.breaker_failure_threshold,
+            "breaker_backoff": self.breaker_backoff,
+            "breaker_max_backoff": self.breaker_max_backoff,
+            "profile_sample_rate": self.profile_sample_rate,
+            "profile_max_seconds": self.profile_max_seconds,
+            "camera_backend": self.camera_backend,
+            "simulated_scenario": self.simulated_scenario,
+            "simulated_resolution": self.simulated_resolution,
+            "simulated_seed": self.simulated_seed,
+            "recording_dir": self.recording_dir,
+            "recording_slots": self.recording_slots,
+            "recording_width": self.recording_width,
+            "recording_height": self.recording_height,
+            "replay_start": self.replay_start,
+            "replay_end": self.replay_end,
+            "monitored_cameras": self.monitored_cameras,
+            "monitor_interval": self.monitor_interval,
+            "clip_dir": self.clip_dir,
+            "clip_format": self.clip_format,
+            "clip_pre_roll": self.clip_pre_roll,
+            "clip_post_roll": self.clip_post_roll,
+            "clip_width": self.clip_width,
+            "clip_encoder_workers": self.clip_encoder_workers,
+            "clip_max_pending": self.clip_max_pending,
         }
 
 
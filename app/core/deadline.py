@@ -0,0 +1,59 @@
+"""
+Request deadlines.
+
+This module tracks the deadline of the current request in a context variable
+so that code deep in the call stack, including capture worker threads running
+in a copy of the caller's context, can size its timeouts to the time left.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """
+    Run a block with a deadline.
+
+    A nested scope can only shorten the deadline of the enclosing scope.
+
+    Args:
+        seconds: The time budget of the block in seconds.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        Seconds left, never negative, or None if no deadline is set.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def budget(default: float) -> float:
+    """
+    Clamp a timeout to the time left before the current deadline.
+
+    Args:
+        default: The timeout to use when the deadline is further away or unset.
+
+    Returns:
+        The smaller of the timeout and the time left, in seconds.
+    """
+    left = remaining()
+    return default if left is None else min(default, left)
@@ -4,7 +4,9 @@ Custom exceptions for the application.
 This module defines custom exceptions that can be raised by the application
 and handled appropriately.
 """
-# No imports needed for these exception classes
+from app.core.metrics import Counter
+
+ERRORS = Counter("gate_errors_total", "Application exceptions raised, by type.", ["type"])
 
 
 class GateDetectorException(Exception):
@@ -19,6 +21,7 @@ class GateDetectorException(Exception):
         """
         self.message = message
         super().__init__(self.message)
+        ERRORS.labels(type(self).__name__).inc()
 
 
 class CameraConnectionError(GateDetectorException):
@@ -34,6 +37,34 @@ class CameraConnectionError(GateDetectorException):
         super().__init__(message)
 
 
+class CameraTimeoutError(CameraConnectionError):
+    """Exception raised when the camera does not respond within the time budget."""
+
+    def __init__(self, message: str = "Camera did not respond in time"):
+        """
+        Initialize the exception.
+
+        Args:
+            message: The error message.
+        """
+        super().__init__(message)
+
+
+class CircuitOpenError(CameraConnectionError):
+    """Exception raised when a camera's circuit breaker is rejecting captures."""
+
+    def __init__(self, message: str = "Camera circuit breaker is open", retry_after: float = 0.0):
+        """
+        Initialize the exception.
+
+        Args:
+            message: The error message.
+            retry_after: Seconds until the breaker allows another attempt.
+        """
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
 class FrameCaptureError(GateDetectorException):
     """Exception raised when there is an error capturing a frame from the camera."""
 
@@ -58,3 +89,31 @@ class GateDetectionError(GateDetectorException):
             message: The error message.
         """
         super().__init__(message)
+
+
+class AdmissionRejectedError(GateDetectorException):
+    """Exception raised when a check is rejected because the service is overloaded."""
+
+    def __init__(self, message: str = "Too many gate checks in progress", retry_after: float = 1.0):
+        """
+        Initialize the exception.
+
+        Args:
+            message: The error message.
+            retry_after: Suggested seconds to wait before retrying.
+        """
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+# Export every exception type from the start, so rates work before the first error
+for _exception in (
+    GateDetectorException,
+    CameraConnectionError,
+    CameraTimeoutError,
+    CircuitOpenError,
+    FrameCaptureError,
+    GateDetectionError,
+    AdmissionRejectedError,
+):
+    ERRORS.labels(_exception.__name__)
@@ -0,0 +1,314 @@
+"""
+Lightweight in-process metrics.
+
+This module provides Prometheus-style counters, gauges and histograms that
+are cheap enough to update on the request hot path, and renders them in the
+Prometheus text exposition format.
+"""
+import bisect
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the exposition format."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set for the exposition format."""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Base class for a metric family with optional labels."""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: Optional["Registry"] = None
+    ):
+        """
+        Initialize the metric family and register it.
+
+        Args:
+            name: The metric name.
+            documentation: The help text of the metric.
+            labelnames: The names of the labels of the metric.
+            registry: The registry to add the metric to, defaults to REGISTRY.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def labels(self, *values: str, **labels: str):
+        """
+        Get the child metric for a set of label values.
+
+        Args:
+            *values: Label values in the order of the label names.
+            **labels: Label values by name.
+
+        Returns:
+            The child metric for the label values.
+        """
+        key = tuple(str(value) for value in values) or tuple(
+            str(labels[name]) for name in self.labelnames
+        )
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        """Create an unregistered child holding the samples of one label set."""
+        child = object.__new__(type(self))
+        child._lock = threading.Lock()  # pylint: disable=protected-access
+        child._init_values()  # pylint: disable=protected-access
+        return child
+
+    def _init_values(self) -> None:
+        """Initialize the sample values of the metric."""
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], "_Metric"]]:
+        """Get every label set with its child, or the metric itself if unlabelled."""
+        if not self.labelnames:
+            return [((), self)]
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _samples(self, name: str, labels: str) -> List[str]:
+        """Render the samples of one label set."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """
+        Render the metric family in the exposition format.
+
+        Returns:
+            The HELP, TYPE and sample lines of the metric.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in self._series():
+            lines.extend(child._samples(self.name, _format_labels(self.labelnames, values)))  # pylint: disable=protected-access
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: Optional["Registry"] = None
+    ):
+        """Initialize the counter."""
+        self._init_values()
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _init_values(self) -> None:
+        """Start the counter at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount: The amount to add.
+        """
+        with self._lock:
+            self.value += amount
+
+    def _samples(self, name: str, labels: str) -> List[str]:
+        """Render the counter sample."""
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: Optional["Registry"] = None
+    ):
+        """Initialize the gauge."""
+        self._init_values()
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _init_values(self) -> None:
+        """Start the gauge at zero."""
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value: The new value.
+        """
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment the gauge.
+
+        Args:
+            amount: The amount to add.
+        """
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrement the gauge.
+
+        Args:
+            amount: The amount to subtract.
+        """
+        with self._lock:
+            self.value -= amount
+
+    def _samples(self, name: str, labels: str) -> List[str]:
+        """Render the gauge sample."""
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """A histogram of observed values with cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: Optional["Registry"] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """Initialize the histogram."""
+        self.buckets = tuple(sorted(buckets))
+        self._init_values()
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        """Create a child that shares the bucket boundaries."""
+        child = object.__new__(type(self))
+        child.buckets = self.buckets
+        child._lock = threading.Lock()  # pylint: disable=protected-access
+        child._init_values()  # pylint: disable=protected-access
+        return child
+
+    def _init_values(self) -> None:
+        """Start with empty buckets."""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: The observed value.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def _samples(self, name: str, labels: str) -> List[str]:
+        """Render the bucket, sum and count samples."""
+        prefix = labels[:-1] + "," if labels else "{"
+        lines = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            lines.append(f'{name}_bucket{prefix}le="{_format_value(bound)}"}} {total}')
+        lines.append(f"{name}_sum{labels} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{labels} {total}")
+        return lines
+
+
+class Registry:
+    """Collection of metric families."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        """
+        Register a metric family.
+
+        Args:
+            metric: The metric to register.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Duplicate metric: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> _Metric:
+        """
+        Get a registered metric family by name.
+
+        Args:
+            name: The metric name.
+
+        Returns:
+            The metric family.
+        """
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """
+        Render every metric family in the exposition format.
+
+        Returns:
+            The exposition text.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Create the global registry
+REGISTRY = Registry()
@@ -3,7 +3,10 @@ Security utilities for the application.
 
 This module provides security-related functionality such as authentication.
 """
-from fastapi import Depends, HTTPException, status
+import hashlib
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
@@ -39,3 +42,27 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
             headers={"WWW-Authenticate": "Bearer"},
         )
     return True
+
+
+def get_client_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    x_client_id: Optional[str] = Header(None, description="Identifier of the calling client system")
+) -> str:
+    """
+    Identify the API client making the request.
+
+    The X-Client-ID header is used when present. Otherwise the client is
+    identified by a digest of its bearer token, so the token itself never
+    ends up in scheduler state or metrics.
+
+    Args:
+        credentials: The HTTP authorization credentials.
+        x_client_id: The value of the X-Client-ID header, if any.
+
+    Returns:
+        The client identifier.
+    """
+    if x_client_id:
+        return x_client_id.strip()[:64]
+    digest = hashlib.sha256(credentials.credentials.encode("utf-8")).hexdigest()
+    return f"token-{digest[:12]}"
@@ -23,6 +23,11 @@ class CameraCredentials:
     ip_address: str
     port: int = 554
 
+    @property
+    def endpoint(self) -> str:
+        """The camera endpoint as "host:port", without credentials."""
+        return f"{self.ip_address}:{self.port}"
+
     def get_rtsp_uri(self, format_string: str) -> str:
         """
         Constructs an RTSP URI from the credentials using the provided format string.
@@ -41,6 +46,14 @@ class CameraCredentials:
         )
 
 
+@dataclass
+class MonitoredCamera:
+    """A camera whose gate is checked continuously in the background."""
+    camera_id: str
+    credentials: CameraCredentials
+    interval: float = 1.0
+
+
 @dataclass
 class GateStatusResult:
     """Result of a gate status check."""
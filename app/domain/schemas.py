@@ -4,7 +4,7 @@ Pydantic schemas for the gate detector application.
 These schemas define the structure of data for API requests and responses.
 """
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -34,10 +34,21 @@ class GateCheckRequest(BaseModel):
     }
 
 
+class CheckTimings(BaseModel):
+    """Debug breakdown of where a gate check spent its time."""
+    stages_ms: Dict[str, float] = Field(..., description="Milliseconds spent in each stage")
+    frame_width: Optional[int] = Field(None, description="Width of the captured frame")
+    frame_height: Optional[int] = Field(None, description="Height of the captured frame")
+    vertical_lines: Optional[int] = Field(None, description="Vertical lines found in the frame")
+
+
 class GateStatusResponse(BaseModel):
     """Response model for gate status."""
     status: Optional[str] = Field(None, description="Gate status (Open, Closed, or null if error)")
     message: str = Field(..., description="Status message or error description")
+    timings: Optional[CheckTimings] = Field(
+        None, description="Stage timings, only present when debug timing is requested"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -49,6 +60,50 @@ class GateStatusResponse(BaseModel):
     }
 
 
+class CircuitBreakerResponse(BaseModel):
+    """Response model for the state of a camera circuit breaker."""
+    endpoint: str = Field(..., description="Camera endpoint as host:port")
+    state: str = Field(..., description="Breaker state (closed, open or half_open)")
+    consecutive_failures: int = Field(..., description="Consecutive failed captures")
+    retry_in: float = Field(..., description="Seconds until the next probe is allowed")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "endpoint": "192.168.1.100:554",
+                "state": "open",
+                "consecutive_failures": 5,
+                "retry_in": 3.5
+            }
+        }
+    }
+
+
+class ThreadResponse(BaseModel):
+    """Response model for the current stack of a thread."""
+    name: str = Field(..., description="Thread name")
+    ident: int = Field(..., description="Thread identifier")
+    daemon: bool = Field(..., description="Whether the thread is a daemon thread")
+    current: str = Field(..., description="Line the thread is executing or blocked on")
+    stack: List[str] = Field(..., description="Stack of the thread, innermost frame last")
+
+
+class CaptureWorkerResponse(BaseModel):
+    """Response model for the state of a capture worker."""
+    name: str = Field(..., description="Worker thread name")
+    state: str = Field(..., description="Worker state (idle, busy or stuck)")
+    heartbeat_age: float = Field(..., description="Seconds since the worker last reported")
+    busy_for: float = Field(..., description="Seconds the current capture has been running")
+
+
+class ThreadsResponse(BaseModel):
+    """Response model for the thread snapshot."""
+    threads: List[ThreadResponse] = Field(..., description="Every thread of the process")
+    capture_workers: List[CaptureWorkerResponse] = Field(
+        ..., description="Supervised capture workers"
+    )
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str = Field(..., description="Health status of the service")
@@ -3,15 +3,38 @@ Main application module.
 
 This module initializes and configures the FastAPI application.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.dependencies import get_clip_recorder, get_gate_monitor
 from app.api.errors import register_exception_handlers
-from app.api.routes import gate, health
+from app.api.routes import debug, gate, health, metrics
 from app.core.config import settings
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Run the background gate monitor while the application is up.
+
+    Args:
+        _app: The application.
+    """
+    monitor = get_gate_monitor()
+    monitor.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(monitor.stop, settings.check_timeout)
+        clip_recorder = get_clip_recorder()
+        if clip_recorder is not None:
+            await asyncio.to_thread(clip_recorder.shutdown)
+
+
 def create_application() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -26,7 +49,8 @@ def create_application() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
-        debug=settings.debug
+        debug=settings.debug,
+        lifespan=lifespan
     )
 
     # Add CORS middleware
@@ -44,6 +68,8 @@ def create_application() -> FastAPI:
     # Include routers
     fastapi_app.include_router(gate.router)
     fastapi_app.include_router(health.router)
+    fastapi_app.include_router(metrics.router)
+    fastapi_app.include_router(debug.router)
 
     return fastapi_app
 
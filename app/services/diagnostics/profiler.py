@@ -0,0 +1,140 @@
+"""
+In-process sampling profiler.
+
+This module samples the stack of every Python thread through
+sys._current_frames, so hot paths and stuck OpenCV calls can be found in
+pods where no external profiler can be attached.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter as Tally
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Describe a frame by its function and the file and line it starts at."""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack(frame: Optional[FrameType]) -> List[FrameType]:
+    """Get the frames of a stack, outermost first."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _thread_names() -> Dict[int, str]:
+    """Map the identifier of every live thread to its name."""
+    return {thread.ident: thread.name for thread in threading.enumerate() if thread.ident}
+
+
+class StackSampler:
+    """
+    Sampling profiler over every thread of the process.
+
+    Only one profile runs at a time, since each one adds load to the process
+    it is meant to observe.
+    """
+
+    def __init__(self, rate: Optional[float] = None, max_seconds: Optional[float] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            rate: Samples per second, defaults to PROFILE_SAMPLE_RATE.
+            max_seconds: Longest allowed profile, defaults to PROFILE_MAX_SECONDS.
+        """
+        self.rate = rate if rate is not None else settings.profile_sample_rate
+        self.max_seconds = max_seconds if max_seconds is not None else settings.profile_max_seconds
+        self._running = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        """Whether a profile is being taken."""
+        return self._running.locked()
+
+    def sample(self, seconds: float) -> Dict[str, int]:
+        """
+        Sample every other thread's stack for a while.
+
+        Args:
+            seconds: How long to sample, capped at the maximum profile length.
+
+        Returns:
+            The number of samples of each collapsed stack.
+
+        Raises:
+            RuntimeError: If another profile is already running.
+        """
+        if not self._running.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            counts: Tally = Tally()
+            interval = 1.0 / self.rate
+            own = threading.get_ident()
+            end = time.monotonic() + min(max(seconds, 0.0), self.max_seconds)
+            while True:
+                names = _thread_names()
+                for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+                    if ident == own:
+                        continue
+                    labels = [names.get(ident, f"thread-{ident}")]
+                    labels.extend(_frame_label(stack_frame) for stack_frame in _stack(frame))
+                    counts[";".join(labels)] += 1
+                left = end - time.monotonic()
+                if left <= 0:
+                    break
+                time.sleep(min(interval, left))
+            return dict(counts)
+        finally:
+            self._running.release()
+
+    @staticmethod
+    def collapse(counts: Dict[str, int]) -> str:
+        """
+        Render sampled stacks in the collapsed format read by flamegraph tools.
+
+        Args:
+            counts: The number of samples of each stack.
+
+        Returns:
+            One "root;...;leaf count" line per stack, most sampled first.
+        """
+        lines = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return "".join(f"{stack} {count}\n" for stack, count in lines)
+
+
+def thread_dump() -> List[Dict[str, Any]]:
+    """
+    Describe what every thread is currently executing.
+
+    Returns:
+        One entry per thread with its name, identifier, daemon flag, the line
+        it is blocked on and its stack, innermost frame last.
+    """
+    threads = {thread.ident: thread for thread in threading.enumerate() if thread.ident}
+    frames = sys._current_frames()  # pylint: disable=protected-access
+    dump = []
+    for ident, frame in frames.items():
+        thread = threads.get(ident)
+        stack = [
+            f"{stack_frame.f_code.co_filename}:{stack_frame.f_lineno} in {stack_frame.f_code.co_name}"
+            for stack_frame in _stack(frame)
+        ]
+        dump.append({
+            "name": thread.name if thread else f"thread-{ident}",
+            "ident": ident,
+            "daemon": thread.daemon if thread else False,
+            "current": stack[-1] if stack else "",
+            "stack": stack,
+        })
+    return sorted(dump, key=lambda entry: entry["name"])
@@ -0,0 +1,230 @@
+"""
+Circuit breakers for camera endpoints.
+
+This module keeps one circuit breaker per camera endpoint so that a camera
+which keeps failing is rejected immediately instead of holding up a worker
+for the full connect timeout on every request.
+"""
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError
+from app.domain.models import CameraCredentials
+from app.services.gate_detector.interfaces import CameraService
+
+
+class BreakerState(str, Enum):
+    """Enumeration of circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def camera_endpoint(rtsp_uri: str) -> str:
+    """
+    Get the endpoint of a camera from its RTSP URI, without credentials.
+
+    Args:
+        rtsp_uri: The RTSP URI.
+
+    Returns:
+        The endpoint as "host:port".
+    """
+    parts = urlsplit(rtsp_uri)
+    host = parts.hostname or parts.netloc.rpartition("@")[2] or rtsp_uri
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    return f"{host}:{port or 554}"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single camera endpoint.
+
+    The breaker opens after a run of consecutive failures. While open every
+    call is rejected until the backoff expires, then a single half-open probe
+    is let through. A failed probe reopens the breaker with twice the backoff,
+    up to the maximum; a successful probe closes it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        backoff: float,
+        max_backoff: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            backoff: Seconds to wait before the first half-open probe.
+            max_backoff: Upper bound for the probe backoff in seconds.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._clock = clock
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or a probe is already running.
+        """
+        with self._lock:
+            if self.state == BreakerState.CLOSED:
+                return
+            retry_after = self._retry_at - self._clock()
+            if self.state == BreakerState.OPEN and retry_after <= 0:
+                self.state = BreakerState.HALF_OPEN
+                return
+            raise CircuitOpenError(
+                "Camera is unavailable, circuit breaker is open",
+                retry_after=max(retry_after, 0.0)
+            )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.state = BreakerState.CLOSED
+            self.failures = 0
+            self.trips = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker if needed."""
+        with self._lock:
+            self.failures += 1
+            if self.state == BreakerState.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.trips += 1
+                delay = min(self.backoff * 2 ** (self.trips - 1), self.max_backoff)
+                self._retry_at = self._clock() + delay
+                self.state = BreakerState.OPEN
+
+    def retry_in(self) -> float:
+        """
+        Get the time left before the next probe is allowed.
+
+        Returns:
+            Seconds until the next probe, or 0 if calls are allowed.
+        """
+        if self.state != BreakerState.OPEN:
+            return 0.0
+        return max(self._retry_at - self._clock(), 0.0)
+
+
+class CircuitBreakerCameraService(CameraService):
+    """Camera service that guards every camera endpoint with a circuit breaker."""
+
+    def __init__(
+        self,
+        camera_service: CameraService,
+        failure_threshold: Optional[int] = None,
+        backoff: Optional[float] = None,
+        max_backoff: Optional[float] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            camera_service: The camera service that performs the actual capture.
+            failure_threshold: Failures that open a breaker, defaults to BREAKER_FAILURE_THRESHOLD.
+            backoff: Initial backoff in seconds, defaults to BREAKER_BACKOFF.
+            max_backoff: Maximum backoff in seconds, defaults to BREAKER_MAX_BACKOFF.
+        """
+        self.camera_service = camera_service
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None
+            else settings.breaker_failure_threshold
+        )
+        self.backoff = backoff if backoff is not None else settings.breaker_backoff
+        self.max_backoff = max_backoff if max_backoff is not None else settings.breaker_max_backoff
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
+        """
+        Get the RTSP URI for the camera.
+
+        Args:
+            credentials: The camera credentials.
+
+        Returns:
+            The RTSP URI.
+        """
+        return self.camera_service.get_rtsp_uri(credentials)
+
+    def capture_frame(self, rtsp_uri: str) -> Any:
+        """
+        Capture a frame unless the camera's breaker is open.
+
+        Args:
+            rtsp_uri: The RTSP URI.
+
+        Returns:
+            The captured frame.
+
+        Raises:
+            CircuitOpenError: If the camera's breaker is open.
+            CameraConnectionError: If the camera connection fails.
+            FrameCaptureError: If frame capture fails.
+        """
+        breaker = self.breaker(camera_endpoint(rtsp_uri))
+        breaker.before_call()
+        try:
+            frame = self.camera_service.capture_frame(rtsp_uri)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return frame
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the breaker for an endpoint, creating it if needed.
+
+        Args:
+            endpoint: The camera endpoint as "host:port".
+
+        Returns:
+            The endpoint's circuit breaker.
+        """
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(
+                    self.failure_threshold, self.backoff, self.max_backoff
+                )
+            return self._breakers[endpoint]
+
+    def states(self) -> List[Dict[str, Any]]:
+        """
+        Describe every known breaker.
+
+        Returns:
+            One entry per endpoint with its state, failures and retry delay.
+        """
+        with self._lock:
+            breakers = sorted(self._breakers.items())
+        return [
+            {
+                "endpoint": endpoint,
+                "state": breaker.state.value,
+                "consecutive_failures": breaker.failures,
+                "retry_in": breaker.retry_in(),
+            }
+            for endpoint, breaker in breakers
+        ]
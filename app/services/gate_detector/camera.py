@@ -4,18 +4,49 @@ Camera service implementation.
 This module provides functionality for interacting with IP cameras via RTSP.
 """
 # pylint: disable=no-member
+import os
+import time
+
 import cv2
 import numpy as np
 
 from app.core.config import settings
-from app.core.exceptions import CameraConnectionError, FrameCaptureError
+from app.core.deadline import budget
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError, FrameCaptureError
+from app.core.metrics import Counter
 from app.domain.models import CameraCredentials
+from app.services.gate_detector.instrumentation import stage
 from app.services.gate_detector.interfaces import CameraService
 
+CAPTURE_ATTEMPTS = Counter(
+    "gate_camera_capture_attempts_total",
+    "Camera capture attempts by outcome.",
+    ["outcome"]
+)
+
+# A failed open or read that used up this share of its timeout counts as timed out
+TIMEOUT_RATIO = 0.9
+
+
+def _milliseconds(seconds: float) -> int:
+    """Convert a timeout to whole milliseconds, never less than one."""
+    return max(int(seconds * 1000), 1)
+
 
 class OpenCVCameraService(CameraService):
     """Camera service implementation using OpenCV."""
 
+    def __init__(self):
+        """
+        Initialize the service.
+
+        FFmpeg capture options are process-wide, so the RTSP transport is set
+        once here unless OPENCV_FFMPEG_CAPTURE_OPTIONS is already set.
+        """
+        os.environ.setdefault(
+            "OPENCV_FFMPEG_CAPTURE_OPTIONS", f"rtsp_transport;{settings.rtsp_transport}"
+        )
+
     def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
         """
         Get the RTSP URI for the camera.
@@ -32,6 +63,9 @@ class OpenCVCameraService(CameraService):
         """
         Capture a frame from the camera.
 
+        The open and read timeouts are the configured ones, shortened to the
+        time left before the request deadline.
+
         Args:
             rtsp_uri: The RTSP URI.
 
@@ -39,19 +73,45 @@ class OpenCVCameraService(CameraService):
             The captured frame.
 
         Raises:
+            CameraTimeoutError: If opening or reading the stream timed out.
             CameraConnectionError: If the camera connection fails.
             FrameCaptureError: If frame capture fails.
         """
-        cap = cv2.VideoCapture(rtsp_uri)
+        open_timeout = budget(settings.rtsp_open_timeout_ms / 1000)
+        read_timeout = budget(settings.rtsp_read_timeout_ms / 1000)
+        if open_timeout <= 0:
+            CAPTURE_ATTEMPTS.labels("timeout").inc()
+            raise CameraTimeoutError("No time left to open RTSP stream")
+
+        started = time.monotonic()
+        with stage("open"):
+            cap = cv2.VideoCapture(rtsp_uri, cv2.CAP_FFMPEG, [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, _milliseconds(open_timeout),
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC, _milliseconds(read_timeout),
+            ])
 
         if not cap.isOpened():
             cap.release()
+            if time.monotonic() - started >= open_timeout * TIMEOUT_RATIO:
+                CAPTURE_ATTEMPTS.labels("timeout").inc()
+                raise CameraTimeoutError("Timed out opening RTSP stream")
+            CAPTURE_ATTEMPTS.labels("connection_error").inc()
             raise CameraConnectionError("Could not open RTSP stream")
 
-        ret, snapshot = cap.read()
+        # Keep as few frames queued as possible so the snapshot is current
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, settings.rtsp_buffer_size)
+
+        read_started = time.monotonic()
+        with stage("read"):
+            ret, snapshot = cap.read()
         cap.release()
 
         if not ret:
+            if time.monotonic() - read_started >= read_timeout * TIMEOUT_RATIO:
+                CAPTURE_ATTEMPTS.labels("timeout").inc()
+                raise CameraTimeoutError("Timed out reading from RTSP stream")
+            CAPTURE_ATTEMPTS.labels("capture_error").inc()
             raise FrameCaptureError("Could not read snapshot from RTSP stream")
 
+        CAPTURE_ATTEMPTS.labels("ok").inc()
         return snapshot
@@ -3,13 +3,20 @@ Gate detector service implementation.
 
 This module provides functionality for detecting gate status using computer vision.
 """
+from typing import Optional
+
 import cv2  # pylint: disable=no-member
 import numpy as np
 
 from app.core.config import settings
-from app.core.exceptions import GateDetectionError
+from app.core.exceptions import CircuitOpenError, GateDetectionError
 from app.domain.models import CameraCredentials, GateStatus, GateStatusResult
-from app.services.gate_detector.interfaces import GateDetectorService, DetectionService
+from app.services.gate_detector.instrumentation import camera_scope, record, stage
+from app.services.gate_detector.interfaces import (
+    CameraService,
+    DetectionService,
+    GateDetectorService
+)
 from app.services.gate_detector.camera import OpenCVCameraService
 
 
@@ -22,7 +29,7 @@ class OpenCVDetectionService(DetectionService):
         Detect the status of a gate in a frame using the Hough Line Transform.
 
         Args:
-            frame: The frame to analyze.
+            frame: The frame to analyze, BGR or grayscale.
 
         Returns:
             The detected gate status.
@@ -32,10 +39,15 @@ class OpenCVDetectionService(DetectionService):
         """
         # pylint: disable=no-member
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-
-            lines = cv2.HoughLines(edges, 1, np.pi / 180, 200)
+            record("frame_width", frame.shape[1])
+            record("frame_height", frame.shape[0])
+            with stage("cvt_color"):
+                # Replayed frames are already grayscale
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            with stage("canny"):
+                edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+            with stage("hough"):
+                lines = cv2.HoughLines(edges, 1, np.pi / 180, 200)
 
             num_vertical_lines = 0
             if lines is not None:
@@ -46,6 +58,7 @@ class OpenCVDetectionService(DetectionService):
                     # Filter for vertical lines (theta is close to 0 or pi)
                     if np.abs(theta) < np.pi / 180 * 10 or np.abs(theta - np.pi) < np.pi / 180 * 10:
                         num_vertical_lines += 1
+            record("vertical_lines", num_vertical_lines)
 
             # Define a threshold for the number of vertical lines
             line_threshold = settings.line_threshold
@@ -62,10 +75,20 @@ class OpenCVDetectionService(DetectionService):
 class OpenCVGateDetectorService(GateDetectorService):
     """Gate detector service implementation using OpenCV."""
 
-    def __init__(self):
-        """Initialize the service with its dependencies."""
-        self.camera_service = OpenCVCameraService()
-        self.detection_service = OpenCVDetectionService()
+    def __init__(
+        self,
+        camera_service: Optional[CameraService] = None,
+        detection_service: Optional[DetectionService] = None
+    ):
+        """
+        Initialize the service with its dependencies.
+
+        Args:
+            camera_service: The camera service to use, defaults to OpenCVCameraService.
+            detection_service: The detection service to use, defaults to OpenCVDetectionService.
+        """
+        self.camera_service = camera_service or OpenCVCameraService()
+        self.detection_service = detection_service or OpenCVDetectionService()
 
     def check_gate_status(self, credentials: CameraCredentials) -> GateStatusResult:
         """
@@ -76,13 +99,20 @@ class OpenCVGateDetectorService(GateDetectorService):
 
         Returns:
             A GateStatusResult containing the gate status and a message.
+
+        Raises:
+            CircuitOpenError: If the camera's circuit breaker is open.
         """
         try:
-            rtsp_uri = self.camera_service.get_rtsp_uri(credentials)
-            frame = self.camera_service.capture_frame(rtsp_uri)
-            status = self.detection_service.detect_gate_status(frame)
+            with camera_scope(credentials.endpoint):
+                with stage("uri"):
+                    rtsp_uri = self.camera_service.get_rtsp_uri(credentials)
+                frame = self.camera_service.capture_frame(rtsp_uri)
+                status = self.detection_service.detect_gate_status(frame)
 
             return GateStatusResult.success(status)
 
+        except CircuitOpenError:
+            raise
         except Exception as e:  # pylint: disable=broad-exception-caught
             return GateStatusResult.error(str(e))
@@ -0,0 +1,170 @@
+"""
+Per-stage instrumentation of gate checks.
+
+This module times the stages of a gate check (RTSP open, first read, colour
+conversion, edge detection and line detection) per camera, and tracks how
+many of each stage are in progress. Timing a stage costs two clock reads and
+two lock-protected increments, which is negligible next to the OpenCV calls.
+
+A single check can also collect its own breakdown of stage timings and frame
+details for debugging. Collection is off unless a StageTimings is installed
+with collect_timings, in which case the only extra cost per stage is one
+context variable lookup.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
+
+from app.core.metrics import Gauge, Histogram
+
+STAGE_SECONDS = Histogram(
+    "gate_stage_duration_seconds",
+    "Time spent in each stage of a gate check.",
+    ["stage", "camera"]
+)
+STAGE_IN_FLIGHT = Gauge(
+    "gate_stage_in_flight",
+    "Gate check stages currently in progress.",
+    ["stage"]
+)
+
+# Camera label used when a stage runs outside of camera_scope
+UNKNOWN_CAMERA = "unknown"
+
+_camera: contextvars.ContextVar[str] = contextvars.ContextVar("camera", default=UNKNOWN_CAMERA)
+
+
+class StageTimings:
+    """Stage durations and frame details collected for a single check."""
+
+    __slots__ = ("stages", "values")
+
+    def __init__(self):
+        """Initialize an empty breakdown."""
+        self.stages: Dict[str, float] = {}
+        self.values: Dict[str, Union[int, float]] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Add time spent in a stage.
+
+        Args:
+            name: The stage name.
+            seconds: The time spent.
+        """
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """
+        Render the breakdown as a Server-Timing header value.
+
+        Returns:
+            One metric per stage with its duration in milliseconds, followed by
+            the frame details as descriptions.
+        """
+        entries = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages.items()]
+        entries.extend(f'{name};desc="{value}"' for name, value in self.values.items())
+        return ", ".join(entries)
+
+
+_timings: contextvars.ContextVar[Optional[StageTimings]] = contextvars.ContextVar(
+    "timings", default=None
+)
+
+
+@contextmanager
+def camera_scope(camera: str) -> Iterator[None]:
+    """
+    Label the stages timed within the block with a camera.
+
+    The label lives in a context variable, so it follows the check onto
+    capture worker threads that run in a copy of the caller's context.
+
+    Args:
+        camera: The camera endpoint.
+    """
+    token = _camera.set(camera)
+    try:
+        yield
+    finally:
+        _camera.reset(token)
+
+
+@contextmanager
+def collect_timings(timings: Optional[StageTimings]) -> Iterator[None]:
+    """
+    Collect the stage timings of the block into a breakdown.
+
+    Args:
+        timings: The breakdown to fill, or None to leave collection off.
+    """
+    if timings is None:
+        yield
+        return
+    token = _timings.set(timings)
+    try:
+        yield
+    finally:
+        _timings.reset(token)
+
+
+def record(name: str, value: Union[int, float]) -> None:
+    """
+    Record a detail of the current check if its timings are being collected.
+
+    Args:
+        name: The detail name.
+        value: The detail value.
+    """
+    timings = _timings.get()
+    if timings is not None:
+        timings.values[name] = value
+
+
+def current_camera() -> str:
+    """
+    Get the camera the current check talks to.
+
+    Returns:
+        The camera endpoint, or "unknown" outside of camera_scope.
+    """
+    return _camera.get()
+
+
+class stage:  # pylint: disable=invalid-name
+    """
+    Context manager timing one stage of a gate check.
+
+    Example:
+        with stage("canny"):
+            edges = cv2.Canny(gray, 50, 150)
+    """
+
+    __slots__ = ("name", "_in_flight", "_started")
+
+    def __init__(self, name: str):
+        """
+        Initialize the timer.
+
+        Args:
+            name: The stage name.
+        """
+        self.name = name
+        self._in_flight = STAGE_IN_FLIGHT.labels(name)
+        self._started = 0.0
+
+    def __enter__(self) -> "stage":
+        """Start timing the stage."""
+        self._in_flight.inc()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Record the stage duration, whether or not it raised."""
+        elapsed = time.perf_counter() - self._started
+        self._in_flight.dec()
+        STAGE_SECONDS.labels(self.name, _camera.get()).observe(elapsed)
+        timings = _timings.get()
+        if timings is not None:
+            timings.add(self.name, elapsed)
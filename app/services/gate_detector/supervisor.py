@@ -0,0 +1,224 @@
+"""
+Supervised capture workers.
+
+This module runs camera captures on a pool of supervised worker threads so a
+hung RTSP stream can never block the caller for longer than its capture budget.
+"""
+import contextvars
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.deadline import budget
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError
+from app.domain.models import CameraCredentials
+from app.services.gate_detector.camera import CAPTURE_ATTEMPTS
+from app.services.gate_detector.interfaces import CameraService
+
+
+class CaptureWorker:
+    """A capture thread that runs one job at a time and reports a heartbeat."""
+
+    def __init__(self, name: str):
+        """
+        Start the worker thread.
+
+        Args:
+            name: The name of the worker thread.
+        """
+        self.name = name
+        self.heartbeat = time.monotonic()
+        self.busy_since: Optional[float] = None
+        self.retired = False
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker thread is still running."""
+        return self._thread.is_alive()
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """
+        Hand a job to the worker.
+
+        Args:
+            func: The callable to run on the worker thread.
+            *args: Positional arguments for the callable.
+
+        Returns:
+            A future resolved with the result of the job.
+        """
+        future: Future = Future()
+        self._jobs.put((future, func, args))
+        return future
+
+    def retire(self) -> None:
+        """Ask the worker to exit once its current job, if any, returns."""
+        self.retired = True
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        """Process jobs until the worker is retired."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, func, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            self.busy_since = self.heartbeat = time.monotonic()
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+            finally:
+                self.busy_since = None
+                self.heartbeat = time.monotonic()
+
+
+class SupervisedCameraService(CameraService):
+    """
+    Camera service that captures frames on supervised worker threads.
+
+    Every capture runs under a watchdog whose budget is the capture timeout,
+    shortened to the time left before the request deadline. When a capture
+    exceeds its budget the caller gets a CameraTimeoutError straight away, the
+    stuck worker is retired and a fresh worker takes its place. A blocked
+    OpenCV call cannot be interrupted from Python, so the retired thread is
+    abandoned and exits on its own once the call returns.
+    """
+
+    def __init__(
+        self,
+        camera_service: CameraService,
+        workers: Optional[int] = None,
+        capture_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            camera_service: The camera service that performs the actual capture.
+            workers: Number of capture workers, defaults to CAPTURE_WORKERS.
+            capture_timeout: Watchdog budget in seconds, defaults to CAPTURE_TIMEOUT.
+        """
+        self.camera_service = camera_service
+        self.workers = workers if workers is not None else settings.capture_workers
+        self.capture_timeout = (
+            capture_timeout if capture_timeout is not None else settings.capture_timeout
+        )
+        self.respawned = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._names = itertools.count(1)
+        self._idle: List[CaptureWorker] = []
+        self._busy: List[CaptureWorker] = []
+        self._stuck: List[CaptureWorker] = []
+
+    def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
+        """
+        Get the RTSP URI for the camera.
+
+        Args:
+            credentials: The camera credentials.
+
+        Returns:
+            The RTSP URI.
+        """
+        return self.camera_service.get_rtsp_uri(credentials)
+
+    def capture_frame(self, rtsp_uri: str) -> Any:
+        """
+        Capture a frame on a supervised worker.
+
+        Args:
+            rtsp_uri: The RTSP URI.
+
+        Returns:
+            The captured frame.
+
+        Raises:
+            CameraTimeoutError: If the capture exceeds its budget.
+            CameraConnectionError: If the camera connection fails or no worker
+                is available.
+            FrameCaptureError: If frame capture fails.
+        """
+        timeout = budget(self.capture_timeout)
+        if timeout <= 0:
+            raise CameraTimeoutError("No time left to capture a frame")
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            raise CameraConnectionError("No capture worker available")
+
+        worker = self._checkout()
+        # Run in a copy of the caller's context so the worker sees the request deadline
+        context = contextvars.copy_context()
+        future = worker.submit(context.run, self.camera_service.capture_frame, rtsp_uri)
+        try:
+            frame = future.result(timeout=max(timeout - (time.monotonic() - started), 0))
+        except FutureTimeoutError as e:
+            self._respawn(worker)
+            CAPTURE_ATTEMPTS.labels("watchdog_timeout").inc()
+            raise CameraTimeoutError(f"Camera capture timed out after {timeout:g}s") from e
+        except BaseException:
+            self._checkin(worker)
+            raise
+        self._checkin(worker)
+        return frame
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Describe the state of every capture worker.
+
+        Returns:
+            One entry per worker with its name, state and heartbeat age.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._stuck = [worker for worker in self._stuck if worker.alive]
+            groups = (("idle", self._idle), ("busy", self._busy), ("stuck", self._stuck))
+            return [
+                {
+                    "name": worker.name,
+                    "state": state,
+                    "heartbeat_age": now - worker.heartbeat,
+                    "busy_for": now - worker.busy_since if worker.busy_since else 0.0,
+                }
+                for state, workers in groups
+                for worker in workers
+            ]
+
+    def _checkout(self) -> CaptureWorker:
+        """Take an idle worker, starting a new one if none is idle."""
+        with self._lock:
+            worker = self._idle.pop() if self._idle else self._spawn()
+            self._busy.append(worker)
+            return worker
+
+    def _checkin(self, worker: CaptureWorker) -> None:
+        """Return a worker to the idle list and free its slot."""
+        with self._lock:
+            self._busy.remove(worker)
+            self._idle.append(worker)
+        self._slots.release()
+
+    def _respawn(self, worker: CaptureWorker) -> None:
+        """Retire a stuck worker and replace it with a fresh one."""
+        worker.retire()
+        with self._lock:
+            self._busy.remove(worker)
+            self._stuck = [stuck for stuck in self._stuck if stuck.alive]
+            self._stuck.append(worker)
+            self._idle.append(self._spawn())
+            self.respawned += 1
+        self._slots.release()
+
+    def _spawn(self) -> CaptureWorker:
+        """Start a new worker. Must be called with the lock held."""
+        return CaptureWorker(f"capture-worker-{next(self._names)}")
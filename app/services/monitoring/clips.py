@@ -0,0 +1,213 @@
+"""
+Transition clips.
+
+This module keeps a short pre-roll of downscaled frames per monitored camera
+and, when a gate changes state, writes the frames from before and after the
+change to disk on a background encoder pool.
+"""
+# pylint: disable=no-member
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.services.monitoring.monitor import FrameAnalysis
+
+logger = logging.getLogger(__name__)
+
+CLIPS = Counter("gate_clips_total", "Transition clips by outcome.", ["outcome"])
+
+# Supported clip formats
+CLIP_FORMATS = ("jpeg", "mjpeg")
+
+
+@dataclass
+class Clip:
+    """
+    Frames around one gate transition.
+
+    Attributes:
+        camera_id: The monitored camera.
+        timestamp: Wall-clock time of the transition.
+        status: The status the gate changed to.
+        frames: Timestamped frames, oldest first, ending with the post-roll.
+        post_roll: Frames still to collect after the transition.
+    """
+    camera_id: str
+    timestamp: float
+    status: str
+    frames: List[Tuple[float, np.ndarray]] = field(default_factory=list)
+    post_roll: int = 0
+
+
+class ClipRecorder:
+    """
+    Monitor listener that turns gate transitions into clips.
+
+    Every analysed frame is downscaled into the camera's pre-roll buffer. A
+    transition opens a clip with the pre-roll and the transition frame, and
+    the clip is handed to the encoder pool once its post-roll is collected.
+    The listener itself only resizes and queues frames; when the encoders
+    fall behind by more than max_pending clips, new clips are dropped rather
+    than blocking the monitoring loop.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        clip_format: Optional[str] = None,
+        pre_roll: Optional[int] = None,
+        post_roll: Optional[int] = None,
+        width: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None
+    ):
+        """
+        Initialize the recorder and its encoder pool.
+
+        Args:
+            directory: Directory clips are written to, defaults to CLIP_DIR.
+            clip_format: "jpeg" for a JPEG sequence or "mjpeg" for an MJPEG
+                AVI file, defaults to CLIP_FORMAT.
+            pre_roll: Frames kept from before a transition, defaults to CLIP_PRE_ROLL.
+            post_roll: Frames kept from after a transition, defaults to CLIP_POST_ROLL.
+            width: Width frames are downscaled to, defaults to CLIP_WIDTH.
+            workers: Encoder threads, defaults to CLIP_ENCODER_WORKERS.
+            max_pending: Clips allowed to wait for an encoder, defaults to CLIP_MAX_PENDING.
+
+        Raises:
+            ValueError: If the clip format is not supported.
+        """
+        self.directory = directory or settings.clip_dir
+        self.clip_format = clip_format or settings.clip_format
+        if self.clip_format not in CLIP_FORMATS:
+            raise ValueError(f"Unknown clip format: {self.clip_format}")
+        self.pre_roll = pre_roll if pre_roll is not None else settings.clip_pre_roll
+        self.post_roll = post_roll if post_roll is not None else settings.clip_post_roll
+        self.width = width if width is not None else settings.clip_width
+        self.max_pending = max_pending if max_pending is not None else settings.clip_max_pending
+        self.pending = 0
+        self._buffers: Dict[str, Deque[Tuple[float, np.ndarray]]] = {}
+        self._open: Dict[str, List[Clip]] = {}
+        self._lock = threading.Lock()
+        self._encoders = ThreadPoolExecutor(
+            max_workers=workers if workers is not None else settings.clip_encoder_workers,
+            thread_name_prefix="clip-encoder"
+        )
+
+    def __call__(self, analysis: FrameAnalysis) -> None:
+        """
+        Take an analysed frame from the monitor.
+
+        Args:
+            analysis: The outcome of a monitoring check.
+        """
+        if analysis.frame is None:
+            return
+        frame = (analysis.timestamp, self._downscale(analysis.frame))
+        ready = []
+        with self._lock:
+            clips = self._open.setdefault(analysis.camera_id, [])
+            for clip in clips:
+                clip.frames.append(frame)
+                clip.post_roll -= 1
+            ready = [clip for clip in clips if clip.post_roll <= 0]
+            clips[:] = [clip for clip in clips if clip.post_roll > 0]
+
+            buffer = self._buffers.setdefault(analysis.camera_id, deque(maxlen=self.pre_roll))
+            if analysis.changed and analysis.previous is not None:
+                clip = Clip(
+                    analysis.camera_id, analysis.timestamp, analysis.status.value.lower(),
+                    list(buffer) + [frame], self.post_roll
+                )
+                if clip.post_roll > 0:
+                    clips.append(clip)
+                else:
+                    ready.append(clip)
+            buffer.append(frame)
+        for clip in ready:
+            self._submit(clip)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the encoder pool.
+
+        Args:
+            wait: Whether to wait for queued clips to be written.
+        """
+        self._encoders.shutdown(wait=wait)
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Copy a frame, shrunk to the clip width if it is wider."""
+        height, width = frame.shape[:2]
+        if width <= self.width:
+            return np.array(frame)
+        size = (self.width, max(int(height * self.width / width), 1))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _submit(self, clip: Clip) -> None:
+        """Queue a complete clip for encoding, or drop it if the encoders are behind."""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                CLIPS.labels("dropped").inc()
+                logger.warning("Dropped clip of camera %s, encoders are behind", clip.camera_id)
+                return
+            self.pending += 1
+        future = self._encoders.submit(self._encode, clip)
+        future.add_done_callback(self._encoded)
+
+    def _encoded(self, _future) -> None:
+        """Free the pending slot of an encoded clip."""
+        with self._lock:
+            self.pending -= 1
+
+    def _encode(self, clip: Clip) -> Optional[str]:
+        """Write a clip to disk and return its path."""
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(clip.timestamp))
+        stamp += f"{clip.timestamp % 1:.3f}"[1:]
+        name = f"{stamp}-{clip.status}"
+        directory = os.path.join(self.directory, re.sub(r"[^A-Za-z0-9._-]", "_", clip.camera_id))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if self.clip_format == "mjpeg":
+                path = os.path.join(directory, f"{name}.avi")
+                self._write_mjpeg(path, clip)
+            else:
+                path = os.path.join(directory, name)
+                os.makedirs(path, exist_ok=True)
+                for index, (_, frame) in enumerate(clip.frames):
+                    if not cv2.imwrite(os.path.join(path, f"frame-{index:04d}.jpg"), frame):
+                        raise OSError(f"Could not write frame {index} of {path}")
+        except Exception:  # pylint: disable=broad-exception-caught
+            CLIPS.labels("failed").inc()
+            logger.exception("Could not write clip of camera %s", clip.camera_id)
+            return None
+        CLIPS.labels("written").inc()
+        return path
+
+    @staticmethod
+    def _write_mjpeg(path: str, clip: Clip) -> None:
+        """Write the frames of a clip as an MJPEG AVI file at their recorded pace."""
+        first, last = clip.frames[0][0], clip.frames[-1][0]
+        fps = (len(clip.frames) - 1) / (last - first) if last > first else 1.0
+        height, width = clip.frames[0][1].shape[:2]
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+        if not writer.isOpened():
+            raise OSError(f"Could not open {path} for writing")
+        try:
+            for _, frame in clip.frames:
+                if frame.ndim == 2:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+                writer.write(frame)
+        finally:
+            writer.release()
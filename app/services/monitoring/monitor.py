@@ -0,0 +1,277 @@
+"""
+Background gate monitoring.
+
+This module checks a configured set of cameras continuously, keeps the
+latest state of every gate, and tells listeners about every analysed frame
+so features such as event clips can react to state transitions.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.deadline import deadline_scope
+from app.core.exceptions import AdmissionRejectedError
+from app.domain.models import CameraCredentials, GateStatus, MonitoredCamera
+from app.services.gate_detector.instrumentation import camera_scope
+from app.services.gate_detector.interfaces import CameraService, DetectionService
+from app.services.scheduling.admission import AdmissionController, Priority
+
+logger = logging.getLogger(__name__)
+
+# Client the monitor's checks are accounted to by admission control
+MONITOR_CLIENT = "monitor"
+
+
+def parse_monitored_cameras(value: str, interval: Optional[float] = None) -> List[MonitoredCamera]:
+    """
+    Parse the monitored cameras from a JSON list.
+
+    Each entry has an "id", "ip_address", "username" and "password", and
+    optionally a "port" and an "interval" in seconds.
+
+    Args:
+        value: The JSON list, or an empty string for no cameras.
+        interval: Interval of entries without one, defaults to MONITOR_INTERVAL.
+
+    Returns:
+        The monitored cameras.
+
+    Raises:
+        ValueError: If the value is not a list of valid entries or ids repeat.
+    """
+    if not value.strip():
+        return []
+    default_interval = interval if interval is not None else settings.monitor_interval
+    try:
+        entries = json.loads(value)
+        cameras = [
+            MonitoredCamera(
+                camera_id=str(entry["id"]),
+                credentials=CameraCredentials(
+                    username=entry["username"],
+                    password=entry["password"],
+                    ip_address=entry["ip_address"],
+                    port=int(entry.get("port", 554))
+                ),
+                interval=float(entry.get("interval", default_interval))
+            )
+            for entry in entries
+        ]
+    except (TypeError, KeyError, ValueError) as e:
+        raise ValueError(f"Invalid MONITORED_CAMERAS: {e}") from e
+    ids = [camera.camera_id for camera in cameras]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Invalid MONITORED_CAMERAS: camera ids must be unique")
+    return cameras
+
+
+@dataclass
+class FrameAnalysis:
+    """
+    Outcome of one monitoring check.
+
+    Attributes:
+        camera_id: The monitored camera.
+        timestamp: Wall-clock time of the check.
+        frame: The analysed frame, or None if the capture failed.
+        status: The detected status, or None if the check failed.
+        previous: The status before this check, None if there was none.
+        version: The camera's state version after this check.
+        error: The error message if the check failed.
+    """
+    camera_id: str
+    timestamp: float
+    frame: Any
+    status: Optional[GateStatus]
+    previous: Optional[GateStatus]
+    version: int
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        """Whether the check found the gate in a new state."""
+        return self.status is not None and self.status != self.previous
+
+
+@dataclass
+class CameraState:
+    """
+    Latest known state of a monitored gate.
+
+    Attributes:
+        camera_id: The monitored camera.
+        status: The last detected status, None until a check succeeds.
+        version: Incremented on every status change.
+        changed_at: Wall-clock time of the last status change.
+        checked_at: Wall-clock time of the last check.
+        error: The error of the last check, None if it succeeded.
+    """
+    camera_id: str
+    status: Optional[GateStatus] = None
+    version: int = 0
+    changed_at: Optional[float] = None
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+
+
+class GateMonitor:
+    """
+    Checks monitored cameras in the background on one thread per camera.
+
+    Checks go through admission control as monitoring work, so they never
+    hold up interactive checks. Listeners are called on the camera's
+    monitoring thread after every check and must hand slow work off to
+    their own threads.
+    """
+
+    def __init__(
+        self,
+        cameras: List[MonitoredCamera],
+        camera_service: CameraService,
+        detection_service: DetectionService,
+        admission: Optional[AdmissionController] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            cameras: The cameras to monitor.
+            camera_service: The camera service to capture frames with.
+            detection_service: The detection service to analyse frames with.
+            admission: Admission controller to queue checks in, if any.
+            clock: Wall clock, replaceable in tests.
+        """
+        self.cameras = {camera.camera_id: camera for camera in cameras}
+        self.camera_service = camera_service
+        self.detection_service = detection_service
+        self.admission = admission
+        self._clock = clock
+        self._states = {camera_id: CameraState(camera_id) for camera_id in self.cameras}
+        self._listeners: List[Callable[[FrameAnalysis], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def add_listener(self, listener: Callable[[FrameAnalysis], None]) -> None:
+        """
+        Register a callable to receive every FrameAnalysis.
+
+        Args:
+            listener: The listener.
+        """
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Start one monitoring thread per camera."""
+        self._stop.clear()
+        for camera in self.cameras.values():
+            thread = threading.Thread(
+                target=self._run, args=(camera,), name=f"monitor-{camera.camera_id}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the monitoring threads.
+
+        Args:
+            timeout: Seconds to wait for each thread to finish its current check.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def state(self, camera_id: str) -> CameraState:
+        """
+        Get the latest state of a monitored gate.
+
+        Args:
+            camera_id: The monitored camera.
+
+        Returns:
+            A copy of the camera's state.
+
+        Raises:
+            KeyError: If the camera is not monitored.
+        """
+        with self._lock:
+            return CameraState(**vars(self._states[camera_id]))
+
+    def states(self) -> List[CameraState]:
+        """
+        Get the latest state of every monitored gate.
+
+        Returns:
+            A copy of every camera's state.
+        """
+        with self._lock:
+            return [CameraState(**vars(state)) for state in self._states.values()]
+
+    def poll(self, camera_id: str) -> Optional[FrameAnalysis]:
+        """
+        Check a monitored camera once and tell the listeners.
+
+        Args:
+            camera_id: The monitored camera.
+
+        Returns:
+            The analysis, or None if admission control turned the check away.
+        """
+        camera = self.cameras[camera_id]
+        frame, status, error = None, None, None
+        try:
+            with deadline_scope(settings.check_timeout), self._admitted(camera), \
+                    camera_scope(camera.credentials.endpoint):
+                rtsp_uri = self.camera_service.get_rtsp_uri(camera.credentials)
+                frame = self.camera_service.capture_frame(rtsp_uri)
+                status = self.detection_service.detect_gate_status(frame)
+        except AdmissionRejectedError:
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = str(e)
+
+        analysis = self._update(camera_id, frame, status, error)
+        for listener in self._listeners:
+            try:
+                listener(analysis)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Monitor listener failed")
+        return analysis
+
+    def _admitted(self, camera: MonitoredCamera):
+        """Get a context that holds an admission slot for the camera, if there is a controller."""
+        if self.admission is None:
+            return nullcontext()
+        return self.admission.admit(camera.credentials.endpoint, MONITOR_CLIENT, Priority.MONITORING)
+
+    def _update(
+        self, camera_id: str, frame: Any, status: Optional[GateStatus], error: Optional[str]
+    ) -> FrameAnalysis:
+        """Record the outcome of a check in the camera's state."""
+        now = self._clock()
+        with self._lock:
+            state = self._states[camera_id]
+            previous = state.status
+            state.checked_at = now
+            state.error = error
+            if status is not None and status != previous:
+                state.status = status
+                state.version += 1
+                state.changed_at = now
+            return FrameAnalysis(camera_id, now, frame, status, previous, state.version, error)
+
+    def _run(self, camera: MonitoredCamera) -> None:
+        """Check a camera at its interval until stopped."""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll(camera.camera_id)
+            self._stop.wait(max(camera.interval - (time.monotonic() - started), 0.0))
+
@@ -0,0 +1,149 @@
+"""
+Recording and replaying camera services.
+
+This module records every captured frame into the camera's frame ring, and
+plays recorded frames back through the CameraService interface, so detection
+can be re-run over past incidents without touching the cameras.
+"""
+import logging
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.exceptions import FrameCaptureError
+from app.domain.models import CameraCredentials
+from app.services.gate_detector.breaker import camera_endpoint
+from app.services.gate_detector.interfaces import CameraService
+from app.services.recording.ring import FrameRecorder, FrameRing
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingCameraService(CameraService):
+    """Camera service that records every captured frame in the camera's ring."""
+
+    def __init__(self, camera_service: CameraService, recorder: FrameRecorder):
+        """
+        Initialize the service.
+
+        Args:
+            camera_service: The camera service that performs the actual capture.
+            recorder: The recorder to write frames to.
+        """
+        self.camera_service = camera_service
+        self.recorder = recorder
+
+    def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
+        """
+        Get the RTSP URI for the camera.
+
+        Args:
+            credentials: The camera credentials.
+
+        Returns:
+            The RTSP URI.
+        """
+        return self.camera_service.get_rtsp_uri(credentials)
+
+    def capture_frame(self, rtsp_uri: str) -> np.ndarray:
+        """
+        Capture a frame and record it.
+
+        A frame that cannot be recorded is still returned; recording never
+        fails a check.
+
+        Args:
+            rtsp_uri: The RTSP URI.
+
+        Returns:
+            The captured frame.
+        """
+        frame = self.camera_service.capture_frame(rtsp_uri)
+        try:
+            self.recorder.record(camera_endpoint(rtsp_uri), frame)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Could not record frame")
+        return frame
+
+
+class ReplayCameraService(CameraService):
+    """
+    Camera service that plays back recorded frames.
+
+    Each camera plays the frames recorded in the time range, oldest first,
+    one per capture. The range is looked up on the first capture of a camera.
+    Frames are read-only views of the mapped ring, not copies.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        loop: bool = True
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            directory: The directory holding the rings, defaults to RECORDING_DIR.
+            start: Earliest timestamp to play, defaults to REPLAY_START.
+            end: Latest timestamp to play, defaults to REPLAY_END.
+            loop: Whether to start over after the last frame.
+        """
+        self.directory = directory or settings.recording_dir
+        self.start = start if start is not None else settings.replay_start
+        self.end = end if end is not None else settings.replay_end
+        self.loop = loop
+        self._rings: Dict[str, FrameRing] = {}
+        self._slots: Dict[str, np.ndarray] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
+        """
+        Get the RTSP URI for the camera.
+
+        Args:
+            credentials: The camera credentials.
+
+        Returns:
+            The RTSP URI.
+        """
+        return credentials.get_rtsp_uri(settings.rtsp_format)
+
+    def capture_frame(self, rtsp_uri: str) -> np.ndarray:
+        """
+        Play the next recorded frame of the camera.
+
+        Args:
+            rtsp_uri: The RTSP URI, used to find the camera's ring.
+
+        Returns:
+            The recorded grayscale frame.
+
+        Raises:
+            FrameCaptureError: If the camera has no frames in the range, or
+                all of them were played and looping is off.
+        """
+        camera = camera_endpoint(rtsp_uri)
+        with self._lock:
+            if camera not in self._rings:
+                try:
+                    self._rings[camera] = FrameRing(self.directory, camera, readonly=True)
+                except FileNotFoundError as e:
+                    raise FrameCaptureError(str(e)) from e
+                self._slots[camera] = self._rings[camera].between(self.start, self.end)
+                self._positions[camera] = 0
+            slots = self._slots[camera]
+            position = self._positions[camera]
+            if len(slots) == 0:
+                raise FrameCaptureError(f"No recorded frames for camera {camera} in range")
+            if position >= len(slots):
+                if not self.loop:
+                    raise FrameCaptureError(f"Replay of camera {camera} finished")
+                position = 0
+            self._positions[camera] = position + 1
+            return self._rings[camera].frame(slots[position])
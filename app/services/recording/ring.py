@@ -0,0 +1,221 @@
+"""
+Memory-mapped frame rings.
+
+This module keeps the most recent frames of every camera in an on-disk ring
+of fixed-size grayscale slots, with a compact timestamp index next to it.
+Both files are memory-mapped, so recording a frame is a copy into the page
+cache and reading one back is a zero-copy view.
+"""
+# pylint: disable=no-member
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+
+
+def _file_stem(camera: str) -> str:
+    """Turn a camera endpoint into a safe file name."""
+    return re.sub(r"[^A-Za-z0-9.-]", "_", camera)
+
+
+class FrameRing:
+    """
+    Ring of the most recent grayscale frames of one camera.
+
+    The ring is stored as three files: "<camera>.frames" holds the slots as a
+    slots x height x width uint8 array, "<camera>.index" holds one float64
+    wall-clock timestamp per slot (0 for an empty slot), and "<camera>.json"
+    holds the geometry. The write position is recovered from the index, so a
+    ring survives restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        camera: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        slots: Optional[int] = None,
+        readonly: bool = False
+    ):
+        """
+        Open a ring, creating it if needed.
+
+        A ring opened for writing with a different geometry than the one on
+        disk is recreated empty. A ring opened read-only keeps the geometry on
+        disk.
+
+        Args:
+            directory: The directory holding the rings.
+            camera: The camera endpoint.
+            width: Slot width in pixels, defaults to RECORDING_WIDTH.
+            height: Slot height in pixels, defaults to RECORDING_HEIGHT.
+            slots: Number of slots, defaults to RECORDING_SLOTS.
+            readonly: Whether to open an existing ring for reading only.
+
+        Raises:
+            FileNotFoundError: If a ring opened read-only does not exist.
+        """
+        self.camera = camera
+        stem = os.path.join(directory, _file_stem(camera))
+        meta_path = f"{stem}.json"
+        geometry = {
+            "width": width if width is not None else settings.recording_width,
+            "height": height if height is not None else settings.recording_height,
+            "slots": slots if slots is not None else settings.recording_slots,
+        }
+
+        existing = None
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as meta:
+                existing = json.load(meta)
+        if readonly:
+            if existing is None:
+                raise FileNotFoundError(f"No recording for camera {camera}")
+            geometry, mode = existing, "r"
+        elif existing == geometry:
+            mode = "r+"
+        else:
+            os.makedirs(directory, exist_ok=True)
+            with open(meta_path, "w", encoding="utf-8") as meta:
+                json.dump(geometry, meta)
+            mode = "w+"
+
+        self.width = geometry["width"]
+        self.height = geometry["height"]
+        self.slots = geometry["slots"]
+        self.frames = np.memmap(
+            f"{stem}.frames", dtype=np.uint8, mode=mode, shape=(self.slots, self.height, self.width)
+        )
+        self.index = np.memmap(f"{stem}.index", dtype=np.float64, mode=mode, shape=(self.slots,))
+        self._head = int(np.argmax(self.index) + 1) % self.slots if self.index.any() else 0
+        self._lock = threading.Lock()
+
+    def append(self, frame: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """
+        Record a frame in the oldest slot.
+
+        Colour frames are converted to grayscale and frames of another size
+        are resized to the slot size.
+
+        Args:
+            frame: The frame, BGR or grayscale.
+            timestamp: Wall-clock time of the frame, defaults to now.
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        if gray.shape != (self.height, self.width):
+            gray = cv2.resize(gray, (self.width, self.height), interpolation=cv2.INTER_AREA)
+        with self._lock:
+            slot = self._head
+            # Clear the timestamp first so readers never pair it with a half-written frame
+            self.index[slot] = 0.0
+            self.frames[slot] = gray
+            self.index[slot] = timestamp if timestamp is not None else time.time()
+            self._head = (slot + 1) % self.slots
+
+    def between(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """
+        Find the recorded slots in a time range.
+
+        Args:
+            start: Earliest timestamp, inclusive, or None for no lower bound.
+            end: Latest timestamp, inclusive, or None for no upper bound.
+
+        Returns:
+            The slot numbers, oldest frame first.
+        """
+        timestamps = np.array(self.index)
+        mask = timestamps > 0
+        if start is not None:
+            mask &= timestamps >= start
+        if end is not None:
+            mask &= timestamps <= end
+        slots = np.flatnonzero(mask)
+        return slots[np.argsort(timestamps[slots], kind="stable")]
+
+    def frame(self, slot: int) -> np.ndarray:
+        """
+        Get the frame in a slot as a view of the mapped file.
+
+        Args:
+            slot: The slot number.
+
+        Returns:
+            A height x width uint8 view, not a copy.
+        """
+        return self.frames[slot]
+
+    def flush(self) -> None:
+        """Write the mapped files back to disk."""
+        if self.frames.mode != "r":
+            self.frames.flush()
+            self.index.flush()
+
+
+class FrameRecorder:
+    """Frame rings of every camera in one directory, opened on first use."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        slots: Optional[int] = None
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            directory: The directory holding the rings, defaults to RECORDING_DIR.
+            width: Slot width in pixels, defaults to RECORDING_WIDTH.
+            height: Slot height in pixels, defaults to RECORDING_HEIGHT.
+            slots: Number of slots per camera, defaults to RECORDING_SLOTS.
+        """
+        self.directory = directory or settings.recording_dir
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self._rings: Dict[str, FrameRing] = {}
+        self._lock = threading.Lock()
+
+    def ring(self, camera: str) -> FrameRing:
+        """
+        Get the ring of a camera, opening it if needed.
+
+        Args:
+            camera: The camera endpoint.
+
+        Returns:
+            The camera's ring.
+        """
+        with self._lock:
+            ring = self._rings.get(camera)
+            if ring is None:
+                ring = FrameRing(self.directory, camera, self.width, self.height, self.slots)
+                self._rings[camera] = ring
+            return ring
+
+    def record(self, camera: str, frame: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """
+        Record a frame of a camera.
+
+        Args:
+            camera: The camera endpoint.
+            frame: The frame, BGR or grayscale.
+            timestamp: Wall-clock time of the frame, defaults to now.
+        """
+        self.ring(camera).append(frame, timestamp)
+
+    def flush(self) -> None:
+        """Write every ring back to disk."""
+        with self._lock:
+            rings = list(self._rings.values())
+        for ring in rings:
+            ring.flush()
@@ -0,0 +1,323 @@
+"""
+Admission control for gate checks.
+
+This module limits how many gate checks run at once, overall and per camera,
+and keeps the rest in a bounded queue so that a burst is answered with 429
+instead of piling up behind blocking captures. Capacity is shared fairly
+between API clients according to their weights, and interactive checks are
+served ahead of monitoring and batch work.
+"""
+import itertools
+import threading
+import time
+from collections import Counter as Tally, defaultdict
+from contextlib import contextmanager
+from enum import Enum
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.deadline import budget
+from app.core.exceptions import AdmissionRejectedError
+from app.core.metrics import Counter, Gauge, Histogram
+from app.services.scheduling.fairness import ClientRateLimiter
+
+QUEUE_DEPTH = Gauge("gate_admission_queue_depth", "Gate checks waiting to be admitted.")
+IN_FLIGHT = Gauge("gate_admission_in_flight", "Gate checks currently admitted.")
+WAIT_SECONDS = Histogram(
+    "gate_admission_wait_seconds", "Time gate checks wait to be admitted.", ["priority"]
+)
+RUN_SECONDS = Histogram(
+    "gate_admission_run_seconds", "Time admitted gate checks take to run.", ["priority"]
+)
+REJECTED = Counter(
+    "gate_admission_rejected_total", "Gate checks rejected by admission control.", ["reason", "priority"]
+)
+
+# Smoothing factor of the running average of check durations
+DURATION_SMOOTHING = 0.2
+
+# Client used when the caller does not identify itself
+DEFAULT_CLIENT = "default"
+
+
+class Priority(str, Enum):
+    """Priority class of a gate check, highest first."""
+    INTERACTIVE = "interactive"
+    MONITORING = "monitoring"
+    BATCH = "batch"
+
+    @property
+    def rank(self) -> int:
+        """Position of the class in dispatch order, 0 being served first."""
+        return list(Priority).index(self)
+
+
+class _Waiter:
+    """A check waiting in the admission queue."""
+
+    __slots__ = (
+        "camera", "client", "priority", "start", "finish", "sequence", "admitted", "evicted"
+    )
+
+    def __init__(
+        self, camera: str, client: str, priority: Priority, start: float, finish: float, sequence: int
+    ):
+        """Initialize a waiter that has not been admitted yet."""
+        self.camera = camera
+        self.client = client
+        self.priority = priority
+        self.start = start
+        self.finish = finish
+        self.sequence = sequence
+        self.admitted = False
+        self.evicted = False
+
+
+class AdmissionController:
+    """
+    Bounded, weighted-fair admission queue with concurrency limits.
+
+    Every client first takes a token from its own bucket. Waiting checks are
+    served by priority class, interactive first, and within a class by
+    start-time fair queuing: each gets a virtual finish time that advances by
+    1/weight per check of its client, so a client sending many checks only
+    delays its own. Checks whose camera is at its session cap are skipped so
+    one busy camera does not hold up the others. Part of the capacity is
+    reserved for interactive checks, so background work can never occupy every
+    slot. When the queue is full a queued check of the lowest priority class
+    is dropped, and within that class the newest check of the client with the
+    most queued checks, rather than the newcomer of a quieter client.
+
+    Running checks are never interrupted: a blocking capture cannot be
+    cancelled safely, so lower-priority work is deferred or dropped while it
+    is still queued.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        per_camera_limit: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        rate_limiter: Optional[ClientRateLimiter] = None,
+        interactive_reserved: Optional[int] = None
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Checks running at once, defaults to MAX_CONCURRENT_CHECKS.
+            max_queue: Checks allowed to wait, defaults to MAX_QUEUED_CHECKS.
+            per_camera_limit: Checks running at once per camera, defaults to CAMERA_MAX_SESSIONS.
+            queue_timeout: Longest wait in seconds, defaults to QUEUE_TIMEOUT.
+            rate_limiter: Per-client token buckets and weights, defaults to one
+                configured from the environment.
+            interactive_reserved: Slots only interactive checks may use, defaults
+                to INTERACTIVE_RESERVED_CHECKS. At least one slot is always left
+                for other classes.
+        """
+        self.max_concurrency = (
+            max_concurrency if max_concurrency is not None else settings.max_concurrent_checks
+        )
+        self.max_queue = max_queue if max_queue is not None else settings.max_queued_checks
+        self.per_camera_limit = (
+            per_camera_limit if per_camera_limit is not None else settings.camera_max_sessions
+        )
+        self.queue_timeout = queue_timeout if queue_timeout is not None else settings.queue_timeout
+        self.rate_limiter = rate_limiter or ClientRateLimiter()
+        reserved = (
+            interactive_reserved if interactive_reserved is not None
+            else settings.interactive_reserved_checks
+        )
+        self.interactive_reserved = max(min(reserved, self.max_concurrency - 1), 0)
+        self.running = 0
+        self.average_duration = 1.0
+        self._per_camera: Dict[str, int] = defaultdict(int)
+        self._waiters: List[_Waiter] = []
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def admit(
+        self,
+        camera: str,
+        client: str = DEFAULT_CLIENT,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> Iterator[None]:
+        """
+        Run a block once the check is admitted.
+
+        Args:
+            camera: The camera endpoint the check talks to.
+            client: The API client the check is run for.
+            priority: The priority class of the check.
+
+        Raises:
+            AdmissionRejectedError: If the client is over its rate, the queue is
+                full or the wait times out.
+        """
+        self.acquire(camera, client, priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - started
+            RUN_SECONDS.labels(priority.value).observe(duration)
+            self.release(camera, duration)
+
+    def acquire(
+        self,
+        camera: str,
+        client: str = DEFAULT_CLIENT,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> None:
+        """
+        Wait until a check for the camera may run.
+
+        Args:
+            camera: The camera endpoint the check talks to.
+            client: The API client the check is run for.
+            priority: The priority class of the check.
+
+        Raises:
+            AdmissionRejectedError: If the client is over its rate, the queue is
+                full or the wait times out.
+        """
+        allowed, retry_after = self.rate_limiter.take(client)
+        if not allowed:
+            REJECTED.labels("rate_limited", priority.value).inc()
+            raise AdmissionRejectedError("Client rate limit exceeded", retry_after=retry_after)
+
+        started = time.monotonic()
+        with self._cond:
+            waiter = self._enqueue(camera, client, priority)
+            self._dispatch()
+            if not waiter.admitted and len(self._waiters) > self.max_queue:
+                self._evict(self._eviction_candidate(waiter), "queue_full")
+            if not waiter.admitted and not waiter.evicted:
+                self._cond.wait_for(
+                    lambda: waiter.admitted or waiter.evicted, timeout=budget(self.queue_timeout)
+                )
+                if not waiter.admitted and not waiter.evicted:
+                    self._evict(waiter, "queue_timeout")
+                    raise AdmissionRejectedError(
+                        "Timed out waiting for a free check slot", retry_after=self._retry_after()
+                    )
+            if waiter.evicted:
+                raise AdmissionRejectedError(
+                    "Too many gate checks queued", retry_after=self._retry_after()
+                )
+        WAIT_SECONDS.labels(priority.value).observe(time.monotonic() - started)
+
+    def release(self, camera: str, duration: Optional[float] = None) -> None:
+        """
+        Mark a check as finished and admit waiting checks.
+
+        Args:
+            camera: The camera endpoint the check talked to.
+            duration: How long the check ran, used to estimate Retry-After.
+        """
+        with self._cond:
+            self.running -= 1
+            self._per_camera[camera] -= 1
+            if self._per_camera[camera] <= 0:
+                del self._per_camera[camera]
+            IN_FLIGHT.set(self.running)
+            if duration is not None:
+                self.average_duration += DURATION_SMOOTHING * (duration - self.average_duration)
+            self._dispatch()
+
+    def queue_depth(self, priority: Optional[Priority] = None) -> int:
+        """
+        Get the number of waiting checks.
+
+        Args:
+            priority: Only count checks of this class, if given.
+
+        Returns:
+            The queue depth.
+        """
+        with self._cond:
+            return sum(
+                1 for waiter in self._waiters if priority is None or waiter.priority == priority
+            )
+
+    def _enqueue(self, camera: str, client: str, priority: Priority) -> _Waiter:
+        """Queue a check with its fair-queuing tags. Must be called with the lock held."""
+        start = max(self._virtual_time, self._last_finish.get(client, 0.0))
+        finish = start + 1.0 / self.rate_limiter.weight(client)
+        self._last_finish[client] = finish
+        waiter = _Waiter(camera, client, priority, start, finish, next(self._sequence))
+        self._waiters.append(waiter)
+        return waiter
+
+    def _has_capacity(self, camera: str, priority: Priority) -> bool:
+        """Whether a check of the class for the camera may start now."""
+        limit = self.max_concurrency
+        if priority != Priority.INTERACTIVE:
+            limit -= self.interactive_reserved
+        return (
+            self.running < limit
+            and self._per_camera.get(camera, 0) < self.per_camera_limit
+        )
+
+    def _start(self, camera: str) -> None:
+        """Count a check as running. Must be called with the lock held."""
+        self.running += 1
+        self._per_camera[camera] += 1
+        IN_FLIGHT.set(self.running)
+
+    def _eviction_candidate(self, newcomer: _Waiter) -> _Waiter:
+        """Pick the newest check of the heaviest client in the lowest queued class."""
+        lowest = max(waiter.priority.rank for waiter in self._waiters)
+        candidates = [waiter for waiter in self._waiters if waiter.priority.rank == lowest]
+        # A newcomer in the class loses ties, so other clients keep their queued checks
+        own = newcomer.client if newcomer in candidates else None
+        queued = Tally(waiter.client for waiter in candidates)
+        heaviest = max(queued, key=lambda client: (queued[client], client == own))
+        if heaviest == own:
+            return newcomer
+        return max(
+            (waiter for waiter in candidates if waiter.client == heaviest),
+            key=lambda waiter: waiter.sequence
+        )
+
+    def _evict(self, waiter: _Waiter, reason: str) -> None:
+        """Remove a check from the queue. Must be called with the lock held."""
+        self._waiters.remove(waiter)
+        waiter.evicted = True
+        QUEUE_DEPTH.set(len(self._waiters))
+        REJECTED.labels(reason, waiter.priority.value).inc()
+        self._cond.notify_all()
+
+    def _dispatch(self) -> None:
+        """Admit waiting checks by priority, then in fair order, while there is capacity."""
+        order = sorted(
+            self._waiters, key=lambda waiter: (waiter.priority.rank, waiter.finish, waiter.sequence)
+        )
+        for waiter in order:
+            if self.running >= self.max_concurrency:
+                break
+            if self._has_capacity(waiter.camera, waiter.priority):
+                self._waiters.remove(waiter)
+                waiter.admitted = True
+                self._virtual_time = max(self._virtual_time, waiter.start)
+                self._start(waiter.camera)
+        if not self._waiters:
+            # Idle: forget the tags so clients start level again
+            self._virtual_time = 0.0
+            self._last_finish.clear()
+        else:
+            # Tags behind the virtual clock make no difference, drop them
+            self._last_finish = {
+                client: finish for client, finish in self._last_finish.items()
+                if finish > self._virtual_time
+            }
+        QUEUE_DEPTH.set(len(self._waiters))
+        self._cond.notify_all()
+
+    def _retry_after(self) -> float:
+        """Estimate how long it takes for the current queue to drain."""
+        return (len(self._waiters) + 1) * self.average_duration / max(self.max_concurrency, 1)
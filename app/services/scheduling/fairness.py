@@ -0,0 +1,140 @@
+"""
+Per-client rate limiting.
+
+This module gives every API client its own token bucket, sized by the
+client's weight, so one badly behaved poller cannot use up the capacity
+shared by every other client.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Buckets of clients that have not been seen for a while are dropped beyond this
+MAX_TRACKED_CLIENTS = 10000
+
+
+class TokenBucket:
+    """Token bucket refilled at a constant rate up to its burst size."""
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._clock = clock
+        self._updated = clock()
+
+    def take(self) -> Tuple[bool, float]:
+        """
+        Take a token if one is available.
+
+        Returns:
+            Whether a token was taken, and if not, seconds until one is available.
+        """
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (1 - self.tokens) / self.rate
+
+
+def parse_weights(value: str) -> Dict[str, float]:
+    """
+    Parse client weights from a "client=weight,client=weight" string.
+
+    Args:
+        value: The weights string.
+
+    Returns:
+        The weight of every listed client.
+
+    Raises:
+        ValueError: If an entry is malformed or a weight is not positive.
+    """
+    weights = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        client, separator, weight = (part.strip() for part in entry.partition("="))
+        if not separator or not client:
+            raise ValueError(f"Invalid client weight: {entry}")
+        weights[client] = float(weight)
+        if weights[client] <= 0:
+            raise ValueError(f"Client weight must be positive: {entry}")
+    return weights
+
+
+class ClientRateLimiter:
+    """Token buckets per client, with rate and burst scaled by the client's weight."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Checks per second for a client of weight 1, defaults to CLIENT_RATE.
+                A rate of 0 disables rate limiting.
+            burst: Burst size for a client of weight 1, defaults to CLIENT_BURST.
+            weights: Weight per client, defaults to CLIENT_WEIGHTS. Unlisted clients weigh 1.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.rate = rate if rate is not None else settings.client_rate
+        self.burst = burst if burst is not None else settings.client_burst
+        self.weights = weights if weights is not None else parse_weights(settings.client_weights)
+        self._clock = clock
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def weight(self, client: str) -> float:
+        """
+        Get the weight of a client.
+
+        Args:
+            client: The client identifier.
+
+        Returns:
+            The client's weight.
+        """
+        return self.weights.get(client, 1.0)
+
+    def take(self, client: str) -> Tuple[bool, float]:
+        """
+        Take a token from the client's bucket.
+
+        Args:
+            client: The client identifier.
+
+        Returns:
+            Whether the client may proceed, and if not, seconds until it may.
+        """
+        if self.rate <= 0:
+            return True, 0.0
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                weight = self.weight(client)
+                bucket = TokenBucket(self.rate * weight, self.burst * weight, self._clock)
+                self._buckets[client] = bucket
+                if len(self._buckets) > MAX_TRACKED_CLIENTS:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+            return bucket.take()
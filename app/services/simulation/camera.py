@@ -0,0 +1,152 @@
+"""
+Simulated camera service.
+
+This module provides a CameraService that serves synthetic gate frames
+through scripted scenarios, with connect delays, failures, timeouts and
+frozen streams, so the service can be load tested and exercised without
+camera hardware.
+"""
+import dataclasses
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.deadline import budget
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError
+from app.domain.models import CameraCredentials
+from app.services.gate_detector.breaker import camera_endpoint
+from app.services.gate_detector.interfaces import CameraService
+from app.services.simulation.frames import GateScene, render_gate
+from app.services.simulation.scenarios import SCENARIOS, Scenario
+
+
+class SimulatedCameraService(CameraService):
+    """
+    Camera service serving synthetic frames according to a scenario.
+
+    The scenario clock starts when the service is created and is shared by
+    every camera. Each capture looks up the current step: its connect delay
+    is drawn uniformly from latency ± jitter and honours the RTSP open
+    timeout and the request deadline like a real camera would, so a delay
+    longer than the time left raises CameraTimeoutError once that time is up.
+    A frozen step keeps serving each camera the last frame it served before.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        scene: Optional[GateScene] = None,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        scenario: Optional[Scenario] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the simulated camera.
+
+        Args:
+            latency: Mean connect delay in seconds, used without a scenario.
+            jitter: Largest deviation from the mean delay in seconds, used
+                without a scenario.
+            failure_rate: Share of captures that fail to connect, used without
+                a scenario.
+            scene: The gate scene served, defaults to a 480p gate. Its closed
+                flag is set by the scenario.
+            seed: Seed of the delay and failure draws, for repeatable runs.
+            sleep: Function used to wait, replaceable in tests.
+            scenario: The scripted behaviour, defaults to a constant one built
+                from latency, jitter and failure_rate.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.scenario = scenario or Scenario.constant(latency, jitter, failure_rate)
+        self.scene = scene or GateScene()
+        self._frames: Dict[bool, np.ndarray] = {}
+        self._last_frames: Dict[str, np.ndarray] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+        self._clock = clock
+        self._started = clock()
+
+    @classmethod
+    def from_settings(cls) -> "SimulatedCameraService":
+        """
+        Create a simulated camera configured from the environment.
+
+        Returns:
+            A camera playing SIMULATED_SCENARIO at SIMULATED_RESOLUTION.
+
+        Raises:
+            ValueError: If the scenario or resolution is unknown.
+        """
+        if settings.simulated_scenario not in SCENARIOS:
+            raise ValueError(f"Unknown simulated scenario: {settings.simulated_scenario}")
+        try:
+            scene = GateScene.at(settings.simulated_resolution)
+        except KeyError as e:
+            raise ValueError(f"Unknown simulated resolution: {settings.simulated_resolution}") from e
+        return cls(scene=scene, seed=settings.simulated_seed, scenario=SCENARIOS[settings.simulated_scenario])
+
+    def get_rtsp_uri(self, credentials: CameraCredentials) -> str:
+        """
+        Get the RTSP URI for the camera.
+
+        Args:
+            credentials: The camera credentials.
+
+        Returns:
+            The RTSP URI.
+        """
+        return credentials.get_rtsp_uri(settings.rtsp_format)
+
+    def capture_frame(self, rtsp_uri: str) -> np.ndarray:
+        """
+        Capture a synthetic frame after the simulated connect delay.
+
+        Args:
+            rtsp_uri: The RTSP URI, used to tell cameras apart.
+
+        Returns:
+            The synthetic frame. Frames are shared and read-only.
+
+        Raises:
+            CameraTimeoutError: If the delay exceeds the time left, or the
+                capture is one of the scripted timeouts.
+            CameraConnectionError: If the simulated connection fails.
+        """
+        step = self.scenario.step_at(self._clock() - self._started)
+        with self._lock:
+            delay = max(step.latency + self._random.uniform(-step.jitter, step.jitter), 0.0)
+            draw = self._random.random()
+        timeout = budget(settings.rtsp_open_timeout_ms / 1000)
+        if draw < step.timeout_rate:
+            delay = max(delay, timeout + 1.0)
+        self._sleep(max(min(delay, timeout), 0.0))
+        if delay > timeout:
+            raise CameraTimeoutError("Timed out opening simulated stream")
+        if draw < step.timeout_rate + step.failure_rate:
+            raise CameraConnectionError("Could not open simulated stream")
+
+        camera = camera_endpoint(rtsp_uri)
+        with self._lock:
+            frame = self._last_frames.get(camera) if step.frozen else None
+            if frame is None:
+                frame = self._frame(step.closed)
+                self._last_frames[camera] = frame
+        return frame
+
+    def _frame(self, closed: bool) -> np.ndarray:
+        """Get the frame of a gate state, drawing it once. Must be called with the lock held."""
+        frame = self._frames.get(closed)
+        if frame is None:
+            frame = render_gate(dataclasses.replace(self.scene, closed=closed))
+            # Every capture shares the frame, so keep callers from changing it
+            frame.flags.writeable = False
+            self._frames[closed] = frame
+        return frame
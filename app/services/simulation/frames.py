@@ -0,0 +1,102 @@
+"""
+Synthetic gate frames.
+
+This module draws deterministic pictures of open and closed gates, so the
+detector can be benchmarked and exercised without a camera.
+"""
+# pylint: disable=no-member
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import cv2
+import numpy as np
+
+# Common camera resolutions as (width, height)
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "480p": (640, 480),
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+
+
+@dataclass(frozen=True)
+class GateScene:
+    """
+    Description of a synthetic gate picture.
+
+    Attributes:
+        closed: Whether the gate is drawn closed, with its bars across the opening.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        bars: Number of vertical bars of the closed gate.
+        noise: Standard deviation of the Gaussian pixel noise, 0 for none.
+        blur: Gaussian blur kernel size in pixels, 0 for none. Even sizes are
+            rounded up to the next odd size.
+        seed: Seed of the noise, so the same scene always gives the same frame.
+    """
+    closed: bool = True
+    width: int = 640
+    height: int = 480
+    bars: int = 16
+    noise: float = 0.0
+    blur: int = 0
+    seed: int = 0
+
+    @classmethod
+    def at(cls, resolution: str, **kwargs) -> "GateScene":
+        """
+        Create a scene at a named resolution.
+
+        Args:
+            resolution: One of the keys of RESOLUTIONS.
+            **kwargs: Other scene attributes.
+
+        Returns:
+            The scene.
+        """
+        width, height = RESOLUTIONS[resolution]
+        return cls(width=width, height=height, **kwargs)
+
+
+def render_gate(scene: GateScene) -> np.ndarray:
+    """
+    Draw a gate scene as a BGR frame.
+
+    An open gate shows the two posts and the ground line; a closed gate also
+    shows its bars across the opening, which is what the detector counts.
+
+    Args:
+        scene: The scene to draw.
+
+    Returns:
+        A height x width x 3 uint8 frame.
+    """
+    width, height = scene.width, scene.height
+    frame = np.full((height, width, 3), 60, dtype=np.uint8)
+    thickness = max(width // 160, 2)
+    top, bottom = height // 10, height - height // 10
+    left, right = width // 8, width - width // 8
+
+    # Ground line and gate posts
+    cv2.rectangle(frame, (0, bottom), (width - 1, bottom + thickness), (120, 120, 120), -1)
+    for x in (left, right):
+        cv2.rectangle(frame, (x - thickness, top), (x + thickness, bottom), (200, 200, 200), -1)
+
+    if scene.closed and scene.bars > 0:
+        # Top and bottom rails with evenly spaced bars between the posts
+        for y in (top + thickness * 2, bottom - thickness * 2):
+            cv2.rectangle(frame, (left, y - thickness // 2), (right, y + thickness // 2), (180, 180, 180), -1)
+        spacing = (right - left) / (scene.bars + 1)
+        for index in range(1, scene.bars + 1):
+            x = int(left + index * spacing)
+            cv2.rectangle(frame, (x - thickness // 2, top), (x + thickness // 2, bottom), (220, 220, 220), -1)
+
+    if scene.blur > 0:
+        kernel = scene.blur | 1
+        frame = cv2.GaussianBlur(frame, (kernel, kernel), 0)
+    if scene.noise > 0:
+        rng = np.random.default_rng(scene.seed)
+        noisy = frame.astype(np.float32) + rng.normal(0.0, scene.noise, frame.shape).astype(np.float32)
+        frame = np.clip(noisy, 0, 255).astype(np.uint8)
+    return frame
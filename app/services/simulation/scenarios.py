@@ -0,0 +1,109 @@
+"""
+Scripted camera scenarios.
+
+This module describes how a simulated camera behaves over time, as a cycle
+of steps that each set the gate state and the connection behaviour.
+"""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class ScenarioStep:
+    """
+    Camera behaviour for a stretch of time.
+
+    Attributes:
+        duration: Length of the step in seconds.
+        closed: Whether the gate is closed during the step.
+        latency: Mean connect delay in seconds.
+        jitter: Largest deviation from the mean delay in seconds.
+        failure_rate: Share of captures that fail to connect.
+        timeout_rate: Share of captures that hang until the open timeout.
+        frozen: Whether the stream keeps serving the last frame from before
+            the step, whatever the gate does.
+    """
+    duration: float
+    closed: bool = True
+    latency: float = 0.05
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    frozen: bool = False
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A cycle of steps a simulated camera plays in a loop.
+
+    Attributes:
+        name: The scenario name.
+        steps: The steps, played in order and repeated.
+    """
+    name: str
+    steps: Tuple[ScenarioStep, ...]
+
+    @property
+    def period(self) -> float:
+        """Length of one cycle in seconds."""
+        return sum(step.duration for step in self.steps)
+
+    def step_at(self, elapsed: float) -> ScenarioStep:
+        """
+        Get the step playing at a point in time.
+
+        Args:
+            elapsed: Seconds since the scenario started.
+
+        Returns:
+            The step playing at that time.
+        """
+        offset = elapsed % self.period if self.period > 0 else 0.0
+        for step in self.steps:
+            if offset < step.duration:
+                return step
+            offset -= step.duration
+        return self.steps[-1]
+
+    @classmethod
+    def constant(
+        cls, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0, closed: bool = True
+    ) -> "Scenario":
+        """
+        Create a scenario that behaves the same all the time.
+
+        Args:
+            latency: Mean connect delay in seconds.
+            jitter: Largest deviation from the mean delay in seconds.
+            failure_rate: Share of captures that fail to connect.
+            closed: Whether the gate is closed.
+
+        Returns:
+            The scenario.
+        """
+        return cls("constant", (ScenarioStep(
+            duration=1.0, closed=closed, latency=latency, jitter=jitter, failure_rate=failure_rate
+        ),))
+
+
+# Built-in scenarios, selectable with SIMULATED_SCENARIO
+SCENARIOS: Dict[str, Scenario] = {
+    "steady": Scenario("steady", (ScenarioStep(duration=60),)),
+    "gate_cycle": Scenario("gate_cycle", (
+        ScenarioStep(duration=30, closed=True),
+        ScenarioStep(duration=30, closed=False),
+    )),
+    "slow_connect": Scenario("slow_connect", (
+        ScenarioStep(duration=60, latency=2.0, jitter=1.0),
+    )),
+    "flaky": Scenario("flaky", (
+        ScenarioStep(duration=20, closed=True, latency=0.1, jitter=0.05),
+        ScenarioStep(duration=20, closed=False, latency=0.5, jitter=0.3, failure_rate=0.1, timeout_rate=0.2),
+    )),
+    "frozen_stream": Scenario("frozen_stream", (
+        ScenarioStep(duration=20, closed=True),
+        ScenarioStep(duration=20, closed=False, frozen=True),
+        ScenarioStep(duration=20, closed=False),
+    )),
+}
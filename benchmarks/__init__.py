@@ -0,0 +1,6 @@
+"""
+Benchmarks for the gate detector.
+
+Run a benchmark as a module from the repository root, for example
+`python -m benchmarks.detection --output detection.json`.
+"""
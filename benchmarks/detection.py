@@ -0,0 +1,212 @@
+"""
+Detection micro-benchmark.
+
+This module measures per-frame latency, throughput and peak memory of every
+detection engine on synthetic gate frames, across resolutions, gate states
+and image quality, and writes the results as JSON so runs from different
+commits can be compared.
+
+Usage:
+    python -m benchmarks.detection --output detection.json
+    python -m benchmarks.detection --resolutions 480p 1080p --repeat 50
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import cv2
+import numpy as np
+
+from app.domain.models import GateStatus
+from app.services.gate_detector.detector import OpenCVDetectionService
+from app.services.gate_detector.interfaces import DetectionService
+from app.services.simulation.frames import RESOLUTIONS, GateScene, render_gate
+
+# Detection engines under test, by name
+ENGINES: Dict[str, Callable[[], DetectionService]] = {
+    "hough": OpenCVDetectionService,
+}
+
+# Image quality profiles as (noise standard deviation, blur kernel size)
+PROFILES: Dict[str, tuple] = {
+    "clean": (0.0, 0),
+    "noisy": (10.0, 5),
+    "degraded": (25.0, 9),
+}
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Get a percentile of the samples by nearest rank."""
+    ordered = sorted(samples)
+    index = min(int(round(percent / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def run_case(
+    engine: DetectionService,
+    frame: np.ndarray,
+    expected: GateStatus,
+    repeat: int,
+    warmup: int = 2
+) -> Dict[str, Any]:
+    """
+    Benchmark one engine on one frame.
+
+    Peak memory is measured with tracemalloc in a separate pass, so tracing
+    does not slow down the timed runs. It covers Python and NumPy
+    allocations; memory OpenCV allocates internally is not traced.
+
+    Args:
+        engine: The detection engine.
+        frame: The frame to analyse.
+        expected: The status the frame was drawn with.
+        repeat: Number of timed runs.
+        warmup: Number of untimed runs first.
+
+    Returns:
+        Latency statistics in milliseconds, throughput in frames per second,
+        peak traced memory in bytes and whether the detected status matched.
+    """
+    for _ in range(warmup):
+        engine.detect_gate_status(frame)
+
+    latencies = []
+    status = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        status = engine.detect_gate_status(frame)
+        latencies.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        engine.detect_gate_status(frame)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    milliseconds = [latency * 1000 for latency in latencies]
+    return {
+        "runs": repeat,
+        "mean_ms": statistics.fmean(milliseconds),
+        "p50_ms": percentile(milliseconds, 50),
+        "p95_ms": percentile(milliseconds, 95),
+        "min_ms": min(milliseconds),
+        "max_ms": max(milliseconds),
+        "throughput_fps": repeat / sum(latencies),
+        "peak_traced_bytes": peak,
+        "frame_bytes": frame.nbytes,
+        "correct": status == expected,
+    }
+
+
+def run(
+    engines: Iterable[str],
+    resolutions: Iterable[str],
+    profiles: Iterable[str],
+    bars: int = 16,
+    repeat: int = 20,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark every combination of engine, resolution, gate state and profile.
+
+    Args:
+        engines: Names of the engines to run.
+        resolutions: Names of the resolutions to draw.
+        profiles: Names of the image quality profiles.
+        bars: Number of bars of the closed gate.
+        repeat: Number of timed runs per case.
+        seed: Seed of the frame noise.
+
+    Returns:
+        One result per case.
+    """
+    results = []
+    for engine_name in engines:
+        engine = ENGINES[engine_name]()
+        for resolution in resolutions:
+            for profile in profiles:
+                noise, blur = PROFILES[profile]
+                for closed in (True, False):
+                    scene = GateScene.at(
+                        resolution, closed=closed, bars=bars, noise=noise, blur=blur, seed=seed
+                    )
+                    expected = GateStatus.CLOSED if closed else GateStatus.OPEN
+                    result = run_case(engine, render_gate(scene), expected, repeat)
+                    results.append({
+                        "engine": engine_name,
+                        "resolution": resolution,
+                        "profile": profile,
+                        "gate": expected.value.lower(),
+                        "bars": bars,
+                        **result,
+                    })
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe where the benchmark ran, so results can be matched to a build.
+
+    Returns:
+        The commit, interpreter, library versions and machine.
+    """
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_threads": cv2.getNumThreads(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+
+    Returns:
+        The exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=sorted(ENGINES))
+    parser.add_argument("--resolutions", nargs="+", choices=list(RESOLUTIONS), default=list(RESOLUTIONS))
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--bars", type=int, default=16, help="Bars of the closed gate")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the frame noise")
+    parser.add_argument("--output", help="File to write the JSON results to, defaults to stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "benchmark": "detection",
+        "environment": environment(),
+        "results": run(args.engines, args.resolutions, args.profiles, args.bars, args.repeat, args.seed),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
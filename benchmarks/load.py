@@ -0,0 +1,313 @@
+"""
+End-to-end load test of the gate check API.
+
+This module starts the API in-process on a local port with a simulated
+camera behind the real supervisor, circuit breakers and admission control,
+drives POST /gate/check at a target concurrency, and reports latency
+percentiles, error rates and CPU and memory use as JSON. It needs no camera
+and no network beyond the loopback interface.
+
+Usage:
+    python -m benchmarks.load --concurrency 32 --duration 30 --latency 0.2 --jitter 0.1
+    python -m benchmarks.load --requests 500 --failure-rate 0.05 --output load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import socket
+import sys
+import threading
+import time
+from collections import Counter as Tally
+from typing import Any, Dict, List, Optional
+
+import httpx
+import uvicorn
+
+from app.api import dependencies
+from app.core.config import settings
+from app.main import app
+from app.services.gate_detector.breaker import CircuitBreakerCameraService
+from app.services.gate_detector.detector import OpenCVGateDetectorService
+from app.services.gate_detector.supervisor import SupervisedCameraService
+from app.services.simulation.camera import SimulatedCameraService
+from app.services.simulation.frames import GateScene
+from app.services.simulation.scenarios import SCENARIOS
+from benchmarks.detection import environment, percentile
+
+
+def _free_port() -> int:
+    """Get a free TCP port on the loopback interface."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _memory() -> Dict[str, int]:
+    """Read the current and peak resident set size of the process, in bytes."""
+    values = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return {"rss_bytes": values.get("VmRSS", 0), "peak_rss_bytes": values.get("VmHWM", 0)}
+
+
+def _cpu_seconds() -> float:
+    """Get the user and system CPU time used by the process so far."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class ApiServer:
+    """The API served by uvicorn on a background thread."""
+
+    def __init__(self, port: int):
+        """
+        Initialize the server.
+
+        Args:
+            port: The loopback port to listen on.
+        """
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(
+            app, host="127.0.0.1", port=port, log_level="warning", access_log=False
+        ))
+        self._thread = threading.Thread(target=self._server.run, name="load-api", daemon=True)
+
+    def __enter__(self) -> "ApiServer":
+        """Start the server and wait until it accepts connections."""
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("API server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the server."""
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+async def drive(
+    url: str,
+    token: str,
+    concurrency: int,
+    duration: Optional[float],
+    requests: Optional[int],
+    cameras: int
+) -> List[Dict[str, Any]]:
+    """
+    Send gate checks from concurrent clients until the duration or count is reached.
+
+    Args:
+        url: The base URL of the API.
+        token: The API token.
+        concurrency: Number of checks in flight at once.
+        duration: Seconds to run for, if set.
+        requests: Total checks to send, if set.
+        cameras: Number of distinct camera addresses to spread checks over.
+
+    Returns:
+        One sample per check with its latency and outcome.
+    """
+    samples: List[Dict[str, Any]] = []
+    sent = 0
+    end = time.monotonic() + duration if duration else None
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    def more() -> bool:
+        if requests is not None and sent >= requests:
+            return False
+        return end is None or time.monotonic() < end
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=None) as client:
+        async def worker(index: int) -> None:
+            nonlocal sent
+            while more():
+                sent += 1
+                body = {
+                    "username": "load",
+                    "password": "load",
+                    "ip_address": f"10.99.0.{sent % cameras + 1}",
+                }
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/gate/check",
+                        json=body,
+                        headers={"Authorization": f"Bearer {token}", "X-Client-ID": f"load-{index}"}
+                    )
+                    outcome = str(response.status_code)
+                    if response.status_code == 200 and response.json()["status"] is None:
+                        outcome = "200-error"
+                except httpx.HTTPError as e:
+                    outcome = type(e).__name__
+                samples.append({"latency": time.perf_counter() - started, "outcome": outcome})
+
+        await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return samples
+
+
+def summarize(samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """
+    Summarize the samples of a run.
+
+    Args:
+        samples: One sample per check.
+        elapsed: Wall-clock duration of the run in seconds.
+
+    Returns:
+        Request counts, throughput, latency percentiles in milliseconds and
+        the share of each outcome.
+    """
+    latencies = [sample["latency"] * 1000 for sample in samples] or [0.0]
+    outcomes = Tally(sample["outcome"] for sample in samples)
+    total = len(samples)
+    return {
+        "requests": total,
+        "elapsed_s": elapsed,
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies),
+        "outcomes": dict(outcomes),
+        "error_rate": (total - outcomes.get("200", 0)) / total if total else 0.0,
+    }
+
+
+def run(
+    concurrency: int = 16,
+    duration: Optional[float] = 10.0,
+    requests: Optional[int] = None,
+    cameras: int = 8,
+    latency: float = 0.1,
+    jitter: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+    scenario: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run a load test against an in-process API with a simulated camera.
+
+    CPU and memory figures cover the whole process, so they include the load
+    generator as well as the API.
+
+    Args:
+        concurrency: Number of checks in flight at once.
+        duration: Seconds to run for, if set.
+        requests: Total checks to send, if set.
+        cameras: Number of distinct camera addresses.
+        latency: Mean simulated connect delay in seconds.
+        jitter: Largest deviation from the mean delay in seconds.
+        failure_rate: Share of simulated captures that fail.
+        seed: Seed of the simulated camera.
+        scenario: Name of a scripted camera scenario to play instead of the
+            constant latency, jitter and failure rate.
+
+    Returns:
+        The run parameters, the summary and the resource use.
+    """
+    camera = SimulatedCameraService(
+        latency=latency, jitter=jitter, failure_rate=failure_rate, scene=GateScene(), seed=seed,
+        scenario=SCENARIOS[scenario] if scenario else None
+    )
+    detector = OpenCVGateDetectorService(
+        camera_service=CircuitBreakerCameraService(SupervisedCameraService(camera))
+    )
+    dependencies.set_gate_detector_service_for_testing(detector)
+    try:
+        with ApiServer(_free_port()) as server:
+            cpu_started = _cpu_seconds()
+            started = time.monotonic()
+            samples = asyncio.run(drive(
+                f"http://127.0.0.1:{server.port}", settings.api_token,
+                concurrency, duration, requests, cameras
+            ))
+            elapsed = time.monotonic() - started
+            cpu = _cpu_seconds() - cpu_started
+    finally:
+        dependencies.set_gate_detector_service_for_testing(None)
+
+    return {
+        "parameters": {
+            "concurrency": concurrency,
+            "duration_s": duration,
+            "requests": requests,
+            "cameras": cameras,
+            "latency_s": latency,
+            "jitter_s": jitter,
+            "failure_rate": failure_rate,
+            "seed": seed,
+            "scenario": scenario,
+        },
+        "summary": summarize(samples, elapsed),
+        "resources": {
+            "cpu_seconds": cpu,
+            "cpu_utilization": cpu / elapsed if elapsed else 0.0,
+            "cpu_count": os.cpu_count(),
+            **_memory(),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the load test from the command line.
+
+    Admission limits, timeouts and the like are read from the usual
+    environment variables, so they can be varied between runs.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+
+    Returns:
+        The exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", type=int, default=16, help="Checks in flight at once")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run for")
+    parser.add_argument("--requests", type=int, help="Total checks to send instead of a duration")
+    parser.add_argument("--cameras", type=int, default=8, help="Distinct camera addresses")
+    parser.add_argument("--latency", type=float, default=0.1, help="Mean connect delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Connect delay jitter in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of failing captures")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the simulated camera")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), help="Scripted camera scenario")
+    parser.add_argument("--output", help="File to write the JSON report to, defaults to stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "benchmark": "load",
+        "environment": environment(),
+        **run(
+            concurrency=args.concurrency,
+            duration=None if args.requests else args.duration,
+            requests=args.requests,
+            cameras=args.cameras,
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            seed=args.seed,
+            scenario=args.scenario,
+        ),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,6 +67,9 @@ def mock_cv2_video_capture(monkeypatch):
             import numpy as np
             return True, np.zeros((480, 640, 3), dtype=np.uint8)
 
+        def set(self, prop, value):
+            return True
+
         def release(self):
             pass
 
@@ -3,11 +3,24 @@ Tests for API dependencies.
 
 This module contains tests for the API dependency injection functions.
 """
+import os
+from unittest.mock import patch
+
 import pytest
 
-from app.api.dependencies import get_gate_detector_service, set_gate_detector_service_for_testing
+from app.api.dependencies import (
+    create_capture_service,
+    get_camera_service,
+    get_gate_detector_service,
+    set_gate_detector_service_for_testing
+)
+from app.services.gate_detector.breaker import CircuitBreakerCameraService
 from app.services.gate_detector.detector import OpenCVGateDetectorService
 from app.services.gate_detector.interfaces import GateDetectorService
+from app.services.gate_detector.camera import OpenCVCameraService
+from app.services.gate_detector.supervisor import SupervisedCameraService
+from app.services.recording.camera import RecordingCameraService, ReplayCameraService
+from app.services.simulation.camera import SimulatedCameraService
 
 
 class TestDependencies:
@@ -23,6 +36,15 @@ class TestDependencies:
 
         # Verify it's the default implementation
         assert isinstance(service, OpenCVGateDetectorService)
+        assert service.camera_service is get_camera_service()
+
+    def test_get_camera_service_is_shared(self):
+        """Test that the supervised camera service is shared between calls."""
+        service = get_camera_service()
+
+        assert isinstance(service, CircuitBreakerCameraService)
+        assert isinstance(service.camera_service, SupervisedCameraService)
+        assert get_camera_service() is service
 
     def test_get_gate_detector_service_mock(self):
         """Test that get_gate_detector_service returns the mock service when set."""
@@ -41,3 +63,31 @@ class TestDependencies:
 
         # Clean up
         set_gate_detector_service_for_testing(None)
+
+    def test_create_capture_service_backends(self):
+        """Test that the camera backend is chosen by configuration."""
+        with patch.dict(os.environ, {"CAMERA_BACKEND": "opencv"}):
+            assert isinstance(create_capture_service(), OpenCVCameraService)
+
+        with patch.dict(os.environ, {"CAMERA_BACKEND": "Simulated", "SIMULATED_SCENARIO": "flaky"}):
+            service = create_capture_service()
+            assert isinstance(service, SimulatedCameraService)
+            assert service.scenario.name == "flaky"
+
+        with patch.dict(os.environ, {"CAMERA_BACKEND": "carrier-pigeon"}):
+            with pytest.raises(ValueError):
+                create_capture_service()
+
+    def test_create_capture_service_recording(self, tmp_path):
+        """Test that live captures are recorded when a recording directory is set."""
+        with patch.dict(os.environ, {"CAMERA_BACKEND": "opencv", "RECORDING_DIR": str(tmp_path)}):
+            service = create_capture_service()
+            assert isinstance(service, RecordingCameraService)
+            assert isinstance(service.camera_service, OpenCVCameraService)
+            assert service.recorder.directory == str(tmp_path)
+
+        # Replays are never recorded again
+        with patch.dict(os.environ, {"CAMERA_BACKEND": "replay", "RECORDING_DIR": str(tmp_path)}):
+            service = create_capture_service()
+            assert isinstance(service, ReplayCameraService)
+            assert service.directory == str(tmp_path)
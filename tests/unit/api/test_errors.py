@@ -8,15 +8,19 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 from app.api.errors import (
+    admission_rejected_error_handler,
     gate_detector_exception_handler,
     camera_connection_error_handler,
+    circuit_open_error_handler,
     frame_capture_error_handler,
     gate_detection_error_handler,
     register_exception_handlers
 )
 from app.core.exceptions import (
+    AdmissionRejectedError,
     GateDetectorException,
     CameraConnectionError,
+    CircuitOpenError,
     FrameCaptureError,
     GateDetectionError
 )
@@ -67,6 +71,26 @@ class TestErrorHandlers:
         assert '"status":null' in content_str
         assert '"message":"Connection error"' in content_str
 
+    def test_circuit_open_error_handler(self):
+        """Test the circuit open error handler."""
+        # Create a mock request
+        request = Request({"type": "http"})
+
+        # Create an exception
+        exc = CircuitOpenError("Breaker open", retry_after=2.2)
+
+        # Call the handler
+        import asyncio
+        response = asyncio.run(circuit_open_error_handler(request, exc))
+
+        # Verify the response
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "3"
+        content_str = response.body.decode('utf-8')
+        assert '"status":null' in content_str
+        assert '"message":"Breaker open"' in content_str
+
     def test_frame_capture_error_handler(self):
         """Test the frame capture error handler."""
         # Create a mock request
@@ -109,6 +133,26 @@ class TestErrorHandlers:
         assert '"status":null' in content_str
         assert '"message":"Detection error"' in content_str
 
+    def test_admission_rejected_error_handler(self):
+        """Test the admission rejected error handler."""
+        # Create a mock request
+        request = Request({"type": "http"})
+
+        # Create an exception
+        exc = AdmissionRejectedError("Queue full", retry_after=0.2)
+
+        # Call the handler
+        import asyncio
+        response = asyncio.run(admission_rejected_error_handler(request, exc))
+
+        # Verify the response
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "1"
+        content_str = response.body.decode('utf-8')
+        assert '"status":null' in content_str
+        assert '"message":"Queue full"' in content_str
+
     def test_register_exception_handlers(self):
         """Test registering exception handlers with the app."""
         # Create a mock app
@@ -127,5 +171,7 @@ class TestErrorHandlers:
         # Verify handlers were registered
         assert app.exception_handlers[GateDetectorException] == gate_detector_exception_handler
         assert app.exception_handlers[CameraConnectionError] == camera_connection_error_handler
+        assert app.exception_handlers[CircuitOpenError] == circuit_open_error_handler
         assert app.exception_handlers[FrameCaptureError] == frame_capture_error_handler
         assert app.exception_handlers[GateDetectionError] == gate_detection_error_handler
+        assert app.exception_handlers[AdmissionRejectedError] == admission_rejected_error_handler
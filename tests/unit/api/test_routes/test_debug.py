@@ -0,0 +1,66 @@
+"""
+Tests for the debug API routes.
+
+This module contains tests for the profiler and thread snapshot endpoints.
+"""
+from fastapi import status
+
+from app.services.diagnostics.profiler import StackSampler
+
+
+class TestDebugAPI:
+    """Tests for the debug API endpoints."""
+
+    def test_profile(self, test_client, api_token):
+        """Test that a profile returns collapsed stacks."""
+        response = test_client.get(
+            "/debug/profile?seconds=0.05",
+            headers={"Authorization": f"Bearer {api_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        lines = response.text.splitlines()
+        assert lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_profile_busy(self, test_client, api_token):
+        """Test that a profile is refused with 409 while another one runs."""
+        from app.api.dependencies import get_stack_sampler
+
+        # Setup a sampler that is already profiling
+        sampler = StackSampler(rate=10, max_seconds=1)
+        sampler._running.acquire()  # pylint: disable=protected-access
+        test_client.app.dependency_overrides[get_stack_sampler] = lambda: sampler
+
+        try:
+            response = test_client.get(
+                "/debug/profile?seconds=1",
+                headers={"Authorization": f"Bearer {api_token}"}
+            )
+        finally:
+            test_client.app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_profile_unauthorized(self, test_client):
+        """Test that profiling requires authentication."""
+        response = test_client.get(
+            "/debug/profile?seconds=0.01",
+            headers={"Authorization": "Bearer invalid-token"}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_threads(self, test_client, api_token):
+        """Test the thread snapshot."""
+        response = test_client.get(
+            "/debug/threads",
+            headers={"Authorization": f"Bearer {api_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        names = [thread["name"] for thread in result["threads"]]
+        assert "MainThread" in names
+        assert all(thread["stack"] for thread in result["threads"])
+        assert isinstance(result["capture_workers"], list)
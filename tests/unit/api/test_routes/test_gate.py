@@ -4,9 +4,10 @@ Tests for the gate API routes.
 This module contains tests for the gate-related API endpoints.
 """
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from fastapi import status
 
+from app.core.exceptions import CameraConnectionError, CircuitOpenError
 from app.domain.models import GateStatus
 
 
@@ -122,3 +123,159 @@ class TestGateAPI:
         result = response.json()
         assert result["status"] is None
         assert "Error checking gate status: Test error" in result["message"]
+
+    def test_check_gate_circuit_open(self, test_client, mock_gate_detector, api_token):
+        """Test that an open circuit breaker is reported as 503 with Retry-After."""
+        # Setup mock to fail fast
+        mock_gate_detector.check_gate_status = MagicMock(
+            side_effect=CircuitOpenError("Camera is unavailable", retry_after=4)
+        )
+
+        # Make request
+        response = test_client.post(
+            "/gate/check",
+            headers={"Authorization": f"Bearer {api_token}"},
+            json={
+                "username": "test",
+                "password": "test",
+                "ip_address": "192.168.1.100"
+            }
+        )
+
+        # Assertions
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "4"
+        assert response.json() == {"status": None, "message": "Camera is unavailable"}
+
+    def test_check_gate_queue_full(self, test_client, mock_gate_detector, api_token):
+        """Test that a check is rejected with 429 when the admission queue is full."""
+        from app.api.dependencies import get_admission_controller
+        from app.services.scheduling.admission import AdmissionController
+
+        # Setup a controller with its only slot taken and no queue
+        controller = AdmissionController(max_concurrency=1, max_queue=0, per_camera_limit=1)
+        controller.acquire("192.168.1.200:554")
+        test_client.app.dependency_overrides[get_admission_controller] = lambda: controller
+
+        try:
+            response = test_client.post(
+                "/gate/check",
+                headers={"Authorization": f"Bearer {api_token}"},
+                json={
+                    "username": "test",
+                    "password": "test",
+                    "ip_address": "192.168.1.100"
+                }
+            )
+        finally:
+            test_client.app.dependency_overrides.clear()
+
+        # Assertions
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["status"] is None
+        assert mock_gate_detector.last_credentials is None
+
+    def test_check_gate_client_rate_limit(self, test_client, mock_gate_detector, api_token):
+        """Test that a client over its rate gets 429 without affecting other clients."""
+        from app.api.dependencies import get_admission_controller
+        from app.services.scheduling.admission import AdmissionController
+        from app.services.scheduling.fairness import ClientRateLimiter
+
+        # Setup a controller allowing one check per client
+        controller = AdmissionController(rate_limiter=ClientRateLimiter(rate=0.001, burst=1, weights={}))
+        test_client.app.dependency_overrides[get_admission_controller] = lambda: controller
+        body = {"username": "test", "password": "test", "ip_address": "192.168.1.100"}
+
+        try:
+            statuses = [
+                test_client.post(
+                    "/gate/check",
+                    headers={"Authorization": f"Bearer {api_token}", "X-Client-ID": client},
+                    json=body
+                ).status_code
+                for client in ("poller", "poller", "dashboard")
+            ]
+        finally:
+            test_client.app.dependency_overrides.clear()
+
+        # Assertions
+        assert statuses == [
+            status.HTTP_200_OK,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            status.HTTP_200_OK
+        ]
+
+    def test_check_gate_debug_timing(self, test_client, api_token):
+        """Test that debug timing adds a Server-Timing header and a timings block on request."""
+        import numpy as np
+        from app.api.dependencies import set_gate_detector_service_for_testing
+        from app.services.gate_detector.detector import OpenCVGateDetectorService
+
+        # Setup a detector whose camera returns a blank frame
+        camera_service = MagicMock()
+        camera_service.get_rtsp_uri.return_value = "rtsp://test"
+        camera_service.capture_frame.return_value = np.zeros((48, 64, 3), dtype=np.uint8)
+        set_gate_detector_service_for_testing(OpenCVGateDetectorService(camera_service=camera_service))
+        body = {"username": "test", "password": "test", "ip_address": "192.168.1.100"}
+
+        try:
+            plain = test_client.post(
+                "/gate/check", headers={"Authorization": f"Bearer {api_token}"}, json=body
+            )
+            timed = test_client.post(
+                "/gate/check",
+                headers={"Authorization": f"Bearer {api_token}", "X-Debug-Timing": "1"},
+                json=body
+            )
+            flagged = test_client.post(
+                "/gate/check?debug_timing=true",
+                headers={"Authorization": f"Bearer {api_token}"},
+                json=body
+            )
+        finally:
+            set_gate_detector_service_for_testing(None)
+
+        # Without the flag the response is unchanged
+        assert "Server-Timing" not in plain.headers
+        assert plain.json() == {"status": "Open", "message": "Gate status: Open"}
+
+        # With the header or the query flag the breakdown is attached
+        for response in (timed, flagged):
+            assert response.status_code == status.HTTP_200_OK
+            assert "canny;dur=" in response.headers["Server-Timing"]
+            assert 'vertical_lines;desc="0"' in response.headers["Server-Timing"]
+            timings = response.json()["timings"]
+            assert set(timings["stages_ms"]) == {"uri", "cvt_color", "canny", "hough"}
+            assert (timings["frame_width"], timings["frame_height"]) == (64, 48)
+            assert timings["vertical_lines"] == 0
+
+    def test_list_breakers(self, test_client, api_token):
+        """Test the circuit breaker listing endpoint."""
+        from app.api.dependencies import get_circuit_breaker_service
+        from app.services.gate_detector.breaker import CircuitBreakerCameraService
+
+        # Setup a breaker service with one failing camera
+        camera_service = MagicMock()
+        camera_service.capture_frame.side_effect = CameraConnectionError()
+        breakers = CircuitBreakerCameraService(camera_service, failure_threshold=1, backoff=10, max_backoff=10)
+        with pytest.raises(CameraConnectionError):
+            breakers.capture_frame("rtsp://u:p@192.168.1.100:554/stream")
+        test_client.app.dependency_overrides[get_circuit_breaker_service] = lambda: breakers
+
+        try:
+            response = test_client.get(
+                "/gate/breakers",
+                headers={"Authorization": f"Bearer {api_token}"}
+            )
+        finally:
+            test_client.app.dependency_overrides.clear()
+
+        # Assertions
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert len(result) == 1
+        assert result[0]["endpoint"] == "192.168.1.100:554"
+        assert result[0]["state"] == "open"
+        assert result[0]["consecutive_failures"] == 1
+        assert 0 < result[0]["retry_in"] <= 10
@@ -0,0 +1,24 @@
+"""
+Tests for the metrics API routes.
+
+This module contains tests for the Prometheus metrics endpoint.
+"""
+from fastapi import status
+
+
+class TestMetricsAPI:
+    """Tests for the metrics API endpoints."""
+
+    def test_metrics(self, test_client):
+        """Test the metrics endpoint."""
+        response = test_client.get("/metrics")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE gate_camera_capture_attempts_total counter" in response.text
+
+    def test_metrics_export_stages_and_errors(self, test_client):
+        """Test that stage timings and exception counters are exported."""
+        response = test_client.get("/metrics")
+        assert "# TYPE gate_stage_duration_seconds histogram" in response.text
+        assert "# TYPE gate_stage_in_flight gauge" in response.text
+        assert 'gate_errors_total{type="CameraTimeoutError"}' in response.text
@@ -0,0 +1,39 @@
+"""
+Tests for the detection benchmark.
+
+This module contains a smoke test of the benchmark runner.
+"""
+import json
+
+from benchmarks import detection
+
+
+class TestDetectionBenchmark:
+    """Tests for the detection benchmark."""
+
+    def test_run(self):
+        """Test that every case reports latency, throughput, memory and accuracy."""
+        results = detection.run(["hough"], ["480p"], ["clean"], repeat=2)
+
+        assert [(result["gate"], result["correct"]) for result in results] == [
+            ("closed", True), ("open", True)
+        ]
+        for result in results:
+            assert result["runs"] == 2
+            assert 0 < result["min_ms"] <= result["p50_ms"] <= result["max_ms"]
+            assert result["throughput_fps"] > 0
+            assert result["peak_traced_bytes"] > 0
+
+    def test_main_writes_json(self, tmp_path):
+        """Test that the command line writes a JSON report."""
+        output = tmp_path / "detection.json"
+
+        status = detection.main([
+            "--resolutions", "480p", "--profiles", "clean", "--repeat", "1", "--output", str(output)
+        ])
+
+        report = json.loads(output.read_text())
+        assert status == 0
+        assert report["benchmark"] == "detection"
+        assert "opencv" in report["environment"]
+        assert len(report["results"]) == 2
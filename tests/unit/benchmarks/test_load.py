@@ -0,0 +1,40 @@
+"""
+Tests for the load test harness.
+
+This module contains tests for the load test summary and a short run.
+"""
+import pytest
+
+from benchmarks import load
+
+
+class TestLoadHarness:
+    """Tests for the load test harness."""
+
+    def test_summarize(self):
+        """Test latency percentiles and error rates of a run."""
+        samples = [{"latency": index / 1000, "outcome": "200"} for index in range(1, 98)]
+        samples += [
+            {"latency": 0.5, "outcome": "429"},
+            {"latency": 0.6, "outcome": "200-error"},
+            {"latency": 0.7, "outcome": "ConnectError"},
+        ]
+
+        summary = load.summarize(samples, elapsed=2.0)
+
+        assert summary["requests"] == 100
+        assert summary["throughput_rps"] == 50.0
+        assert summary["p50_ms"] == pytest.approx(51.0)
+        assert summary["p99_ms"] == pytest.approx(600.0)
+        assert summary["max_ms"] == pytest.approx(700.0)
+        assert summary["outcomes"] == {"200": 97, "429": 1, "200-error": 1, "ConnectError": 1}
+        assert summary["error_rate"] == 0.03
+
+    def test_run(self):
+        """Test a short run against the in-process API."""
+        report = load.run(concurrency=2, duration=None, requests=6, latency=0.0, failure_rate=1.0)
+
+        assert report["summary"]["requests"] == 6
+        assert report["summary"]["outcomes"].keys() <= {"200-error", "503"}
+        assert report["summary"]["error_rate"] == 1.0
+        assert report["resources"]["cpu_seconds"] > 0
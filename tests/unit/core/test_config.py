@@ -97,6 +97,200 @@ class TestSettings:
         with patch.dict(os.environ, {"LINE_THRESHOLD": "20"}, clear=True):
             assert settings.line_threshold == 20
 
+    def test_capture_timeout_properties(self):
+        """Test the check and RTSP timeout properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.check_timeout == 20.0
+            assert settings.rtsp_open_timeout_ms == 5000
+            assert settings.rtsp_read_timeout_ms == 5000
+            assert settings.rtsp_transport == "tcp"
+            assert settings.rtsp_buffer_size == 1
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "CHECK_TIMEOUT": "3",
+            "RTSP_OPEN_TIMEOUT_MS": "1500",
+            "RTSP_READ_TIMEOUT_MS": "800",
+            "RTSP_TRANSPORT": "UDP",
+            "RTSP_BUFFER_SIZE": "3"
+        }, clear=True):
+            assert settings.check_timeout == 3.0
+            assert settings.rtsp_open_timeout_ms == 1500
+            assert settings.rtsp_read_timeout_ms == 800
+            assert settings.rtsp_transport == "udp"
+            assert settings.rtsp_buffer_size == 3
+
+    def test_capture_workers_property(self):
+        """Test the capture_workers property."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default value
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.capture_workers == 4
+
+        # Test with environment variable
+        with patch.dict(os.environ, {"CAPTURE_WORKERS": "8"}, clear=True):
+            assert settings.capture_workers == 8
+
+    def test_capture_timeout_property(self):
+        """Test the capture_timeout property."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default value
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.capture_timeout == 15.0
+
+        # Test with environment variable
+        with patch.dict(os.environ, {"CAPTURE_TIMEOUT": "2.5"}, clear=True):
+            assert settings.capture_timeout == 2.5
+
+    def test_admission_properties(self):
+        """Test the admission control properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.max_concurrent_checks == 4
+            assert settings.max_queued_checks == 32
+            assert settings.camera_max_sessions == 2
+            assert settings.queue_timeout == 10.0
+            assert settings.interactive_reserved_checks == 1
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "MAX_CONCURRENT_CHECKS": "8",
+            "MAX_QUEUED_CHECKS": "0",
+            "CAMERA_MAX_SESSIONS": "1",
+            "QUEUE_TIMEOUT": "2.5",
+            "INTERACTIVE_RESERVED_CHECKS": "2"
+        }, clear=True):
+            assert settings.max_concurrent_checks == 8
+            assert settings.max_queued_checks == 0
+            assert settings.camera_max_sessions == 1
+            assert settings.queue_timeout == 2.5
+            assert settings.interactive_reserved_checks == 2
+
+    def test_client_properties(self):
+        """Test the per-client scheduling properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.client_rate == 10.0
+            assert settings.client_burst == 20.0
+            assert settings.client_weights == ""
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "CLIENT_RATE": "2",
+            "CLIENT_BURST": "4",
+            "CLIENT_WEIGHTS": "dashboard=3"
+        }, clear=True):
+            assert settings.client_rate == 2.0
+            assert settings.client_burst == 4.0
+            assert settings.client_weights == "dashboard=3"
+
+    def test_breaker_properties(self):
+        """Test the circuit breaker properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.breaker_failure_threshold == 5
+            assert settings.breaker_backoff == 1.0
+            assert settings.breaker_max_backoff == 60.0
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "BREAKER_FAILURE_THRESHOLD": "3",
+            "BREAKER_BACKOFF": "0.5",
+            "BREAKER_MAX_BACKOFF": "30"
+        }, clear=True):
+            assert settings.breaker_failure_threshold == 3
+            assert settings.breaker_backoff == 0.5
+            assert settings.breaker_max_backoff == 30.0
+
+    def test_profile_properties(self):
+        """Test the debug profiler properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.profile_sample_rate == 100.0
+            assert settings.profile_max_seconds == 60.0
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "PROFILE_SAMPLE_RATE": "50",
+            "PROFILE_MAX_SECONDS": "10"
+        }, clear=True):
+            assert settings.profile_sample_rate == 50.0
+            assert settings.profile_max_seconds == 10.0
+
+    def test_camera_backend_properties(self):
+        """Test the camera backend properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.camera_backend == "opencv"
+            assert settings.simulated_scenario == "steady"
+            assert settings.simulated_resolution == "480p"
+            assert settings.simulated_seed is None
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "CAMERA_BACKEND": "SIMULATED",
+            "SIMULATED_SCENARIO": "gate_cycle",
+            "SIMULATED_RESOLUTION": "1080p",
+            "SIMULATED_SEED": "42"
+        }, clear=True):
+            assert settings.camera_backend == "simulated"
+            assert settings.simulated_scenario == "gate_cycle"
+            assert settings.simulated_resolution == "1080p"
+            assert settings.simulated_seed == 42
+
+    def test_recording_properties(self):
+        """Test the frame recording and replay properties."""
+        # Create settings
+        settings = Settings()
+
+        # Test with default values
+        with patch.dict(os.environ, {}, clear=True):
+            assert settings.recording_dir == ""
+            assert settings.recording_slots == 256
+            assert settings.recording_width == 640
+            assert settings.recording_height == 360
+            assert settings.replay_start is None
+            assert settings.replay_end is None
+
+        # Test with environment variables
+        with patch.dict(os.environ, {
+            "RECORDING_DIR": "/var/lib/gate/rings",
+            "RECORDING_SLOTS": "64",
+            "RECORDING_WIDTH": "320",
+            "RECORDING_HEIGHT": "180",
+            "REPLAY_START": "1700000000",
+            "REPLAY_END": "1700000600.5"
+        }, clear=True):
+            assert settings.recording_dir == "/var/lib/gate/rings"
+            assert settings.recording_slots == 64
+            assert settings.recording_width == 320
+            assert settings.recording_height == 180
+            assert settings.replay_start == 1700000000.0
+            assert settings.replay_end == 1700000600.5
+
     def test_dict_method(self):
         """Test the dict method."""
         # Create settings
@@ -111,3 +305,6 @@ class TestSettings:
             assert "rtsp://{username}:{password}@{ip_address}:{port}" in settings_dict["rtsp_format"]
             assert settings_dict["debug"] is False
             assert settings_dict["line_threshold"] == 10
+            assert settings_dict["capture_workers"] == 4
+            assert settings_dict["capture_timeout"] == 15.0
+            assert settings_dict["breaker_failure_threshold"] == 5
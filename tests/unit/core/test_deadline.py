@@ -0,0 +1,32 @@
+"""
+Tests for the deadline module.
+
+This module contains tests for request deadline tracking.
+"""
+from app.core.deadline import budget, deadline_scope, remaining
+
+
+class TestDeadline:
+    """Tests for deadline scopes."""
+
+    def test_no_deadline(self):
+        """Test that timeouts are unchanged without a deadline."""
+        assert remaining() is None
+        assert budget(5) == 5
+
+    def test_deadline_scope(self):
+        """Test that a scope limits the budget and is reset on exit."""
+        with deadline_scope(2):
+            assert 0 < remaining() <= 2
+            assert budget(5) <= 2
+            assert budget(1) == 1
+        assert remaining() is None
+
+    def test_nested_scope_cannot_extend(self):
+        """Test that a nested scope can only shorten the deadline."""
+        with deadline_scope(1):
+            with deadline_scope(10):
+                assert remaining() <= 1
+            with deadline_scope(0):
+                assert remaining() == 0
+                assert budget(5) == 0
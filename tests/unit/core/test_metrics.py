@@ -0,0 +1,91 @@
+"""
+Tests for the metrics module.
+
+This module contains tests for the in-process metrics registry.
+"""
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+
+
+class TestMetrics:
+    """Tests for counters, gauges and histograms."""
+
+    def test_counter(self):
+        """Test an unlabelled counter."""
+        registry = Registry()
+        counter = Counter("test_total", "A test counter.", registry=registry)
+
+        counter.inc()
+        counter.inc(2)
+
+        assert registry.render() == (
+            "# HELP test_total A test counter.\n"
+            "# TYPE test_total counter\n"
+            "test_total 3\n"
+        )
+
+    def test_labelled_counter(self):
+        """Test a counter with labels, by position and by name."""
+        registry = Registry()
+        counter = Counter("test_total", "A test counter.", ["outcome"], registry=registry)
+
+        counter.labels("ok").inc()
+        counter.labels(outcome="ok").inc()
+        counter.labels("quote\"d").inc(0.5)
+
+        text = registry.render()
+        assert 'test_total{outcome="ok"} 2' in text
+        assert 'test_total{outcome="quote\\"d"} 0.5' in text
+
+    def test_gauge(self):
+        """Test gauge updates."""
+        registry = Registry()
+        gauge = Gauge("test_in_flight", "A test gauge.", ["camera"], registry=registry)
+
+        gauge.labels("a").inc(3)
+        gauge.labels("a").dec()
+        gauge.labels("b").set(7)
+
+        text = registry.render()
+        assert 'test_in_flight{camera="a"} 2' in text
+        assert 'test_in_flight{camera="b"} 7' in text
+
+    def test_histogram(self):
+        """Test histogram buckets, sum and count."""
+        registry = Registry()
+        histogram = Histogram(
+            "test_seconds", "A test histogram.", ["stage"], registry=registry, buckets=(0.1, 1.0)
+        )
+
+        histogram.labels("read").observe(0.05)
+        histogram.labels("read").observe(0.5)
+        histogram.labels("read").observe(5)
+
+        text = registry.render()
+        assert 'test_seconds_bucket{stage="read",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{stage="read",le="1"} 2' in text
+        assert 'test_seconds_bucket{stage="read",le="+Inf"} 3' in text
+        assert 'test_seconds_sum{stage="read"} 5.55' in text
+        assert 'test_seconds_count{stage="read"} 3' in text
+
+    def test_unlabelled_histogram(self):
+        """Test a histogram without labels."""
+        registry = Registry()
+        histogram = Histogram("test_seconds", "A test histogram.", registry=registry, buckets=(1.0,))
+
+        histogram.observe(2)
+
+        text = registry.render()
+        assert 'test_seconds_bucket{le="+Inf"} 1' in text
+        assert "test_seconds_count 1" in text
+
+    def test_duplicate_metric(self):
+        """Test that metric names are unique within a registry."""
+        registry = Registry()
+        Counter("test_total", "A test counter.", registry=registry)
+
+        with pytest.raises(ValueError):
+            Gauge("test_total", "Another metric.", registry=registry)
+
+        assert registry.get("test_total").kind == "counter"
@@ -0,0 +1,27 @@
+"""
+Tests for the security module.
+
+This module contains tests for client identification.
+"""
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.security import get_client_id
+
+
+class TestClientId:
+    """Tests for get_client_id."""
+
+    def test_header_takes_precedence(self):
+        """Test that the X-Client-ID header identifies the client."""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="secret")
+        assert get_client_id(credentials, " dashboard ") == "dashboard"
+
+    def test_token_digest(self):
+        """Test that the token is identified by a digest, not the token itself."""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="secret")
+
+        client = get_client_id(credentials, None)
+
+        assert client.startswith("token-")
+        assert "secret" not in client
+        assert client == get_client_id(credentials, None)
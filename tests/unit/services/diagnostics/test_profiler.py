@@ -0,0 +1,88 @@
+"""
+Tests for the sampling profiler.
+
+This module contains tests for the StackSampler and the thread dump.
+"""
+import threading
+import time
+
+import pytest
+
+from app.services.diagnostics.profiler import StackSampler, thread_dump
+
+
+def park(event):
+    """Block until the event is set, so the thread shows up in samples."""
+    event.wait()
+
+
+class TestStackSampler:
+    """Tests for the StackSampler."""
+
+    def test_sample_collects_thread_stacks(self):
+        """Test that samples of other threads are collapsed by thread and frame."""
+        release = threading.Event()
+        thread = threading.Thread(target=park, args=(release,), name="parked-thread")
+        thread.start()
+
+        try:
+            counts = StackSampler(rate=200, max_seconds=1).sample(0.05)
+        finally:
+            release.set()
+            thread.join()
+
+        parked = [stack for stack in counts if stack.startswith("parked-thread;")]
+        assert parked
+        assert any(";park (test_profiler.py:" in stack for stack in parked)
+        # The sampling thread leaves itself out
+        assert not any("in sample" in stack or ";sample (" in stack for stack in counts)
+
+    def test_sample_is_capped(self):
+        """Test that a profile never runs longer than the maximum."""
+        sampler = StackSampler(rate=1000, max_seconds=0)
+        started = time.monotonic()
+
+        sampler.sample(30)
+
+        assert time.monotonic() - started < 1
+        assert not sampler.busy
+
+    def test_one_profile_at_a_time(self):
+        """Test that a second profile is refused while one is running."""
+        sampler = StackSampler(rate=100, max_seconds=1)
+        started = threading.Thread(target=sampler.sample, args=(0.2,))
+        started.start()
+
+        try:
+            threading.Event().wait(0.05)
+            with pytest.raises(RuntimeError):
+                sampler.sample(0.01)
+        finally:
+            started.join()
+
+    def test_collapse(self):
+        """Test the collapsed stack format, most sampled stack first."""
+        text = StackSampler.collapse({"main;a;b": 2, "main;a": 5})
+
+        assert text == "main;a 5\nmain;a;b 2\n"
+
+
+class TestThreadDump:
+    """Tests for the thread dump."""
+
+    def test_thread_dump(self):
+        """Test that every thread is listed with the line it is blocked on."""
+        release = threading.Event()
+        thread = threading.Thread(target=park, args=(release,), name="parked-thread", daemon=True)
+        thread.start()
+
+        try:
+            dump = {entry["name"]: entry for entry in thread_dump()}
+        finally:
+            release.set()
+            thread.join()
+
+        assert dump["parked-thread"]["daemon"] is True
+        assert any("in park" in frame for frame in dump["parked-thread"]["stack"])
+        assert "threading.py" in dump["parked-thread"]["current"]
+        assert "MainThread" in dump
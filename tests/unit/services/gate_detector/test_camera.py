@@ -3,14 +3,32 @@ Tests for the camera service.
 
 This module contains tests for the camera service implementation.
 """
+import os
+import time
+
+import cv2
 import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock
 
 from app.core.config import settings
-from app.core.exceptions import CameraConnectionError, FrameCaptureError
+from app.core.deadline import deadline_scope
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError, FrameCaptureError
 from app.domain.models import CameraCredentials
-from app.services.gate_detector.camera import OpenCVCameraService
+from app.services.gate_detector.camera import CAPTURE_ATTEMPTS, OpenCVCameraService
+
+
+def expected_params(open_ms=5000, read_ms=5000):
+    """Build the capture parameters expected for the given timeouts."""
+    return [
+        cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, open_ms,
+        cv2.CAP_PROP_READ_TIMEOUT_MSEC, read_ms,
+    ]
+
+
+def attempts(outcome):
+    """Get the current value of the capture attempts counter for an outcome."""
+    return CAPTURE_ATTEMPTS.labels(outcome).value
 
 
 class TestOpenCVCameraService:
@@ -71,7 +89,8 @@ class TestOpenCVCameraService:
         assert result is not None
         assert isinstance(result, np.ndarray)
         assert result.shape == (480, 640, 3)
-        mock_video_capture.assert_called_once_with("rtsp://test")
+        mock_video_capture.assert_called_once_with("rtsp://test", cv2.CAP_FFMPEG, expected_params())
+        mock_cap.set.assert_called_once_with(cv2.CAP_PROP_BUFFERSIZE, settings.rtsp_buffer_size)
         mock_cap.release.assert_called_once()
 
     @patch('cv2.VideoCapture')
@@ -90,7 +109,7 @@ class TestOpenCVCameraService:
             service.capture_frame("rtsp://test")
 
         assert "Could not open RTSP stream" in str(exc_info.value)
-        mock_video_capture.assert_called_once_with("rtsp://test")
+        mock_video_capture.assert_called_once_with("rtsp://test", cv2.CAP_FFMPEG, expected_params())
         mock_cap.release.assert_called_once()
 
     @patch('cv2.VideoCapture')
@@ -110,5 +129,97 @@ class TestOpenCVCameraService:
             service.capture_frame("rtsp://test")
 
         assert "Could not read snapshot from RTSP stream" in str(exc_info.value)
-        mock_video_capture.assert_called_once_with("rtsp://test")
+        mock_video_capture.assert_called_once_with("rtsp://test", cv2.CAP_FFMPEG, expected_params())
         mock_cap.release.assert_called_once()
+
+    @patch('cv2.VideoCapture')
+    def test_capture_frame_deadline_shortens_timeouts(self, mock_video_capture):
+        """Test that the request deadline is passed down to the capture timeouts."""
+        # Setup mock
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        mock_video_capture.return_value = mock_cap
+
+        # Create service
+        service = OpenCVCameraService()
+
+        # Call function with less time left than the configured timeouts
+        with deadline_scope(1):
+            service.capture_frame("rtsp://test")
+
+        params = mock_video_capture.call_args[0][2]
+        assert params[0] == cv2.CAP_PROP_OPEN_TIMEOUT_MSEC
+        assert 900 < params[1] <= 1000
+        assert params[2] == cv2.CAP_PROP_READ_TIMEOUT_MSEC
+        assert 900 < params[3] <= 1000
+
+    @patch('cv2.VideoCapture')
+    def test_capture_frame_no_time_left(self, mock_video_capture):
+        """Test that no connection is attempted once the deadline has passed."""
+        service = OpenCVCameraService()
+        before = attempts("timeout")
+
+        with deadline_scope(0):
+            with pytest.raises(CameraTimeoutError):
+                service.capture_frame("rtsp://test")
+
+        mock_video_capture.assert_not_called()
+        assert attempts("timeout") == before + 1
+
+    @patch('cv2.VideoCapture')
+    def test_capture_frame_open_timeout(self, mock_video_capture):
+        """Test that an open which used up its timeout is reported as a timeout."""
+        # Setup mock that takes longer than the open timeout
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = False
+
+        def open_slowly(*args):
+            time.sleep(0.02)
+            return mock_cap
+
+        mock_video_capture.side_effect = open_slowly
+        service = OpenCVCameraService()
+        before = attempts("timeout")
+
+        with patch.dict(os.environ, {"RTSP_OPEN_TIMEOUT_MS": "10"}):
+            with pytest.raises(CameraTimeoutError) as exc_info:
+                service.capture_frame("rtsp://test")
+
+        assert "Timed out opening RTSP stream" in str(exc_info.value)
+        assert attempts("timeout") == before + 1
+        mock_cap.release.assert_called_once()
+
+    @patch('cv2.VideoCapture')
+    def test_capture_frame_read_timeout(self, mock_video_capture):
+        """Test that a read which used up its timeout is reported as a timeout."""
+        # Setup mock that takes longer than the read timeout
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+
+        def read_slowly():
+            time.sleep(0.02)
+            return False, None
+
+        mock_cap.read.side_effect = read_slowly
+        mock_video_capture.return_value = mock_cap
+        service = OpenCVCameraService()
+        before = attempts("timeout")
+
+        with patch.dict(os.environ, {"RTSP_READ_TIMEOUT_MS": "10"}):
+            with pytest.raises(CameraTimeoutError) as exc_info:
+                service.capture_frame("rtsp://test")
+
+        assert "Timed out reading from RTSP stream" in str(exc_info.value)
+        assert attempts("timeout") == before + 1
+
+    def test_transport_option(self):
+        """Test that the RTSP transport is passed to the FFmpeg backend."""
+        with patch.dict(os.environ, {"RTSP_TRANSPORT": "UDP"}, clear=True):
+            OpenCVCameraService()
+            assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == "rtsp_transport;udp"
+
+        # An explicit capture option is left alone
+        with patch.dict(os.environ, {"OPENCV_FFMPEG_CAPTURE_OPTIONS": "stimeout;1000"}, clear=True):
+            OpenCVCameraService()
+            assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == "stimeout;1000"
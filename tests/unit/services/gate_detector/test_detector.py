@@ -7,9 +7,10 @@ import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock
 
-from app.core.exceptions import GateDetectionError
+from app.core.exceptions import CircuitOpenError, GateDetectionError
 from app.domain.models import CameraCredentials, GateStatus, GateStatusResult
 from app.services.gate_detector.detector import OpenCVDetectionService, OpenCVGateDetectorService
+from app.services.gate_detector.instrumentation import STAGE_SECONDS, current_camera
 
 
 class TestOpenCVDetectionService:
@@ -186,3 +187,48 @@ class TestOpenCVGateDetectorService:
         mock_camera_service.get_rtsp_uri.assert_called_once_with(credentials)
         mock_camera_service.capture_frame.assert_not_called()
         mock_detection_service.detect_gate_status.assert_not_called()
+
+    def test_check_gate_status_circuit_open(self):
+        """Test that an open circuit breaker is not turned into an error result."""
+        # Create mock dependencies
+        mock_camera_service = MagicMock()
+        mock_camera_service.capture_frame.side_effect = CircuitOpenError(retry_after=5)
+
+        # Create service with mock dependencies
+        service = OpenCVGateDetectorService(camera_service=mock_camera_service)
+
+        # Create credentials
+        credentials = CameraCredentials(
+            username="user",
+            password="pass",
+            ip_address="192.168.1.100"
+        )
+
+        # Call function and check exception
+        with pytest.raises(CircuitOpenError):
+            service.check_gate_status(credentials)
+
+    def test_check_gate_status_labels_stages_with_camera(self):
+        """Test that the detection stages are timed under the camera endpoint."""
+        # Setup mock that reports the camera label seen during capture
+        mock_camera_service = MagicMock()
+        mock_camera_service.get_rtsp_uri.return_value = "rtsp://test"
+        mock_camera_service.capture_frame.side_effect = lambda rtsp_uri: (
+            seen.append(current_camera()) or np.zeros((48, 64, 3), dtype=np.uint8)
+        )
+        seen = []
+        before = sum(STAGE_SECONDS.labels("canny", "192.168.1.101:8554").counts)
+
+        # Create service with the real detection service
+        service = OpenCVGateDetectorService(camera_service=mock_camera_service)
+        credentials = CameraCredentials(
+            username="user", password="pass", ip_address="192.168.1.101", port=8554
+        )
+
+        # Call function
+        result = service.check_gate_status(credentials)
+
+        # Assertions
+        assert result.status == GateStatus.OPEN
+        assert seen == ["192.168.1.101:8554"]
+        assert sum(STAGE_SECONDS.labels("canny", "192.168.1.101:8554").counts) == before + 1
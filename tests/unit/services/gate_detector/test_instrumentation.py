@@ -0,0 +1,91 @@
+"""
+Tests for the gate check instrumentation.
+
+This module contains tests for the per-stage timers.
+"""
+import threading
+
+import pytest
+
+from app.services.gate_detector.instrumentation import (
+    STAGE_IN_FLIGHT,
+    STAGE_SECONDS,
+    StageTimings,
+    camera_scope,
+    collect_timings,
+    current_camera,
+    record,
+    stage
+)
+
+
+def observations(name, camera):
+    """Get the number of observations of a stage for a camera."""
+    return sum(STAGE_SECONDS.labels(name, camera).counts)
+
+
+class TestInstrumentation:
+    """Tests for the stage timers."""
+
+    def test_stage_records_duration_per_camera(self):
+        """Test that a stage is timed under the camera of the current scope."""
+        before = observations("test_stage", "10.0.0.1:554")
+
+        with camera_scope("10.0.0.1:554"):
+            assert current_camera() == "10.0.0.1:554"
+            with stage("test_stage"):
+                assert STAGE_IN_FLIGHT.labels("test_stage").value == 1
+
+        assert observations("test_stage", "10.0.0.1:554") == before + 1
+        assert STAGE_IN_FLIGHT.labels("test_stage").value == 0
+        assert current_camera() == "unknown"
+
+    def test_stage_records_failures(self):
+        """Test that a stage that raises is still timed and leaves the in-flight gauge."""
+        before = observations("test_failing_stage", "unknown")
+
+        with pytest.raises(RuntimeError):
+            with stage("test_failing_stage"):
+                raise RuntimeError("boom")
+
+        assert observations("test_failing_stage", "unknown") == before + 1
+        assert STAGE_IN_FLIGHT.labels("test_failing_stage").value == 0
+
+    def test_camera_scope_is_per_thread(self):
+        """Test that a camera scope does not leak into other threads."""
+        seen = []
+
+        with camera_scope("10.0.0.2:554"):
+            thread = threading.Thread(target=lambda: seen.append(current_camera()))
+            thread.start()
+            thread.join()
+
+        assert seen == ["unknown"]
+
+    def test_collect_timings(self):
+        """Test that a breakdown collects stages and details only while installed."""
+        timings = StageTimings()
+
+        with collect_timings(timings):
+            with stage("read"):
+                pass
+            with stage("read"):
+                pass
+            record("vertical_lines", 12)
+
+        # Nothing is collected outside of the block
+        with stage("canny"):
+            record("frame_width", 640)
+
+        assert list(timings.stages) == ["read"]
+        assert timings.stages["read"] >= 0
+        assert timings.values == {"vertical_lines": 12}
+        header = timings.server_timing()
+        assert header.startswith("read;dur=")
+        assert header.endswith('vertical_lines;desc="12"')
+
+    def test_collect_timings_off(self):
+        """Test that passing no breakdown leaves collection off."""
+        with collect_timings(None):
+            with stage("read"):
+                record("vertical_lines", 1)
@@ -0,0 +1,183 @@
+"""
+Tests for the supervised camera service.
+
+This module contains tests for the capture worker supervisor.
+"""
+import threading
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+
+from app.core.deadline import deadline_scope, remaining
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError, FrameCaptureError
+from app.domain.models import CameraCredentials
+from app.services.gate_detector.supervisor import CaptureWorker, SupervisedCameraService
+
+
+class TestCaptureWorker:
+    """Tests for the CaptureWorker."""
+
+    def test_submit_and_retire(self):
+        """Test that a worker runs jobs and exits once retired."""
+        worker = CaptureWorker("test-worker")
+
+        # Run a job
+        assert worker.submit(lambda x: x * 2, 21).result(timeout=1) == 42
+
+        # Retire the worker
+        worker.retire()
+        worker._thread.join(timeout=1)
+        assert worker.retired
+        assert not worker.alive
+
+    def test_cancelled_job_is_skipped(self):
+        """Test that a cancelled job is never run."""
+        worker = CaptureWorker("test-worker")
+        release = threading.Event()
+        func = MagicMock()
+
+        # Keep the worker busy, then queue and cancel a second job
+        first = worker.submit(release.wait)
+        second = worker.submit(func)
+        assert second.cancel()
+        release.set()
+        first.result(timeout=1)
+
+        # The next job still runs
+        assert worker.submit(lambda: "ok").result(timeout=1) == "ok"
+        func.assert_not_called()
+        worker.retire()
+
+
+class TestSupervisedCameraService:
+    """Tests for the SupervisedCameraService."""
+
+    def test_get_rtsp_uri(self):
+        """Test that URI construction is delegated."""
+        # Setup mock
+        camera_service = MagicMock()
+        camera_service.get_rtsp_uri.return_value = "rtsp://test"
+        credentials = CameraCredentials(username="user", password="pass", ip_address="10.0.0.1")
+
+        # Create service
+        service = SupervisedCameraService(camera_service, workers=1, capture_timeout=1)
+
+        assert service.get_rtsp_uri(credentials) == "rtsp://test"
+        camera_service.get_rtsp_uri.assert_called_once_with(credentials)
+
+    def test_capture_frame_success(self):
+        """Test that a capture runs on a worker thread and the worker is reused."""
+        # Setup mock
+        camera_service = MagicMock()
+        threads = []
+
+        def capture(rtsp_uri):
+            threads.append(threading.current_thread().name)
+            return np.zeros((4, 4, 3), dtype=np.uint8)
+
+        camera_service.capture_frame.side_effect = capture
+
+        # Create service
+        service = SupervisedCameraService(camera_service, workers=2, capture_timeout=1)
+
+        # Capture twice
+        assert service.capture_frame("rtsp://test").shape == (4, 4, 3)
+        assert service.capture_frame("rtsp://test").shape == (4, 4, 3)
+
+        # Assertions
+        assert threads == ["capture-worker-1", "capture-worker-1"]
+        assert [worker["state"] for worker in service.snapshot()] == ["idle"]
+
+    def test_capture_frame_propagates_errors(self):
+        """Test that capture errors reach the caller and free the worker."""
+        # Setup mock
+        camera_service = MagicMock()
+        camera_service.capture_frame.side_effect = FrameCaptureError("Read failed")
+
+        # Create service
+        service = SupervisedCameraService(camera_service, workers=1, capture_timeout=1)
+
+        with pytest.raises(FrameCaptureError):
+            service.capture_frame("rtsp://test")
+
+        # The worker is back in the idle list
+        assert [worker["state"] for worker in service.snapshot()] == ["idle"]
+        assert service.respawned == 0
+
+    def test_capture_frame_timeout_respawns_worker(self):
+        """Test that a hung capture fails fast and the worker is replaced."""
+        # Setup mock that hangs until released
+        release = threading.Event()
+        camera_service = MagicMock()
+        camera_service.capture_frame.side_effect = lambda rtsp_uri: release.wait()
+
+        # Create service
+        service = SupervisedCameraService(camera_service, workers=1, capture_timeout=0.05)
+
+        with pytest.raises(CameraTimeoutError) as exc_info:
+            service.capture_frame("rtsp://test")
+
+        assert "timed out" in str(exc_info.value)
+        assert service.respawned == 1
+        states = sorted(worker["state"] for worker in service.snapshot())
+        assert states == ["idle", "stuck"]
+
+        # The replacement worker serves the next capture
+        camera_service.capture_frame.side_effect = lambda rtsp_uri: "frame"
+        assert service.capture_frame("rtsp://test") == "frame"
+
+        # Once the hung call returns the stuck worker exits
+        release.set()
+        for worker in list(service._stuck):
+            worker._thread.join(timeout=1)
+        assert [worker["state"] for worker in service.snapshot()] == ["idle"]
+
+    def test_capture_frame_no_worker_available(self):
+        """Test that callers do not queue past the budget when all workers are busy."""
+        # Setup mock that hangs until released
+        release = threading.Event()
+        started = threading.Event()
+        camera_service = MagicMock()
+
+        def capture(rtsp_uri):
+            started.set()
+            release.wait()
+            return "frame"
+
+        camera_service.capture_frame.side_effect = capture
+
+        # Create service and occupy its only worker
+        service = SupervisedCameraService(camera_service, workers=1, capture_timeout=5)
+        result = []
+        thread = threading.Thread(target=lambda: result.append(service.capture_frame("rtsp://a")))
+        thread.start()
+        started.wait(timeout=1)
+
+        service.capture_timeout = 0.05
+        with pytest.raises(CameraConnectionError) as exc_info:
+            service.capture_frame("rtsp://b")
+        assert "No capture worker available" in str(exc_info.value)
+
+        release.set()
+        thread.join(timeout=1)
+        assert result == ["frame"]
+
+    def test_capture_frame_sees_request_deadline(self):
+        """Test that the worker runs in the caller's context and honours its deadline."""
+        # Setup mock that reports the time left
+        camera_service = MagicMock()
+        camera_service.capture_frame.side_effect = lambda rtsp_uri: remaining()
+
+        # Create service
+        service = SupervisedCameraService(camera_service, workers=1, capture_timeout=30)
+
+        with deadline_scope(2):
+            left = service.capture_frame("rtsp://test")
+        assert 0 < left <= 2
+
+        # A passed deadline fails without using a worker
+        with deadline_scope(0):
+            with pytest.raises(CameraTimeoutError):
+                service.capture_frame("rtsp://test")
+        assert camera_service.capture_frame.call_count == 1
@@ -0,0 +1,97 @@
+"""
+Tests for the transition clips.
+
+This module contains tests for the ClipRecorder.
+"""
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from app.domain.models import GateStatus
+from app.services.monitoring.clips import CLIPS, ClipRecorder
+from app.services.monitoring.monitor import FrameAnalysis
+
+
+def analysis(second, status, previous, value=0, width=64, camera_id="front"):
+    """Create an analysis of a frame filled with one value."""
+    frame = np.full((width * 3 // 4, width, 3), value, dtype=np.uint8)
+    return FrameAnalysis(camera_id, 1700000000.0 + second, frame, status, previous, 1)
+
+
+def feed(recorder, statuses):
+    """Feed a sequence of statuses, one frame per second."""
+    previous = None
+    for second, status in enumerate(statuses):
+        recorder(analysis(second, status, previous, value=second * 10))
+        previous = status if status is not None else previous
+
+
+class TestClipRecorder:
+    """Tests for the ClipRecorder."""
+
+    def test_writes_jpeg_sequence_around_transition(self, tmp_path):
+        """Test that a transition writes its pre-roll, trigger and post-roll frames."""
+        recorder = ClipRecorder(str(tmp_path), "jpeg", pre_roll=2, post_roll=2, width=32, workers=1, max_pending=4)
+        closed, opened = GateStatus.CLOSED, GateStatus.OPEN
+
+        feed(recorder, [closed, closed, closed, closed, opened, opened, opened, opened])
+        recorder.shutdown()
+
+        clips = list((tmp_path / "front").iterdir())
+        assert [clip.name for clip in clips] == ["20231114T221324.000-open"]
+        frames = sorted(clips[0].iterdir())
+        assert [frame.name for frame in frames] == [f"frame-{index:04d}.jpg" for index in range(5)]
+        # Frames are downscaled and span seconds 2 to 6
+        first = cv2.imread(str(frames[0]))
+        assert first.shape == (24, 32, 3)
+        assert [int(cv2.imread(str(frame))[0, 0, 0]) for frame in frames] == pytest.approx(
+            [20, 30, 40, 50, 60], abs=2
+        )
+
+    def test_writes_mjpeg(self, tmp_path):
+        """Test that clips can be written as MJPEG video."""
+        recorder = ClipRecorder(str(tmp_path), "mjpeg", pre_roll=1, post_roll=1, width=64, workers=1, max_pending=4)
+
+        feed(recorder, [GateStatus.OPEN, GateStatus.CLOSED, GateStatus.CLOSED])
+        recorder.shutdown()
+
+        path = tmp_path / "front" / "20231114T221321.000-closed.avi"
+        capture = cv2.VideoCapture(str(path))
+        frames = 0
+        while capture.read()[0]:
+            frames += 1
+        capture.release()
+        assert frames == 3
+
+    def test_first_status_is_not_a_transition(self, tmp_path):
+        """Test that the first status seen and failed checks do not write clips."""
+        recorder = ClipRecorder(str(tmp_path), "jpeg", pre_roll=1, post_roll=0, width=64, workers=1, max_pending=4)
+
+        feed(recorder, [GateStatus.OPEN, None, GateStatus.OPEN])
+        recorder(FrameAnalysis("front", 0.0, None, None, GateStatus.OPEN, 1, "Unreachable"))
+        recorder.shutdown()
+
+        assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
+    def test_drops_clips_when_encoders_are_behind(self, tmp_path):
+        """Test that the listener never waits for a busy encoder."""
+        release = threading.Event()
+        recorder = ClipRecorder(str(tmp_path), "jpeg", pre_roll=0, post_roll=0, width=64, workers=1, max_pending=1)
+        dropped = CLIPS.labels("dropped").value
+
+        with patch.object(ClipRecorder, "_encode", side_effect=lambda clip: release.wait(1)):
+            feed(recorder, [GateStatus.OPEN, GateStatus.CLOSED, GateStatus.OPEN])
+            assert recorder.pending == 1
+            release.set()
+            recorder.shutdown()
+
+        assert CLIPS.labels("dropped").value == dropped + 1
+        assert recorder.pending == 0
+
+    def test_unknown_format(self, tmp_path):
+        """Test that an unsupported clip format is rejected."""
+        with pytest.raises(ValueError):
+            ClipRecorder(str(tmp_path), "gif")
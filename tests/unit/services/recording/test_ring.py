@@ -0,0 +1,107 @@
+"""
+Tests for the frame rings.
+
+This module contains tests for the FrameRing and FrameRecorder.
+"""
+import numpy as np
+import pytest
+
+from app.services.recording.ring import FrameRecorder, FrameRing
+
+
+def gray(value, width=8, height=4):
+    """Create a grayscale frame filled with one value."""
+    return np.full((height, width), value, dtype=np.uint8)
+
+
+class TestFrameRing:
+    """Tests for the FrameRing."""
+
+    def test_append_wraps_around(self, tmp_path):
+        """Test that the oldest frames are overwritten once the ring is full."""
+        ring = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=3)
+
+        for value in range(1, 6):
+            ring.append(gray(value), timestamp=100.0 + value)
+
+        slots = ring.between()
+        assert [int(ring.frame(slot)[0, 0]) for slot in slots] == [3, 4, 5]
+        assert list(ring.index[slots]) == [103.0, 104.0, 105.0]
+
+    def test_between_time_range(self, tmp_path):
+        """Test that a time range selects frames inclusively, oldest first."""
+        ring = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=5)
+        for value in range(1, 6):
+            ring.append(gray(value), timestamp=float(value))
+
+        assert [int(ring.frame(slot)[0, 0]) for slot in ring.between(2, 4)] == [2, 3, 4]
+        assert [int(ring.frame(slot)[0, 0]) for slot in ring.between(start=4)] == [4, 5]
+        assert len(ring.between(10, 20)) == 0
+
+    def test_colour_frames_are_converted(self, tmp_path):
+        """Test that colour frames of another size are stored as grayscale slots."""
+        ring = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=2)
+
+        ring.append(np.full((40, 80, 3), 200, dtype=np.uint8), timestamp=1.0)
+
+        frame = ring.frame(ring.between()[0])
+        assert frame.shape == (4, 8)
+        assert int(frame[0, 0]) == 200
+
+    def test_reopen_keeps_frames_and_position(self, tmp_path):
+        """Test that a ring survives being reopened and continues where it stopped."""
+        ring = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=3)
+        ring.append(gray(1), timestamp=1.0)
+        ring.append(gray(2), timestamp=2.0)
+        ring.flush()
+
+        reopened = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=3)
+        reopened.append(gray(3), timestamp=3.0)
+        reopened.append(gray(4), timestamp=4.0)
+
+        assert [int(reopened.frame(slot)[0, 0]) for slot in reopened.between()] == [2, 3, 4]
+
+    def test_readonly_views(self, tmp_path):
+        """Test that a read-only ring serves views of the mapped file."""
+        writer = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=2)
+        writer.append(gray(7), timestamp=1.0)
+        writer.flush()
+
+        reader = FrameRing(str(tmp_path), "10.0.0.1:554", readonly=True)
+        frame = reader.frame(reader.between()[0])
+
+        assert isinstance(frame, np.memmap)
+        assert not frame.flags.writeable
+        assert (reader.width, reader.height, reader.slots) == (8, 4, 2)
+
+    def test_readonly_missing(self, tmp_path):
+        """Test that reading a camera that was never recorded fails."""
+        with pytest.raises(FileNotFoundError):
+            FrameRing(str(tmp_path), "10.0.0.9:554", readonly=True)
+
+    def test_geometry_change_recreates(self, tmp_path):
+        """Test that a ring opened with a new geometry starts empty."""
+        ring = FrameRing(str(tmp_path), "10.0.0.1:554", width=8, height=4, slots=2)
+        ring.append(gray(1), timestamp=1.0)
+
+        resized = FrameRing(str(tmp_path), "10.0.0.1:554", width=16, height=8, slots=4)
+
+        assert len(resized.between()) == 0
+        assert resized.frames.shape == (4, 8, 16)
+
+
+class TestFrameRecorder:
+    """Tests for the FrameRecorder."""
+
+    def test_record_per_camera(self, tmp_path):
+        """Test that each camera gets its own ring file."""
+        recorder = FrameRecorder(str(tmp_path), width=8, height=4, slots=2)
+
+        recorder.record("10.0.0.1:554", gray(1))
+        recorder.record("[fe80::1]:554", gray(2))
+        recorder.flush()
+
+        assert recorder.ring("10.0.0.1:554") is recorder.ring("10.0.0.1:554")
+        assert sorted(path.name for path in tmp_path.glob("*.json")) == [
+            "10.0.0.1_554.json", "_fe80__1__554.json"
+        ]
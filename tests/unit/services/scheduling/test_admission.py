@@ -0,0 +1,294 @@
+"""
+Tests for admission control.
+
+This module contains tests for the AdmissionController.
+"""
+import threading
+import time
+
+import pytest
+
+from app.core.deadline import deadline_scope
+from app.core.exceptions import AdmissionRejectedError
+from app.services.scheduling.admission import AdmissionController, Priority
+from app.services.scheduling.fairness import ClientRateLimiter
+
+
+def unlimited(weights=None):
+    """Create a rate limiter that only carries client weights."""
+    return ClientRateLimiter(rate=0, burst=0, weights=weights or {})
+
+
+def wait_until(predicate, timeout=1.0):
+    """Poll until the predicate holds or the timeout expires."""
+    end = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > end:
+            raise AssertionError("Condition not reached")
+        time.sleep(0.001)
+
+
+class TestAdmissionController:
+    """Tests for the AdmissionController."""
+
+    def test_admit_within_limits(self):
+        """Test that checks within the limits run straight away."""
+        controller = AdmissionController(max_concurrency=2, max_queue=0, per_camera_limit=2)
+
+        with controller.admit("a"):
+            with controller.admit("b"):
+                assert controller.running == 2
+        assert controller.running == 0
+        assert controller.queue_depth() == 0
+
+    def test_queue_full_rejects(self):
+        """Test that a check is rejected with a retry hint once the queue is full."""
+        controller = AdmissionController(max_concurrency=1, max_queue=0, per_camera_limit=1)
+        controller.acquire("a")
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            controller.acquire("b")
+
+        assert exc_info.value.retry_after > 0
+        assert controller.queue_depth() == 0
+        controller.release("a")
+
+    def test_waiter_is_admitted_on_release(self):
+        """Test that a queued check runs once a slot frees up."""
+        controller = AdmissionController(max_concurrency=1, max_queue=1, per_camera_limit=1, queue_timeout=5)
+        controller.acquire("a")
+        admitted = threading.Event()
+
+        def waiter():
+            controller.acquire("b")
+            admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        wait_until(lambda: controller.queue_depth() == 1)
+        assert not admitted.is_set()
+
+        controller.release("a", duration=0.5)
+        thread.join(timeout=1)
+        assert admitted.is_set()
+        assert controller.running == 1
+        assert controller.average_duration < 1.0
+        controller.release("b")
+
+    def test_per_camera_limit(self):
+        """Test that a busy camera does not hold up checks for other cameras."""
+        controller = AdmissionController(max_concurrency=3, max_queue=2, per_camera_limit=1, queue_timeout=5)
+        controller.acquire("a")
+        order = []
+
+        def waiter(camera):
+            controller.acquire(camera)
+            order.append(camera)
+
+        blocked = threading.Thread(target=waiter, args=("a",))
+        blocked.start()
+        wait_until(lambda: controller.queue_depth() == 1)
+
+        # A check for another camera passes the blocked one
+        controller.acquire("b")
+        assert controller.queue_depth() == 1
+
+        controller.release("a")
+        blocked.join(timeout=1)
+        assert order == ["a"]
+        controller.release("a")
+        controller.release("b")
+
+    def test_queue_timeout(self):
+        """Test that a check gives up after the queue timeout or its deadline."""
+        controller = AdmissionController(max_concurrency=1, max_queue=5, per_camera_limit=1, queue_timeout=0.02)
+        controller.acquire("a")
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            controller.acquire("b")
+        assert "Timed out" in exc_info.value.message
+
+        controller.queue_timeout = 30
+        with deadline_scope(0.02):
+            with pytest.raises(AdmissionRejectedError):
+                controller.acquire("b")
+
+        assert controller.queue_depth() == 0
+        controller.release("a")
+
+    def test_rate_limited_client(self):
+        """Test that a client over its rate is rejected before queueing."""
+        limiter = ClientRateLimiter(rate=1, burst=1, weights={})
+        controller = AdmissionController(max_concurrency=5, max_queue=5, per_camera_limit=5, rate_limiter=limiter)
+
+        with controller.admit("a", "poller"):
+            pass
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            controller.acquire("a", "poller")
+        assert "rate limit" in exc_info.value.message
+
+        # Other clients are not affected
+        with controller.admit("a", "dashboard"):
+            pass
+
+    def test_weighted_fair_order(self):
+        """Test that waiting checks are admitted in weighted-fair order."""
+        controller = AdmissionController(
+            max_concurrency=1, max_queue=10, per_camera_limit=10, queue_timeout=5,
+            rate_limiter=unlimited({"dashboard": 2})
+        )
+        controller.acquire("cam", "warmup")
+        order = []
+        threads = []
+
+        def waiter(client):
+            controller.acquire("cam", client)
+            order.append(client)
+            controller.release("cam")
+
+        # The poller queues four checks before the dashboard queues two
+        for client in ["poller"] * 4 + ["dashboard"] * 2:
+            thread = threading.Thread(target=waiter, args=(client,))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda n=len(threads): controller.queue_depth() == n)
+
+        controller.release("cam")
+        for thread in threads:
+            thread.join(timeout=1)
+
+        # The dashboard does not wait behind all of the poller's checks
+        assert order == ["dashboard", "poller", "dashboard", "poller", "poller", "poller"]
+
+    def test_full_queue_drops_heaviest_client(self):
+        """Test that a full queue drops a check of the client queueing the most."""
+        controller = AdmissionController(
+            max_concurrency=1, max_queue=2, per_camera_limit=1, queue_timeout=5,
+            rate_limiter=unlimited()
+        )
+        controller.acquire("cam", "warmup")
+        outcomes = {}
+
+        def waiter(name, client):
+            try:
+                controller.acquire("cam", client)
+            except AdmissionRejectedError:
+                outcomes[name] = "rejected"
+                return
+            outcomes[name] = "admitted"
+            controller.release("cam")
+
+        threads = []
+        for name in ("poller-1", "poller-2"):
+            threads.append(threading.Thread(target=waiter, args=(name, "poller")))
+            threads[-1].start()
+            wait_until(lambda n=len(threads): controller.queue_depth() == n)
+
+        # The queue is full, but the poller's newest check makes room
+        threads.append(threading.Thread(target=waiter, args=("dashboard-1", "dashboard")))
+        threads[-1].start()
+        wait_until(lambda: outcomes.get("poller-2") == "rejected")
+
+        # A second poller check is now rejected itself
+        with pytest.raises(AdmissionRejectedError):
+            controller.acquire("cam", "poller")
+
+        controller.release("cam")
+        for thread in threads:
+            thread.join(timeout=1)
+        assert outcomes == {"poller-1": "admitted", "poller-2": "rejected", "dashboard-1": "admitted"}
+
+    def test_interactive_reserved_capacity(self):
+        """Test that background checks cannot take the slots reserved for interactive checks."""
+        controller = AdmissionController(
+            max_concurrency=2, max_queue=5, per_camera_limit=5, queue_timeout=0.02,
+            rate_limiter=unlimited(), interactive_reserved=1
+        )
+        controller.acquire("cam", "poller", Priority.MONITORING)
+
+        # The second slot is reserved, so a batch check waits and times out
+        with pytest.raises(AdmissionRejectedError):
+            controller.acquire("cam", "calibration", Priority.BATCH)
+
+        # An interactive check still gets the reserved slot
+        controller.acquire("cam", "dashboard", Priority.INTERACTIVE)
+        assert controller.running == 2
+        controller.release("cam")
+        controller.release("cam")
+
+    def test_reserve_leaves_one_slot(self):
+        """Test that the reservation never shuts out every other class."""
+        controller = AdmissionController(
+            max_concurrency=1, max_queue=0, per_camera_limit=1, interactive_reserved=5
+        )
+
+        assert controller.interactive_reserved == 0
+        with controller.admit("cam", priority=Priority.BATCH):
+            assert controller.running == 1
+
+    def test_interactive_served_first(self):
+        """Test that queued interactive checks go ahead of earlier background checks."""
+        controller = AdmissionController(
+            max_concurrency=1, max_queue=10, per_camera_limit=10, queue_timeout=5,
+            rate_limiter=unlimited(), interactive_reserved=0
+        )
+        controller.acquire("cam", "warmup")
+        order = []
+        threads = []
+
+        def waiter(client, priority):
+            controller.acquire("cam", client, priority)
+            order.append(priority)
+            controller.release("cam")
+
+        queued = [Priority.BATCH, Priority.MONITORING, Priority.INTERACTIVE, Priority.BATCH]
+        for priority in queued:
+            thread = threading.Thread(target=waiter, args=(priority.value, priority))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda n=len(threads): controller.queue_depth() == n)
+        assert controller.queue_depth(Priority.BATCH) == 2
+
+        controller.release("cam")
+        for thread in threads:
+            thread.join(timeout=1)
+
+        assert order == [Priority.INTERACTIVE, Priority.MONITORING, Priority.BATCH, Priority.BATCH]
+
+    def test_full_queue_drops_lowest_priority(self):
+        """Test that a full queue makes room for an interactive check by dropping background work."""
+        controller = AdmissionController(
+            max_concurrency=1, max_queue=2, per_camera_limit=1, queue_timeout=5,
+            rate_limiter=unlimited(), interactive_reserved=0
+        )
+        controller.acquire("cam", "warmup")
+        outcomes = {}
+
+        def waiter(name, priority):
+            try:
+                controller.acquire("cam", name, priority)
+            except AdmissionRejectedError:
+                outcomes[name] = "rejected"
+                return
+            outcomes[name] = "admitted"
+            controller.release("cam")
+
+        threads = []
+        for name, priority in (("monitor", Priority.MONITORING), ("calibration", Priority.BATCH)):
+            threads.append(threading.Thread(target=waiter, args=(name, priority)))
+            threads[-1].start()
+            wait_until(lambda n=len(threads): controller.queue_depth() == n)
+
+        # The batch check is dropped even though its client queues no more than others
+        threads.append(threading.Thread(target=waiter, args=("dashboard", Priority.INTERACTIVE)))
+        threads[-1].start()
+        wait_until(lambda: outcomes.get("calibration") == "rejected")
+
+        # A batch newcomer to the full queue is rejected itself
+        with pytest.raises(AdmissionRejectedError):
+            controller.acquire("cam", "calibration-2", Priority.BATCH)
+
+        controller.release("cam")
+        for thread in threads:
+            thread.join(timeout=1)
+        assert outcomes == {"monitor": "admitted", "calibration": "rejected", "dashboard": "admitted"}
@@ -0,0 +1,92 @@
+"""
+Tests for per-client rate limiting.
+
+This module contains tests for the token buckets and client weights.
+"""
+import pytest
+
+from app.services.scheduling import fairness
+from app.services.scheduling.fairness import ClientRateLimiter, TokenBucket, parse_weights
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket."""
+
+    def test_burst_then_refill(self):
+        """Test that a bucket allows its burst, then refills at its rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+        assert bucket.take() == (True, 0.0)
+        assert bucket.take() == (True, 0.0)
+        allowed, retry_after = bucket.take()
+        assert not allowed
+        assert retry_after == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert bucket.take()[0]
+
+    def test_zero_rate(self):
+        """Test that an empty bucket without refill never allows a call."""
+        bucket = TokenBucket(rate=0, burst=0, clock=FakeClock())
+        assert bucket.take() == (False, float("inf"))
+
+
+class TestParseWeights:
+    """Tests for parse_weights."""
+
+    def test_parse(self):
+        """Test parsing a weights string."""
+        assert parse_weights("") == {}
+        assert parse_weights(" dashboard = 3, poller=0.5 ,") == {"dashboard": 3.0, "poller": 0.5}
+
+    @pytest.mark.parametrize("value", ["dashboard", "=2", "poller=0", "poller=abc"])
+    def test_invalid(self, value):
+        """Test that malformed weights are rejected."""
+        with pytest.raises(ValueError):
+            parse_weights(value)
+
+
+class TestClientRateLimiter:
+    """Tests for the ClientRateLimiter."""
+
+    def test_buckets_per_client(self):
+        """Test that every client has its own bucket scaled by its weight."""
+        limiter = ClientRateLimiter(rate=1, burst=1, weights={"heavy": 2}, clock=FakeClock())
+
+        assert limiter.take("light")[0]
+        assert not limiter.take("light")[0]
+        assert limiter.take("heavy")[0]
+        assert limiter.take("heavy")[0]
+        assert not limiter.take("heavy")[0]
+        assert limiter.weight("heavy") == 2
+        assert limiter.weight("light") == 1
+
+    def test_disabled(self):
+        """Test that a rate of zero disables rate limiting."""
+        limiter = ClientRateLimiter(rate=0, burst=0, weights={})
+        assert all(limiter.take("client")[0] for _ in range(100))
+
+    def test_tracked_clients_are_bounded(self, monkeypatch):
+        """Test that the least recently seen clients are forgotten."""
+        monkeypatch.setattr(fairness, "MAX_TRACKED_CLIENTS", 2)
+        limiter = ClientRateLimiter(rate=1, burst=1, weights={}, clock=FakeClock())
+
+        limiter.take("a")
+        limiter.take("b")
+        limiter.take("a")
+        limiter.take("c")
+
+        # "b" was forgotten and starts with a full bucket again
+        assert limiter.take("b")[0]
+        assert not limiter.take("c")[0]
@@ -0,0 +1,137 @@
+"""
+Tests for the simulated camera service.
+
+This module contains tests for the SimulatedCameraService.
+"""
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.core.deadline import deadline_scope
+from app.core.exceptions import CameraConnectionError, CameraTimeoutError
+from app.domain.models import CameraCredentials
+from app.services.simulation.camera import SimulatedCameraService
+from app.services.simulation.scenarios import SCENARIOS, Scenario, ScenarioStep
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Get the current time."""
+        return self.now
+
+
+class TestSimulatedCameraService:
+    """Tests for the SimulatedCameraService."""
+
+    def test_get_rtsp_uri(self):
+        """Test that the URI follows the configured format."""
+        service = SimulatedCameraService()
+        credentials = CameraCredentials(username="user", password="pass", ip_address="10.0.0.1")
+
+        with patch.dict(os.environ, {"RTSP_FORMAT": "rtsp://{ip_address}:{port}/sim"}):
+            assert service.get_rtsp_uri(credentials) == "rtsp://10.0.0.1:554/sim"
+
+    def test_capture_frame_with_latency(self):
+        """Test that captures wait for latency within the jitter and return a read-only frame."""
+        sleep = MagicMock()
+        service = SimulatedCameraService(latency=0.2, jitter=0.05, seed=1, sleep=sleep)
+
+        frame = service.capture_frame("rtsp://test")
+
+        assert frame.shape == (480, 640, 3)
+        assert not frame.flags.writeable
+        delay = sleep.call_args[0][0]
+        assert 0.15 <= delay <= 0.25
+
+    def test_capture_frame_failures(self):
+        """Test that the failure rate is applied to captures."""
+        service = SimulatedCameraService(failure_rate=1.0, sleep=MagicMock())
+
+        with pytest.raises(CameraConnectionError):
+            service.capture_frame("rtsp://test")
+
+    def test_capture_frame_timeout(self):
+        """Test that a delay past the deadline times out after the time left."""
+        sleep = MagicMock()
+        service = SimulatedCameraService(latency=30, sleep=sleep)
+
+        with deadline_scope(0.5):
+            with pytest.raises(CameraTimeoutError):
+                service.capture_frame("rtsp://test")
+        assert 0 < sleep.call_args[0][0] <= 0.5
+
+    def test_seed_makes_runs_repeatable(self):
+        """Test that two cameras with the same seed draw the same delays."""
+        first, second = MagicMock(), MagicMock()
+        for sleep in (first, second):
+            service = SimulatedCameraService(latency=1, jitter=0.5, seed=3, sleep=sleep)
+            for _ in range(3):
+                service.capture_frame("rtsp://test")
+
+        assert first.call_args_list == second.call_args_list
+
+    def test_gate_cycle_scenario(self):
+        """Test that the served gate state follows the scenario steps."""
+        clock = FakeClock()
+        service = SimulatedCameraService(scenario=SCENARIOS["gate_cycle"], sleep=MagicMock(), clock=clock)
+
+        closed = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+        clock.now = 45
+        opened = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+        clock.now = 65
+        closed_again = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+
+        assert not np.array_equal(closed, opened)
+        assert closed_again is closed
+
+    def test_frozen_stream(self):
+        """Test that a frozen stream keeps serving each camera its last frame."""
+        clock = FakeClock()
+        service = SimulatedCameraService(scenario=SCENARIOS["frozen_stream"], sleep=MagicMock(), clock=clock)
+
+        closed = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+        clock.now = 25
+        frozen = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+        # A camera without an earlier frame gets the current one
+        fresh = service.capture_frame("rtsp://u:p@10.0.0.2:554/")
+        clock.now = 45
+        thawed = service.capture_frame("rtsp://u:p@10.0.0.1:554/")
+
+        assert frozen is closed
+        assert fresh is thawed
+        assert thawed is not closed
+
+    def test_scripted_timeouts(self):
+        """Test that scripted timeouts hang until the open timeout."""
+        sleep = MagicMock()
+        scenario = Scenario("hang", (ScenarioStep(duration=1, timeout_rate=1.0),))
+        service = SimulatedCameraService(scenario=scenario, sleep=sleep)
+
+        with patch.dict(os.environ, {"RTSP_OPEN_TIMEOUT_MS": "250"}):
+            with pytest.raises(CameraTimeoutError):
+                service.capture_frame("rtsp://test")
+        assert sleep.call_args[0][0] == pytest.approx(0.25)
+
+    def test_from_settings(self):
+        """Test that the scenario and resolution come from the environment."""
+        with patch.dict(os.environ, {
+            "SIMULATED_SCENARIO": "slow_connect", "SIMULATED_RESOLUTION": "720p", "SIMULATED_SEED": "5"
+        }):
+            service = SimulatedCameraService.from_settings()
+        assert service.scenario is SCENARIOS["slow_connect"]
+        assert (service.scene.width, service.scene.height) == (1280, 720)
+
+        with patch.dict(os.environ, {"SIMULATED_SCENARIO": "unknown"}):
+            with pytest.raises(ValueError):
+                SimulatedCameraService.from_settings()
+        with patch.dict(os.environ, {"SIMULATED_RESOLUTION": "8k"}):
+            with pytest.raises(ValueError):
+                SimulatedCameraService.from_settings()
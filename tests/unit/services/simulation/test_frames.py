@@ -0,0 +1,38 @@
+"""
+Tests for the synthetic gate frames.
+
+This module contains tests for the gate scene renderer.
+"""
+import numpy as np
+import pytest
+
+from app.domain.models import GateStatus
+from app.services.gate_detector.detector import OpenCVDetectionService
+from app.services.simulation.frames import RESOLUTIONS, GateScene, render_gate
+
+
+class TestRenderGate:
+    """Tests for render_gate."""
+
+    @pytest.mark.parametrize("resolution", ["480p", "720p"])
+    def test_shape(self, resolution):
+        """Test that frames are BGR images at the requested resolution."""
+        frame = render_gate(GateScene.at(resolution))
+
+        width, height = RESOLUTIONS[resolution]
+        assert frame.shape == (height, width, 3)
+        assert frame.dtype == np.uint8
+
+    def test_deterministic(self):
+        """Test that the same scene always gives the same frame, and the seed changes the noise."""
+        scene = GateScene(noise=10, blur=3, seed=7)
+
+        assert np.array_equal(render_gate(scene), render_gate(scene))
+        assert not np.array_equal(render_gate(scene), render_gate(GateScene(noise=10, blur=3, seed=8)))
+
+    @pytest.mark.parametrize("closed, expected", [(True, GateStatus.CLOSED), (False, GateStatus.OPEN)])
+    def test_detected_status(self, closed, expected):
+        """Test that the detector reads the drawn gate state."""
+        frame = render_gate(GateScene(closed=closed, noise=5, blur=3))
+
+        assert OpenCVDetectionService().detect_gate_status(frame) == expected
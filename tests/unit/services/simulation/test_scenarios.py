@@ -0,0 +1,35 @@
+"""
+Tests for the camera scenarios.
+
+This module contains tests for scripted scenario playback.
+"""
+from app.services.simulation.scenarios import SCENARIOS, Scenario, ScenarioStep
+
+
+class TestScenario:
+    """Tests for the Scenario."""
+
+    def test_step_at_cycles(self):
+        """Test that steps play in order and the cycle repeats."""
+        first = ScenarioStep(duration=10, closed=True)
+        second = ScenarioStep(duration=5, closed=False)
+        scenario = Scenario("test", (first, second))
+
+        assert scenario.period == 15
+        assert scenario.step_at(0) is first
+        assert scenario.step_at(9.9) is first
+        assert scenario.step_at(10) is second
+        assert scenario.step_at(16) is first
+
+    def test_constant(self):
+        """Test a scenario that behaves the same all the time."""
+        scenario = Scenario.constant(latency=0.2, jitter=0.1, failure_rate=0.5, closed=False)
+
+        step = scenario.step_at(1000)
+        assert (step.latency, step.jitter, step.failure_rate, step.closed) == (0.2, 0.1, 0.5, False)
+
+    def test_builtin_scenarios(self):
+        """Test that every built-in scenario is named after its key and has a period."""
+        for name, scenario in SCENARIOS.items():
+            assert scenario.name == name
+            assert scenario.period > 0